@@ -3,19 +3,23 @@
 - 프롬프트 연계 특허 데이터 샘플.txt 사용
 """
 
-import cohere
 import os
+import sys
 import time
 from datetime import datetime
 
+# 공용 LLM 클라이언트 레지스트리 (../google-patents-bq-test/llm_clients.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "google-patents-bq-test"))
+from llm_clients import get_llm_client, warm_up_llm_clients
+
 # 1) API 키 불러오기
 API_KEY = os.environ.get("CO_API_KEY", "YOUR_API_KEY_HERE")
 
 if API_KEY == "YOUR_API_KEY_HERE" or not API_KEY:
     raise RuntimeError("CO_API_KEY 환경변수를 먼저 설정해 주세요!")
 
-# 2) 클라이언트 생성 (v2)
-co = cohere.ClientV2(API_KEY)
+# 2) 클라이언트 (v2, 커넥션 풀을 공유하는 프로세스 전역 클라이언트)
+co = get_llm_client("cohere")
 
 # 3) 실행 시각
 now_str = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -273,6 +277,10 @@ if __name__ == "__main__":
         print(f"파일을 찾을 수 없습니다: {patent_file}")
         exit(1)
 
+    # 커넥션을 미리 열어 둬서 첫 모델의 응답 시간에 TLS 연결 비용이 섞이지 않게 한다
+    warm_up = warm_up_llm_clients(["cohere"])["cohere"]
+    print(f"클라이언트 warm-up: {f'{warm_up:.2f}초' if isinstance(warm_up, float) else warm_up}")
+
     # 테스트할 모델 목록
     models = [
         "command-r7b-12-2024",
@@ -5,18 +5,22 @@
 # - 프롬프트에서 문서 참조 방식 테스트
 
 import os
+import sys
 import time
 import tempfile
-from google import genai
 from google.genai import types
 
+# 공용 LLM 클라이언트 레지스트리 (../google-patents-bq-test/llm_clients.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "google-patents-bq-test"))
+from llm_clients import get_llm_client
+
 # API 키 설정
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 
 
 def create_client():
-    """Gemini API 클라이언트 생성"""
-    return genai.Client(api_key=GEMINI_API_KEY)
+    """Gemini API 클라이언트 (커넥션 풀을 공유하는 프로세스 전역 클라이언트)"""
+    return get_llm_client("gemini")
 
 
 def create_file_search_store(client, store_name: str = "test-store"):
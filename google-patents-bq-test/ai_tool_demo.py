@@ -1,38 +1,107 @@
 # 파일: ai_tool_demo.py
 
+import argparse
+import asyncio
 import os
+import time
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-import requests
-from openai import OpenAI
-import google.generativeai as genai
-import anthropic
+from llm_clients import aclose_llm_clients, awarm_up_llm_clients, get_llm_client
+from patent_prompt import SYSTEM_PROMPT, build_user_prompt, patent_text, question_text, render_context
+from prompt_caching import cache_usage, claude_request, is_cacheable, openai_cache_args
+from patent_tool_client import TRANSPORTS, PATENT_TOOL_TRANSPORT, configure_patent_tool, get_patent_tool
 
 
 # 1) 우리가 만든 FastAPI 툴 (BigQuery 프록시)를 직접 호출하는 함수
 def search_patents_tool(
     keyword: str,
     limit: int = 5,
-    countries: str | None = None
+    countries: str | None = None,
+    fields: str | None = None,
+    langs: str | None = None,
 ) -> List[Dict[str, Any]]:
     """
     FastAPI의 /patents/search 엔드포인트를 호출해서
     Google Patents 검색 결과를 가져온다.
+    (공유 세션으로 커넥션 재사용. PATENT_TOOL_TRANSPORT=asgi/direct 면 네트워크 없이 같은 프로세스에서 호출)
 
     Args:
         keyword: 검색 키워드
         limit: 검색 결과 수 제한
         countries: 국가 코드 (쉼표 구분, 예: "US,KR")
+        fields: 결과 필드 (쉼표 구분, 예: "publication_number,publication_date,title_localized").
+                None이면 전체 필드.
+        langs: 선호 언어 순서 (쉼표 구분, 예: "ko,en"). 지정하면 해당 언어만 받고,
+               결과의 title / abstract 에 선호 순서대로 고른 텍스트가 들어온다.
     """
-    url = "http://localhost:8000/patents/search"
-    params = {"keyword": keyword, "limit": limit}
-    if countries:
-        params["countries"] = countries
-    resp = requests.get(url, params=params, timeout=30)
+    return get_patent_tool().search(keyword, limit, countries, fields, langs)
 
-    resp.raise_for_status()
-    return resp.json()
+
+async def search_patents_tool_async(
+    keyword: str,
+    limit: int = 5,
+    countries: str | None = None,
+    fields: str | None = None,
+    langs: str | None = None,
+) -> List[Dict[str, Any]]:
+    """search_patents_tool() 의 비동기 버전 (에이전트 루프 등 이벤트 루프 안에서 호출)"""
+    return await get_patent_tool().asearch(keyword, limit, countries, fields, langs)
+
+
+def search_patents_batch_tool(
+    searches: List[Dict[str, Any]],
+    fields: str | None = None,
+    langs: str | None = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    FastAPI의 POST /patents/search/batch 엔드포인트를 호출해서
+    여러 검색 조건을 HTTP 요청 1번, BigQuery 잡 1개로 처리한다.
+
+    Args:
+        searches: 검색 조건 리스트.
+                  예: [{"keyword": "graphite,흑연", "countries": "US", "limit": 6}, ...]
+        fields: 결과 필드 (쉼표 구분, 모든 조건 공통). None이면 전체 필드.
+        langs: 선호 언어 순서 (쉼표 구분, 예: "ko,en"). search_patents_tool 과 같다.
+
+    Returns:
+        searches 와 같은 순서의 조건별 특허 리스트
+    """
+    return get_patent_tool().search_batch(searches, fields, langs)
+
+
+async def search_patents_batch_tool_async(
+    searches: List[Dict[str, Any]],
+    fields: str | None = None,
+    langs: str | None = None,
+) -> List[List[Dict[str, Any]]]:
+    """search_patents_batch_tool() 의 비동기 버전"""
+    return await get_patent_tool().asearch_batch(searches, fields, langs)
+
+
+GPT_MODEL = "gpt-5.1"  # User requested gpt-5.1
+GEMINI_MODEL = "gemini-2.5-pro"
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+
+
+def _gpt_input(question: str, patents: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": build_user_prompt(question, patents)},
+    ]
+
+
+def _gpt_cache_args(patents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return openai_cache_args(SYSTEM_PROMPT, render_context(patents))
+
+
+def _gemini_prompt(question: str, patents: List[Dict[str, Any]]) -> str:
+    return f"{SYSTEM_PROMPT}\n\n{build_user_prompt(question, patents)}"
+
+
+def _claude_request(question: str, patents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """system + [특허 블록(캐시 브레이크포인트), 질문]"""
+    return claude_request(CLAUDE_MODEL, SYSTEM_PROMPT, render_context(patents), question_text(question))
 
 
 # 2) GPT에게 "툴 결과를 넘겨서" 자연어 요약/정리 요청
@@ -42,38 +111,12 @@ def ask_gpt_about_patents(question: str, patents: List[Dict[str, Any]]) -> str:
     - /patents/search 툴 결과(patents) 를 함께 GPT에 넘겨서
       사람이 읽기 좋은 답변을 받는 함수
     """
-    client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-
-    # GPT가 읽기 쉬운 형태로 특허 리스트를 약간 정리해서 넘겨주자
-    # (그대로 JSON 넘겨도 되지만, 여기선 핵심 필드만 추려서 텍스트로 구성)
-    patents_text_lines = []
-    for p in patents:
-        title = p["title_localized"][0]["text"] if p["title_localized"] else ""
-        pub_date = p.get("publication_date")
-        pub_no = p.get("publication_number")
-        patents_text_lines.append(f"- {pub_no} ({pub_date}): {title}")
-
-    patents_block = "\n".join(patents_text_lines)
-
-    system_prompt = (
-        "너는 특허 분석을 도와주는 AI 어시스턴트야. "
-        "아래에 제공된 특허 검색 결과를 기반으로만 답변해야 해. "
-        "모르는 내용은 추측하지 말고, 결과 안에서 확인 가능한 내용만 정리해줘."
-    )
-
-    user_content = (
-        f"사용자 질문:\n{question}\n\n"
-        f"다음은 Google Patents에서 'graphite' 키워드로 검색한 결과 일부야:\n"
-        f"{patents_block}\n\n"
-        "위 내용을 바탕으로, 핵심 내용을 한국어로 정리해줘."
-    )
+    client = get_llm_client("openai")
 
     response = client.responses.create(
-        model="gpt-5.1",  # User requested gpt-5.1
-        input=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content},
-        ],
+        model=GPT_MODEL,
+        input=_gpt_input(question, patents),
+        **_gpt_cache_args(patents),
     )
 
     # responses.create() 결과에서 텍스트만 추출
@@ -82,85 +125,229 @@ def ask_gpt_about_patents(question: str, patents: List[Dict[str, Any]]) -> str:
     return output_text
 
 
+async def ask_gpt_about_patents_async(
+    question: str, patents: List[Dict[str, Any]]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    ask_gpt_about_patents() 의 비동기 버전 (취소하면 HTTP 요청도 같이 끊긴다).
+    (답변, 캐시 토큰 통계) 를 돌려준다.
+    """
+    client = get_llm_client("openai", use_async=True)
+
+    response = await client.responses.create(
+        model=GPT_MODEL,
+        input=_gpt_input(question, patents),
+        **_gpt_cache_args(patents),
+    )
+    return response.output[0].content[0].text, cache_usage("openai", response)
+
+
 # 3) Gemini에게 특허 요약 요청
 def ask_gemini_about_patents(question: str, patents: List[Dict[str, Any]]) -> str:
     """
     Gemini API를 사용해서 특허 검색 결과를 요약/분석
     """
-    genai.configure(api_key=os.environ.get("GEMINI_API_KEY"))
+    client = get_llm_client("gemini")
 
-    patents_text_lines = []
-    for p in patents:
-        title = p["title_localized"][0]["text"] if p["title_localized"] else ""
-        pub_date = p.get("publication_date")
-        pub_no = p.get("publication_number")
-        patents_text_lines.append(f"- {pub_no} ({pub_date}): {title}")
-
-    patents_block = "\n".join(patents_text_lines)
-
-    prompt = (
-        "너는 특허 분석을 도와주는 AI 어시스턴트야. "
-        "아래에 제공된 특허 검색 결과를 기반으로만 답변해야 해. "
-        "모르는 내용은 추측하지 말고, 결과 안에서 확인 가능한 내용만 정리해줘.\n\n"
-        f"사용자 질문:\n{question}\n\n"
-        f"다음은 Google Patents에서 검색한 결과 일부야:\n"
-        f"{patents_block}\n\n"
-        "위 내용을 바탕으로, 핵심 내용을 한국어로 정리해줘."
+    response = client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=_gemini_prompt(question, patents),
     )
 
-    model = genai.GenerativeModel("gemini-2.5-pro")
-    response = model.generate_content(prompt)
-
     return response.text
 
 
+async def ask_gemini_about_patents_async(
+    question: str, patents: List[Dict[str, Any]]
+) -> Tuple[str, Dict[str, Any]]:
+    """ask_gemini_about_patents() 의 비동기 버전. (답변, 캐시 토큰 통계)"""
+    client = get_llm_client("gemini", use_async=True)
+
+    response = await client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=_gemini_prompt(question, patents),
+    )
+
+    return response.text, cache_usage("gemini", response)
+
+
 # 4) Claude에게 특허 요약 요청
 def ask_claude_about_patents(question: str, patents: List[Dict[str, Any]]) -> str:
     """
     Claude API를 사용해서 특허 검색 결과를 요약/분석
     """
-    client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+    client = get_llm_client("anthropic")
 
-    patents_text_lines = []
-    for p in patents:
-        title = p["title_localized"][0]["text"] if p["title_localized"] else ""
-        pub_date = p.get("publication_date")
-        pub_no = p.get("publication_number")
-        patents_text_lines.append(f"- {pub_no} ({pub_date}): {title}")
+    response = client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=1024,
+        **_claude_request(question, patents),
+    )
 
-    patents_block = "\n".join(patents_text_lines)
+    return response.content[0].text
 
-    system_prompt = (
-        "너는 특허 분석을 도와주는 AI 어시스턴트야. "
-        "아래에 제공된 특허 검색 결과를 기반으로만 답변해야 해. "
-        "모르는 내용은 추측하지 말고, 결과 안에서 확인 가능한 내용만 정리해줘."
-    )
 
-    user_content = (
-        f"사용자 질문:\n{question}\n\n"
-        f"다음은 Google Patents에서 검색한 결과 일부야:\n"
-        f"{patents_block}\n\n"
-        "위 내용을 바탕으로, 핵심 내용을 한국어로 정리해줘."
-    )
+async def ask_claude_about_patents_async(
+    question: str, patents: List[Dict[str, Any]]
+) -> Tuple[str, Dict[str, Any]]:
+    """ask_claude_about_patents() 의 비동기 버전. (답변, 캐시 토큰 통계)"""
+    client = get_llm_client("anthropic", use_async=True)
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
+    response = await client.messages.create(
+        model=CLAUDE_MODEL,
         max_tokens=1024,
-        system=system_prompt,
-        messages=[
-            {"role": "user", "content": user_content}
-        ],
+        **_claude_request(question, patents),
     )
+    return response.content[0].text, cache_usage("anthropic", response)
 
-    return response.content[0].text
+
+# 여러 모델에 같은 질문을 동시에 보내기 (fan-out)
+# 모델별 비동기 호출 함수 (보고서/콘솔에 쓰는 이름 -> 함수, (답변, 캐시 토큰 통계) 반환)
+PROVIDERS = {
+    "GPT": ask_gpt_about_patents_async,
+    "Gemini": ask_gemini_about_patents_async,
+    "Claude": ask_claude_about_patents_async,
+}
+
+# 모델 이름 -> llm_clients 제공사 이름 (warm-up / 프롬프트 캐시 대상)
+PROVIDER_CLIENTS = {"GPT": "openai", "Gemini": "gemini", "Claude": "anthropic"}
+
+PROVIDER_MODELS = {"GPT": GPT_MODEL, "Gemini": GEMINI_MODEL, "Claude": CLAUDE_MODEL}
+
+# 모델 1개 호출 제한 시간 (초)
+DEFAULT_PROVIDER_TIMEOUT_SEC = float(os.environ.get("LLM_PROVIDER_TIMEOUT_SEC", "120"))
+
+FANOUT_MODES = ("all", "first")
+
+
+async def _call_provider(
+    name: str,
+    ask,
+    question: str,
+    patents: List[Dict[str, Any]],
+    timeout: float,
+    results: Dict[str, Dict[str, Any]],
+) -> str:
+    """
+    모델 1개 호출 + 결과/지연 시간 기록.
+    제한 시간을 넘기거나 취소되면(first 모드에서 다른 모델이 먼저 끝난 경우) 그 상태로 기록한다.
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"status": "ok", "text": None, "error": None, "usage": None}
+    results[name] = result
+    try:
+        result["text"], result["usage"] = await asyncio.wait_for(ask(question, patents), timeout)
+        return result["text"]
+    except asyncio.TimeoutError:
+        result.update(status="timeout", error=f"{timeout:g}초 안에 응답이 없습니다")
+        raise
+    except asyncio.CancelledError:
+        result["status"] = "cancelled"
+        raise
+    except Exception as e:
+        result.update(status="error", error=str(e))
+        raise
+    finally:
+        result["latency_sec"] = time.perf_counter() - start
+
+
+async def ask_all_providers(
+    question: str,
+    patents: List[Dict[str, Any]],
+    providers: List[str] | None = None,
+    mode: str = "all",
+    timeouts: Dict[str, float] | None = None,
+) -> Dict[str, Any]:
+    """
+    여러 모델에 같은 질문을 동시에 보낸다.
+
+    Args:
+        providers: 호출할 모델 이름 (PROVIDERS 의 키). None이면 전체.
+        mode: "all" 이면 모든 모델의 답을 기다리고,
+              "first" 면 처음 성공한 답이 오면 나머지 호출을 취소한다.
+        timeouts: 모델별 제한 시간 (초). 없는 모델은 DEFAULT_PROVIDER_TIMEOUT_SEC.
+
+    Returns:
+        mode, first (처음 성공한 모델 이름), wall_sec (전체 경과 시간),
+        summed_sec (모델별 지연 시간 합 = 순서대로 호출했을 때의 예상 시간),
+        results: {모델 이름: {status, text, error, usage, latency_sec}} (status: ok / error / timeout / cancelled)
+    """
+    if mode not in FANOUT_MODES:
+        raise ValueError(f"지원하지 않는 mode: {mode} (사용 가능: {', '.join(FANOUT_MODES)})")
+
+    names = providers or list(PROVIDERS)
+    timeouts = timeouts or {}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    start = time.perf_counter()
+    tasks = {
+        asyncio.create_task(
+            _call_provider(
+                name, PROVIDERS[name], question, patents,
+                timeouts.get(name, DEFAULT_PROVIDER_TIMEOUT_SEC), results,
+            )
+        ): name
+        for name in names
+    }
+
+    first = None
+    if mode == "all":
+        await asyncio.gather(*tasks, return_exceptions=True)
+    else:
+        pending = set(tasks)
+        while pending and first is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            first = next((tasks[t] for t in done if not t.cancelled() and t.exception() is None), None)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if mode == "all":
+        ok = [name for name in names if results[name]["status"] == "ok"]
+        first = min(ok, key=lambda name: results[name]["latency_sec"]) if ok else None
+
+    return {
+        "mode": mode,
+        "first": first,
+        "wall_sec": time.perf_counter() - start,
+        "summed_sec": sum(r["latency_sec"] for r in results.values()),
+        "results": {name: results[name] for name in names},
+    }
+
+
+async def run_fanout(
+    question: str,
+    patents: List[Dict[str, Any]],
+    providers: List[str] | None = None,
+    mode: str = "all",
+    timeouts: Dict[str, float] | None = None,
+    warm_up: bool = True,
+) -> Dict[str, Any]:
+    """
+    asyncio.run() 으로 실행하는 진입점.
+    공유 async 클라이언트 warm-up -> ask_all_providers() -> 클라이언트 정리
+    (async 클라이언트 커넥션은 이벤트 루프에 묶이므로 같은 루프 안에서 닫는다).
+    warm-up 결과는 "warm_up" 키에 {모델 이름: 소요 시간(초) 또는 실패 메시지} 로 들어간다.
+    """
+    names = providers or list(PROVIDERS)
+    try:
+        warm = {}
+        if warm_up:
+            by_client = await awarm_up_llm_clients([PROVIDER_CLIENTS[name] for name in names])
+            warm = {name: by_client[PROVIDER_CLIENTS[name]] for name in names}
+        fanout = await ask_all_providers(question, patents, names, mode, timeouts)
+        fanout["warm_up"] = warm
+        return fanout
+    finally:
+        await aclose_llm_clients()
 
 
 # 5) 특허 정보를 마크다운으로 포맷팅하는 함수
 def format_patent_markdown(p: Dict[str, Any]) -> str:
     """특허 정보를 마크다운 형식으로 포맷팅"""
     lines = []
-    title = p["title_localized"][0]["text"] if p.get("title_localized") else ""
-    abstract = p["abstract_localized"][0]["text"] if p.get("abstract_localized") else ""
+    title = patent_text(p, "title")
+    abstract = patent_text(p, "abstract")
     assignees = ", ".join([a["name"] for a in p.get("assignee", []) if a.get("name")])
     inventors = ", ".join([inv["name"] for inv in p.get("inventor", []) if inv.get("name")])
     cpc_codes = ", ".join(p.get("cpc", [])[:5])  # 최대 5개만
@@ -184,7 +371,7 @@ def format_patent_markdown(p: Dict[str, Any]) -> str:
 def pretty_print_patents(patents: List[Dict[str, Any]]) -> None:
     print("=== 특허 검색 결과 요약 (raw) ===")
     for i, p in enumerate(patents, start=1):
-        title = p["title_localized"][0]["text"] if p.get("title_localized") else ""
+        title = patent_text(p, "title")
         pub_date = p.get("publication_date")
         assignees = ", ".join([a["name"] for a in p.get("assignee", []) if a.get("name")])
         print(f"{i}. [{p['publication_number']}] ({pub_date})")
@@ -194,14 +381,28 @@ def pretty_print_patents(patents: List[Dict[str, Any]]) -> None:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="특허 검색 결과를 여러 LLM 에 동시에 요약 요청")
+    parser.add_argument("--mode", choices=FANOUT_MODES, default="all",
+                        help="all: 모든 모델 답을 기다림 / first: 처음 성공한 답만 받고 나머지 취소")
+    parser.add_argument("--providers", nargs="+", choices=list(PROVIDERS), help="호출할 모델 (기본값: 전체)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_PROVIDER_TIMEOUT_SEC, help="모델별 제한 시간 (초)")
+    parser.add_argument("--no-warm-up", action="store_true", help="호출 전 커넥션 warm-up 생략")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=PATENT_TOOL_TRANSPORT,
+                        help="특허 검색 호출 방식: http (실행 중인 서버) / asgi (같은 프로세스 app) / direct (검색 함수 직접 호출)")
+    args = parser.parse_args()
+    configure_patent_tool(args.transport)
+
     # 1) 로컬 FastAPI 툴 호출해서 graphite 관련 특허 (미국+한국) 가져오기
     # 영어 + 한국어 키워드를 쉼표로 구분해서 전달
     keyword = "graphite,흑연,그래파이트"
     countries = "US,KR"
 
-    # US 6건, KR 6건 각각 가져오기
-    us_patents = search_patents_tool(keyword=keyword, limit=6, countries="US")
-    kr_patents = search_patents_tool(keyword=keyword, limit=6, countries="KR")
+    # US 6건, KR 6건을 배치 검색 한 번으로 가져오기
+    # (제목/요약은 한국어 우선, 없으면 영어)
+    us_patents, kr_patents = search_patents_batch_tool([
+        {"keyword": keyword, "countries": "US", "limit": 6},
+        {"keyword": keyword, "countries": "KR", "limit": 6},
+    ], langs="ko,en")
     patents = us_patents + kr_patents
 
     question = "이 graphite 관련 특허들의 공통적인 기술 방향과 특징을 간단히 정리해줘."
@@ -213,6 +414,13 @@ if __name__ == "__main__":
     results.append(f"- **테스트 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     results.append(f"- **검색 키워드:** {keyword}")
     results.append(f"- **검색 국가:** {countries}")
+    results.append(f"- **검색 호출 방식:** {args.transport}")
+    # 모델에 넘길 특허 컨텍스트 블록 (한 번 만들고 세 모델이 같이 쓴다)
+    context = render_context(patents)
+    results.append(
+        f"- **LLM 컨텍스트:** {context.included}/{len(patents)}건 (요약 포함 {context.with_abstract}건), "
+        f"약 {context.tokens:,} 토큰{' (토큰 제한으로 줄임)' if context.truncated else ''}"
+    )
     results.append(f"- **조회 건수:** {len(patents)}건 (US {len(us_patents)}건 + KR {len(kr_patents)}건)")
     results.append("")
     results.append("---")
@@ -270,57 +478,74 @@ if __name__ == "__main__":
     results.append("---")
     results.append("")
 
-    # 3) GPT 요약
-    print("\n=== GPT 요약 결과 ===")
-    try:
-        gpt_answer = ask_gpt_about_patents(question, patents)
-        print(gpt_answer)
-        results.append("## GPT 요약 결과")
+    # 3) GPT / Gemini / Claude 에 동시에 요청 (all: 모두 기다림, first: 처음 성공한 답만)
+    # (공유 클라이언트로 커넥션을 먼저 열어 두고 시간을 재므로 응답 시간에 TLS 연결 비용이 섞이지 않는다)
+    fanout = asyncio.run(run_fanout(
+        question,
+        patents,
+        providers=args.providers,
+        mode=args.mode,
+        timeouts={name: args.timeout for name in PROVIDERS},
+        warm_up=not args.no_warm_up,
+    ))
+
+    for name, r in fanout["results"].items():
+        print(f"\n=== {name} 요약 결과 ({r['status']}, {r['latency_sec']:.1f}초) ===")
+        results.append(f"## {name} 요약 결과")
         results.append("")
-        results.append(gpt_answer)
+        if r["status"] == "ok":
+            print(r["text"])
+            results.append(r["text"])
+        elif r["status"] == "cancelled":
+            print(f"{fanout['first']} 가 먼저 응답해서 취소")
+            results.append(f"> 취소됨 ({fanout['first']} 가 먼저 응답)")
+        else:
+            print(f"{name} 호출 실패: {r['error']}")
+            results.append(f"> 호출 실패: {r['error']}")
         results.append("")
         results.append("---")
         results.append("")
-    except Exception as e:
-        print(f"GPT 호출 실패: {e}")
-        results.append(f"## GPT 요약 결과")
-        results.append("")
-        results.append(f"> 호출 실패: {e}")
-        results.append("")
 
-    # 4) Gemini 요약
-    print("\n=== Gemini 요약 결과 ===")
-    try:
-        gemini_answer = ask_gemini_about_patents(question, patents)
-        print(gemini_answer)
-        results.append("## Gemini 요약 결과")
-        results.append("")
-        results.append(gemini_answer)
-        results.append("")
-        results.append("---")
-        results.append("")
-    except Exception as e:
-        print(f"Gemini 호출 실패: {e}")
-        results.append(f"## Gemini 요약 결과")
-        results.append("")
-        results.append(f"> 호출 실패: {e}")
-        results.append("")
+    # 4) 모델별 응답 시간 (동시 호출 전체 시간 vs 순서대로 호출했을 때의 합)
+    results.append("## 모델별 응답 시간")
+    results.append("")
+    results.append(f"- **호출 방식:** 동시 호출 (mode={fanout['mode']}, 모델별 제한 시간 {args.timeout:g}초)")
+    results.append(f"- **처음 성공한 모델:** {fanout['first'] or '없음'}")
+    results.append(f"- **전체 경과 시간 (wall-clock):** {fanout['wall_sec']:.2f}초")
+    results.append(f"- **모델별 시간 합 (순서대로 호출 시):** {fanout['summed_sec']:.2f}초")
+    results.append("")
+    results.append("| 모델 | 상태 | 응답 시간 | warm-up |")
+    results.append("|------|------|-----------|---------|")
+    for name, r in fanout["results"].items():
+        warm = fanout["warm_up"].get(name)
+        warm_text = f"{warm:.2f}초" if isinstance(warm, float) else (warm or "생략")
+        results.append(f"| {name} | {r['status']} | {r['latency_sec']:.2f}초 | {warm_text} |")
+    results.append("")
+    print(
+        f"\n전체 {fanout['wall_sec']:.1f}초 (모델별 합 {fanout['summed_sec']:.1f}초, "
+        f"mode={fanout['mode']}, 처음 성공: {fanout['first'] or '없음'})"
+    )
 
-    # 5) Claude 요약
-    print("\n=== Claude 요약 결과 ===")
-    try:
-        claude_answer = ask_claude_about_patents(question, patents)
-        print(claude_answer)
-        results.append("## Claude 요약 결과")
-        results.append("")
-        results.append(claude_answer)
-        results.append("")
-    except Exception as e:
-        print(f"Claude 호출 실패: {e}")
-        results.append(f"## Claude 요약 결과")
-        results.append("")
-        results.append(f"> 호출 실패: {e}")
-        results.append("")
+    # 5) 프롬프트 캐시 (system + 특허 블록). 같은 블록으로 다시 물어보면 캐시 읽기로 입력 비용이 줄어든다
+    results.append("## 프롬프트 캐시")
+    results.append("")
+    results.append("| 모델 | 캐시 가능 (최소 토큰) | 입력 토큰 | 캐시 쓰기 | 캐시 읽기 | 입력 비용 (캐시 없을 때 대비) |")
+    results.append("|------|----------------------|-----------|-----------|-----------|-------------------------------|")
+    for name, r in fanout["results"].items():
+        cacheable = is_cacheable(PROVIDER_CLIENTS[name], PROVIDER_MODELS[name], SYSTEM_PROMPT, context)
+        usage = r["usage"]
+        if usage is None:
+            results.append(f"| {name} | {'O' if cacheable else 'X'} | - | - | - | - |")
+            continue
+        results.append(
+            f"| {name} | {'O' if cacheable else 'X'} | {usage['input_tokens']:,} | {usage['cache_write_tokens']:,} "
+            f"| {usage['cache_read_tokens']:,} | {usage['input_cost_ratio']:.0%} |"
+        )
+        print(
+            f"{name} 캐시: 쓰기 {usage['cache_write_tokens']:,} / 읽기 {usage['cache_read_tokens']:,} "
+            f"/ 입력 {usage['input_tokens']:,} 토큰 (입력 비용 {usage['input_cost_ratio']:.0%})"
+        )
+    results.append("")
 
     # 6) 결과를 md 파일로 저장
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
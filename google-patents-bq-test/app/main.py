@@ -1,18 +1,237 @@
 # 파일: app/main.py
 
-from typing import List, Dict, Any
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
 # 같은 폴더가 아니라 루트에 있으니까 이렇게 import
-from bigquery_patents_tool import sample_patents, search_patents_by_keyword
+from bigquery_async import (
+    JobLimitExceeded,
+    estimate_search_async,
+    job_limiter,
+    sample_patents_async,
+    search_patents_batch_async,
+    search_flight,
+    search_patents_async,
+    search_patents_page_async,
+    stream_search_patents_async,
+)
+from bigquery_client import close_client
+from keyword_synonyms import get_synonyms
+from metrics import registry, request_seconds, server_timing, span, trace
+from patent_cache import get_cache, cache_stats
+from patent_record import PatentRecordList
+from response_encoding import (
+    FastJSONResponse,
+    body_cache,
+    body_response,
+    dumps,
+    encoded_response,
+    negotiate_encoding,
+)
+from bigquery_patents_tool import MAX_BATCH_SPECS, search_filters, select_languages
+from query_budget import BytesBudgetExceeded, daily_budget, query_log
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 생명주기 관리.
+    BigQuery 클라이언트는 첫 요청 때 만들어지고, 서버 종료 시 정리된다.
+    """
+    yield
+    close_client()
 
 
 app = FastAPI(
     title="Patent BigQuery Proxy API",
     description="Google Patents Public Data를 BigQuery를 통해 조회하는 프록시 API",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+
+@app.middleware("http")
+async def record_timing(request: Request, call_next):
+    """
+    요청마다 단계별 span 을 모아 Server-Timing 헤더로 돌려주고,
+    요청 처리 시간을 /metrics 히스토그램에 기록한다.
+    """
+    start = time.perf_counter()
+    with trace() as spans:
+        response = await call_next(request)
+    elapsed = time.perf_counter() - start
+
+    route = request.scope.get("route")
+    path = getattr(route, "path", "unmatched")
+    request_seconds.observe(elapsed, method=request.method, path=path, status=response.status_code)
+
+    timing = server_timing(spans + [("total", elapsed)])
+    response.headers["Server-Timing"] = timing
+    return response
+
+
+registry.gauge(
+    "patent_bigquery_inflight_jobs", "실행 중인 BigQuery 잡 수",
+    lambda: job_limiter.stats()["in_flight"],
+)
+registry.gauge(
+    "patent_bigquery_rejected_total", "잡 한도로 거절(429)된 요청 수",
+    lambda: job_limiter.stats()["rejected"], kind="counter",
+)
+registry.gauge(
+    "patent_search_deduplicated_total", "single-flight 로 합쳐진 검색 요청 수",
+    lambda: search_flight.stats()["deduplicated"], kind="counter",
+)
+registry.gauge(
+    "patent_cache_hits_total", "검색 결과 캐시 hit 수",
+    lambda: cache_stats().get("hits", 0), kind="counter",
 )
+registry.gauge(
+    "patent_cache_misses_total", "검색 결과 캐시 miss 수",
+    lambda: cache_stats().get("misses", 0), kind="counter",
+)
+registry.gauge(
+    "patent_bigquery_daily_used_bytes", "오늘 과금된 BigQuery 바이트",
+    lambda: daily_budget.stats()["used_bytes"],
+)
+
+
+class LocalizedText(BaseModel):
+    """title_localized / abstract_localized 항목"""
+    text: str | None = None
+    language: str | None = None
+    truncated: str | None = None
+
+
+class Party(BaseModel):
+    """assignee / inventor 항목"""
+    name: str | None = None
+    country_code: str | None = None
+
+
+class Patent(BaseModel):
+    """
+    검색 결과 특허 1건 (응답 스키마 문서용).
+    fields 로 일부만 요청하면 나머지 필드는 응답에 없다.
+    """
+    publication_number: str
+    application_number: str | None = None
+    country_code: str | None = None
+    title_localized: List[LocalizedText] | None = None
+    abstract_localized: List[LocalizedText] | None = None
+    publication_date: str | None = None
+    filing_date: str | None = None
+    assignee: List[Party] | None = None
+    inventor: List[Party] | None = None
+    cpc: List[str] | None = None
+    title_by_lang: Dict[str, str] | None = None
+    abstract_by_lang: Dict[str, str] | None = None
+    title: str | None = Field(None, description="langs 지정 시 선호 순서대로 처음 있는 언어의 제목")
+    abstract: str | None = Field(None, description="langs 지정 시 선호 순서대로 처음 있는 언어의 요약")
+
+
+class SearchSpec(BaseModel):
+    """배치 검색의 검색 조건 하나 (GET /patents/search 파라미터와 같은 의미)"""
+    keyword: str = Field(..., min_length=1, description="검색 키워드 (쉼표 구분, 예: graphite,흑연)")
+    countries: str | None = Field(None, description="국가 코드 (쉼표 구분, 예: US,KR)")
+    limit: int = Field(20, ge=1, le=100)
+    publication_date_from: str | None = Field(None, description="공개일 시작 (YYYYMMDD 또는 YYYY-MM-DD)")
+    publication_date_to: str | None = Field(None, description="공개일 끝 (포함)")
+    filing_date_from: str | None = Field(None, description="출원일 시작 (YYYYMMDD 또는 YYYY-MM-DD)")
+    filing_date_to: str | None = Field(None, description="출원일 끝 (포함)")
+    cpc_prefix: str | None = Field(None, description="CPC 코드 접두어 (쉼표 구분, 예: H01M,C01B32)")
+
+
+class SynonymGroup(BaseModel):
+    """동의어 그룹 추가 요청"""
+    terms: List[str] = Field(..., min_length=2, description="같은 뜻의 단어들 (예: [\"graphite\", \"흑연\"])")
+
+
+class BatchSearchRequest(BaseModel):
+    """배치 검색 요청"""
+    searches: List[SearchSpec] = Field(..., min_length=1, max_length=MAX_BATCH_SPECS)
+    fields: str | None = Field(None, description="결과 필드 (쉼표 구분, 모든 조건 공통)")
+    cache: bool = True
+    max_bytes_billed: int | None = Field(None, ge=1)
+    langs: str | None = Field(None, description="선호 언어 순서 (쉼표 구분, 예: ko,en). 지정하면 해당 언어만 응답")
+
+
+def _split_csv(value: str | None, upper: bool = False) -> List[str] | None:
+    """쉼표로 구분된 쿼리 파라미터를 리스트로 변환 (빈 값이면 None)"""
+    if not value:
+        return None
+    items = [v.strip() for v in value.split(",") if v.strip()]
+    if upper:
+        items = [v.upper() for v in items]
+    return items or None
+
+
+def _json_response(request: Request, results, response: Response | None = None) -> FastJSONResponse:
+    """
+    검색 결과 -> 직렬화된 JSON 응답 (jsonable_encoder / 응답 모델 검증을 거치지 않음).
+    Accept-Encoding 에 따라 gzip/brotli 로 압축하고, 캐시된 compact 결과는
+    본문 캐시(body_cache)에 남아 있는 압축 bytes 를 그대로 보낸다.
+    """
+    headers = dict(response.headers) if response is not None else None
+    accept_encoding = request.headers.get("accept-encoding")
+    with span("serialize"):
+        if isinstance(results, PatentRecordList):
+            body, encoding = results.encode(negotiate_encoding(accept_encoding))
+            return body_response(body, encoding, headers=headers)
+        return encoded_response(dumps(results), accept_encoding, headers=headers)
+
+
+def _set_search_meta_headers(response: Response, meta: Dict[str, Any]) -> None:
+    """
+    검색 메타데이터를 응답 헤더로 전달 (응답 본문은 기존처럼 특허 리스트 유지)
+    """
+    response.headers["X-Backend"] = meta.get("backend", "bigquery")
+    response.headers["X-Cache"] = "HIT" if meta.get("cache_hit") else "MISS"
+    response.headers["X-Fields"] = ",".join(meta.get("fields", []))
+    if meta.get("total_bytes_processed") is not None:
+        response.headers["X-BQ-Bytes-Processed"] = str(meta["total_bytes_processed"])
+    if meta.get("total_bytes_billed") is not None:
+        response.headers["X-BQ-Bytes-Billed"] = str(meta["total_bytes_billed"])
+    if meta.get("all_fields_bytes_processed") is not None:
+        response.headers["X-BQ-Bytes-Processed-All-Fields"] = str(meta["all_fields_bytes_processed"])
+    if meta.get("slot_millis") is not None:
+        response.headers["X-BQ-Slot-Millis"] = str(meta["slot_millis"])
+    if meta.get("bq_cache_hit") is not None:
+        response.headers["X-BQ-Cache-Hit"] = "true" if meta["bq_cache_hit"] else "false"
+
+
+async def _ndjson_response(items: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    dict 를 yield 하는 async generator 를 NDJSON 스트리밍 응답으로 변환.
+    첫 항목을 미리 받아 두어서, 잡 제출 전 오류(400/403/429)는 일반 에러 응답으로 돌려준다.
+    """
+    try:
+        first = await items.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is not None:
+            yield dumps(first) + b"\n"
+        async for item in items:
+            yield dumps(item) + b"\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+async def _select_languages_stream(
+    items: AsyncIterator[Dict[str, Any]],
+    languages: List[str],
+) -> AsyncIterator[Dict[str, Any]]:
+    """스트리밍 결과에 select_languages 적용"""
+    async for item in items:
+        yield select_languages([item], languages)[0]
 
 
 @app.get("/health")
@@ -23,41 +242,296 @@ def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/patents/sample")
-def get_sample_patents(
-    limit: int = Query(10, ge=1, le=100)
-) -> List[Dict[str, Any]]:
+@app.get("/metrics")
+def get_metrics() -> PlainTextResponse:
+    """
+    Prometheus text exposition 형식 지표.
+    요청 처리 시간, 검색 단계별 소요 시간, BigQuery 잡 통계(스캔/과금 바이트, slot-ms, 캐시 hit),
+    잡 한도/캐시 상태
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/jobs/stats")
+def get_job_stats() -> Dict[str, Any]:
+    """
+    실행 중인 BigQuery 잡 수 / 한도 / 429로 거절된 요청 수,
+    동시 검색 합치기(single-flight)로 생략된 잡 수, 오늘 과금된 스캔 바이트,
+    최근 쿼리별 스캔/과금 바이트 (필터 포함)
+    """
+    return {
+        **job_limiter.stats(),
+        "coalescing": search_flight.stats(),
+        "budget": daily_budget.stats(),
+        "recent_queries": query_log.recent(),
+    }
+
+
+@app.get("/cache/stats")
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    검색 결과 캐시 통계 (hit/miss/eviction 카운터) + 직렬화 본문 캐시 통계
+    """
+    return {**cache_stats(), "body_cache": body_cache.stats()}
+
+
+@app.delete("/cache")
+def clear_cache() -> Dict[str, str]:
+    """
+    검색 결과 캐시 비우기
+    """
+    cache = get_cache()
+    if cache is not None:
+        cache.clear()
+    body_cache.clear()
+    return {"status": "cleared"}
+
+
+@app.get("/synonyms")
+def list_synonyms() -> List[List[str]]:
+    """
+    검색 키워드 확장에 쓰는 동의어 그룹 목록
+    """
+    return get_synonyms().groups()
+
+
+@app.post("/synonyms")
+def add_synonyms(group: SynonymGroup) -> Dict[str, Any]:
+    """
+    동의어 그룹 추가 (서버 실행 중에 바로 반영, 재시작하면 사전 파일 기준으로 돌아감).
+    이미 있는 단어가 포함되면 기존 그룹에 합쳐진다.
+    """
+    synonyms = get_synonyms()
+    synonyms.add(group.terms)
+    return {"status": "added", "expanded": synonyms.expand(group.terms[:1])}
+
+
+@app.get("/patents/sample", response_model=List[Patent])
+async def get_sample_patents(
+    request: Request,
+    limit: int = Query(10, ge=1, le=100),
+) -> FastJSONResponse:
     """
     샘플 특허 리스트 조회.
-    내부적으로 bigquery_patents_tool.sample_patents() 호출.
+    내부적으로 bigquery_async.sample_patents_async() 호출.
     """
     try:
-        return sample_patents(limit=limit)
+        return _json_response(request, await sample_patents_async(limit=limit))
+    except JobLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/patents/search")
-def search_patents(
+@app.get("/patents/search/estimate")
+async def estimate_search(
     keyword: str = Query(..., min_length=1, description="검색 키워드 (쉼표 구분으로 여러 개 가능, 예: graphite,흑연)"),
     limit: int = Query(20, ge=1, le=100),
     countries: str = Query(None, description="국가 코드 (쉼표 구분, 예: US,KR)"),
-) -> List[Dict[str, Any]]:
+    fields: str = Query(None, description="결과 필드 (쉼표 구분)"),
+    max_bytes_billed: int = Query(None, ge=1, description="쿼리 1건 최대 과금 바이트"),
+    expand: bool = Query(None, description="동의어/번역어 확장 여부 (/patents/search 와 같게 줘야 같은 조건으로 추정). 생략하면 서버 설정"),
+    publication_date_from: str = Query(None, description="공개일 시작 (YYYYMMDD 또는 YYYY-MM-DD)"),
+    publication_date_to: str = Query(None, description="공개일 끝 (포함)"),
+    filing_date_from: str = Query(None, description="출원일 시작 (YYYYMMDD 또는 YYYY-MM-DD)"),
+    filing_date_to: str = Query(None, description="출원일 끝 (포함)"),
+    cpc_prefix: str = Query(None, description="CPC 코드 접두어 (쉼표 구분, 예: H01M,C01B32)"),
+) -> Dict[str, Any]:
+    """
+    /patents/search 와 같은 조건의 예상 스캔 바이트/비용 조회 (dry run, 과금 없음).
+    within_limits 가 false 면 같은 조건의 검색은 한도 초과로 거절된다.
+    """
+    try:
+        filters = search_filters(
+            publication_date_from, publication_date_to,
+            filing_date_from, filing_date_to,
+            _split_csv(cpc_prefix, upper=True),
+        )
+        return await estimate_search_async(
+            keywords=_split_csv(keyword),
+            limit=limit,
+            country_codes=_split_csv(countries, upper=True),
+            fields=_split_csv(fields),
+            maximum_bytes_billed=max_bytes_billed,
+            filters=filters,
+            expand_synonyms=expand,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/patents/search/batch", response_model=List[List[Patent]])
+async def search_patents_batch(
+    http_request: Request,
+    request: BatchSearchRequest,
+    response: Response,
+) -> FastJSONResponse:
+    """
+    여러 검색 조건을 BigQuery 잡 하나(테이블 스캔 1회)로 처리.
+    응답은 searches 와 같은 순서의 조건별 특허 리스트.
+
+    예:
+    {"searches": [{"keyword": "graphite,흑연", "countries": "US", "limit": 6},
+                  {"keyword": "graphite,흑연", "countries": "KR", "limit": 6}]}
+
+    조건마다 /patents/search 와 같은 날짜/CPC 필터(publication_date_from 등)를 줄 수 있다.
+    """
+    try:
+        specs = [
+            {
+                "keywords": _split_csv(spec.keyword),
+                "country_codes": _split_csv(spec.countries, upper=True),
+                "limit": spec.limit,
+                "filters": search_filters(
+                    spec.publication_date_from, spec.publication_date_to,
+                    spec.filing_date_from, spec.filing_date_to,
+                    _split_csv(spec.cpc_prefix, upper=True),
+                ),
+            }
+            for spec in request.searches
+        ]
+        results, meta = await search_patents_batch_async(
+            specs,
+            fields=_split_csv(request.fields),
+            use_cache=request.cache,
+            maximum_bytes_billed=request.max_bytes_billed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except BytesBudgetExceeded as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except JobLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if request.langs:
+        results = [select_languages(r, request.langs) for r in results]
+
+    response.headers["X-Cache-Hits"] = str(meta["cache_hits"])
+    if meta.get("total_bytes_processed") is not None:
+        response.headers["X-BQ-Bytes-Processed"] = str(meta["total_bytes_processed"])
+    if meta.get("total_bytes_billed") is not None:
+        response.headers["X-BQ-Bytes-Billed"] = str(meta["total_bytes_billed"])
+    return _json_response(http_request, results, response)
+
+
+@app.get("/patents/search", response_model=List[Patent])
+async def search_patents(
+    request: Request,
+    response: Response,
+    keyword: str = Query(None, min_length=1, description="검색 키워드 (쉼표 구분으로 여러 개 가능, 예: graphite,흑연). page_token 사용 시 생략 가능"),
+    limit: int = Query(20, ge=1, le=100, description="결과 수 (paginate/page_token 사용 시 페이지 크기)"),
+    countries: str = Query(None, description="국가 코드 (쉼표 구분, 예: US,KR)"),
+    cache: bool = Query(True, description="false면 캐시를 건너뛰고 BigQuery를 직접 조회"),
+    fields: str = Query(None, description="결과 필드 (쉼표 구분, 예: publication_number,publication_date,title_localized)"),
+    max_bytes_billed: int = Query(None, ge=1, description="쿼리 1건 최대 과금 바이트 (서버 한도보다 작게만 설정 가능)"),
+    backend: str = Query(None, description="검색 backend: bigquery / local / auto (기본값: 서버 설정)"),
+    stream: bool = Query(False, description="true면 결과를 application/x-ndjson 으로 한 건씩 스트리밍"),
+    paginate: bool = Query(False, description="true면 페이지 단위 검색 (X-Next-Page-Token 헤더로 다음 페이지 토큰 반환)"),
+    max_results: int = Query(1000, ge=1, le=10000, description="페이지 단위 검색에서 전체 최대 결과 수"),
+    page_token: str = Query(None, description="다음 페이지 토큰 (이전 응답의 X-Next-Page-Token)"),
+    expand: bool = Query(None, description="동의어/번역어 확장 여부 (예: graphite -> 흑연, 그래파이트). 생략하면 서버 설정"),
+    langs: str = Query(None, description="선호 언어 순서 (쉼표 구분, 예: ko,en). 지정하면 해당 언어만 응답하고 title/abstract 필드 추가"),
+    publication_date_from: str = Query(None, description="공개일 시작 (YYYYMMDD 또는 YYYY-MM-DD)"),
+    publication_date_to: str = Query(None, description="공개일 끝 (포함)"),
+    filing_date_from: str = Query(None, description="출원일 시작 (YYYYMMDD 또는 YYYY-MM-DD)"),
+    filing_date_to: str = Query(None, description="출원일 끝 (포함)"),
+    cpc_prefix: str = Query(None, description="CPC 코드 접두어 (쉼표 구분, 예: H01M,C01B32)"),
+) -> FastJSONResponse:
     """
     키워드로 특허 제목 검색.
     예: /patents/search?keyword=graphite,흑연&limit=5&countries=US,KR
+
+    fields 를 지정하면 해당 컬럼만 BigQuery에서 조회해서 스캔 바이트(=비용)를 줄인다.
+    스캔 바이트는 X-BQ-Bytes-Processed 헤더로, 전체 필드 조회 시 스캔 바이트는
+    X-BQ-Bytes-Processed-All-Fields 헤더로 돌려준다.
+    스캔 한도(쿼리 1건 / 일일)를 넘는 검색은 403으로 거절한다.
+
+    stream=true 면 BigQuery 결과 페이지가 도착하는 대로 한 줄에 특허 하나씩
+    NDJSON 으로 보낸다 (메타데이터 헤더 없음).
+
+    publication_date_from/to, filing_date_from/to, cpc_prefix 로 공개일/출원일 범위와
+    CPC 분류를 좁힐 수 있다. 이 쿼리의 과금 바이트는 X-BQ-Bytes-Billed 헤더로,
+    최근 쿼리별 기록은 /jobs/stats 의 recent_queries 로 확인한다.
+
+    langs=ko,en 처럼 선호 언어를 주면 title_localized / abstract_localized / *_by_lang 에서
+    해당 언어만 남기고, title / abstract 에 선호 순서대로 처음 있는 언어의 텍스트를 넣는다.
+
+    paginate=true 면 쿼리를 LIMIT max_results 로 한 번만 실행하고 limit 건씩 나눠서 돌려준다.
+    다음 페이지는 page_token=<X-Next-Page-Token> 으로 요청하며, BigQuery 결과 테이블에서
+    바로 읽으므로 재스캔 비용이 없다. 페이지 단위 검색은 backend=local 에서는 400 으로 거절하고,
+    expand 는 첫 페이지 쿼리에 적용된다 (다음 페이지 요청의 expand 가 토큰과 다르면 400).
     """
+    if not keyword and not page_token:
+        raise HTTPException(status_code=400, detail="keyword 또는 page_token 이 필요합니다.")
+
+    languages = _split_csv(langs)
+
     try:
-        # 쉼표로 구분된 키워드를 리스트로 변환
-        keywords = [k.strip() for k in keyword.split(",") if k.strip()]
-
-        country_codes = None
-        if countries:
-            country_codes = [c.strip().upper() for c in countries.split(",")]
-        return search_patents_by_keyword(
-            keywords=keywords,
+        filters = search_filters(
+            publication_date_from, publication_date_to,
+            filing_date_from, filing_date_to,
+            _split_csv(cpc_prefix, upper=True),
+        )
+
+        if paginate or page_token:
+            results, page = await search_patents_page_async(
+                keywords=_split_csv(keyword),
+                page_size=limit,
+                country_codes=_split_csv(countries, upper=True),
+                fields=_split_csv(fields),
+                max_results=max_results,
+                page_token=page_token,
+                maximum_bytes_billed=max_bytes_billed,
+                filters=filters,
+                backend=backend,
+                expand_synonyms=expand,
+            )
+            response.headers["X-Total-Rows"] = str(page["total_rows"])
+            response.headers["X-Start-Index"] = str(page["start_index"])
+            if page["next_page_token"]:
+                response.headers["X-Next-Page-Token"] = page["next_page_token"]
+            return _json_response(request, select_languages(results, languages), response)
+
+        if stream:
+            items = stream_search_patents_async(
+                keywords=_split_csv(keyword),
+                limit=limit,
+                country_codes=_split_csv(countries, upper=True),
+                use_cache=cache,
+                fields=_split_csv(fields),
+                maximum_bytes_billed=max_bytes_billed,
+                backend=backend,
+                expand_synonyms=expand,
+                filters=filters,
+            )
+            if languages:
+                items = _select_languages_stream(items, languages)
+            return await _ndjson_response(items)
+
+        results, meta = await search_patents_async(
+            keywords=_split_csv(keyword),
             limit=limit,
-            country_codes=country_codes
+            country_codes=_split_csv(countries, upper=True),
+            use_cache=cache,
+            fields=_split_csv(fields),
+            maximum_bytes_billed=max_bytes_billed,
+            backend=backend,
+            expand_synonyms=expand,
+            filters=filters,
         )
+        _set_search_meta_headers(response, meta)
+        if languages:
+            results = select_languages(results, languages)
+        return _json_response(request, results, response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except BytesBudgetExceeded as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except JobLimitExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,187 @@
+# 파일명: arrow_normalize.py
+# BigQuery 검색 결과를 Arrow(컬럼 단위)로 정규화하는 경로.
+# bigquery_patents_tool 의 _normalize_* (row 단위 파이썬 루프)와 같은 결과를 만든다.
+
+from typing import List, Dict, Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow 는 선택 의존성
+    pa = None
+    pc = None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow 결과 경로에는 pyarrow 가 필요합니다: pip install pyarrow"
+        )
+
+
+def _column(table: "pa.Table", name: str) -> "pa.Array":
+    """chunked column 을 하나의 Array 로 합친다"""
+    return table.column(name).combine_chunks()
+
+
+def _rebuild_list(list_array: "pa.ListArray", values: "pa.Array") -> "pa.ListArray":
+    """
+    원래 리스트의 offsets 로 새 리스트를 만든다.
+    offsets 에는 null 정보가 없으므로 null 리스트는 빈 리스트가 된다
+    (row 경로에서 None -> [] 로 바꾸는 것과 같음).
+    """
+    return pa.ListArray.from_arrays(list_array.offsets, values)
+
+
+def _struct_field(values: "pa.StructArray", name: str, length: int) -> "pa.Array":
+    """struct 에 필드가 없으면 null 배열"""
+    if values.type.get_field_index(name) < 0:
+        return pa.nulls(length, pa.string())
+    return values.field(name)
+
+
+def _localized(list_array: "pa.ListArray", with_truncated: bool) -> "pa.ListArray":
+    """
+    title_localized / abstract_localized 정리.
+    with_truncated=True 면 truncated 를 소문자 문자열로 ("true"/"false", 없으면 "false")
+    """
+    values = list_array.values
+    length = len(values)
+    names = ["text", "language"]
+    arrays = [_struct_field(values, "text", length), _struct_field(values, "language", length)]
+
+    if with_truncated:
+        truncated = _struct_field(values, "truncated", length)
+        truncated = pc.utf8_lower(pc.cast(truncated, pa.string()))
+        arrays.append(pc.fill_null(truncated, "false"))
+        names.append("truncated")
+
+    return _rebuild_list(list_array, pa.StructArray.from_arrays(arrays, names=names))
+
+
+def _names_with_fallback(harmonized: "pa.ListArray", raw: "pa.ListArray") -> "pa.ListArray":
+    """
+    assignee / inventor 정리.
+    *_harmonized(이름+국가 struct 배열)가 비어 있는 row 만 원본(문자열 배열)을 쓴다.
+    """
+    h_values = harmonized.values
+    h_struct = pa.StructArray.from_arrays(
+        [
+            pc.cast(_struct_field(h_values, "name", len(h_values)), pa.string()),
+            pc.cast(_struct_field(h_values, "country_code", len(h_values)), pa.string()),
+        ],
+        names=["name", "country_code"],
+    )
+    h_list = _rebuild_list(harmonized, h_struct)
+
+    r_values = pc.cast(raw.values, pa.string())
+    r_struct = pa.StructArray.from_arrays(
+        [r_values, pa.nulls(len(r_values), pa.string())],
+        names=["name", "country_code"],
+    )
+    r_list = _rebuild_list(raw, r_struct)
+
+    has_harmonized = pc.greater(pc.list_value_length(h_list), 0)
+    return pc.if_else(has_harmonized, h_list, r_list)
+
+
+def _filter_list(list_array: "pa.ListArray", values: "pa.Array", valid: "pa.Array") -> "pa.ListArray":
+    """
+    리스트 원소 중 valid 인 것만 남긴다.
+    새 offset[i] = 원래 offset[i] 앞에 있는 유효 원소 개수
+    """
+    if pc.all(valid).as_py() is not False:
+        return _rebuild_list(list_array, values)
+
+    prefix = pc.cumulative_sum(pc.cast(valid, pa.int32()))
+    prefix = pa.concat_arrays([pa.array([0], pa.int32()), prefix])
+    offsets = pc.take(prefix, list_array.offsets)
+    return pa.ListArray.from_arrays(offsets, values.filter(valid))
+
+
+def _cpc_codes(list_array: "pa.ListArray") -> "pa.ListArray":
+    """cpc struct 배열 -> code 문자열 배열 (빈 code 제외)"""
+    values = list_array.values
+    codes = pc.cast(_struct_field(values, "code", len(values)), pa.string())
+    valid = pc.fill_null(pc.greater(pc.utf8_length(codes), 0), False)
+    return _filter_list(list_array, codes, valid)
+
+
+def _by_language(list_array: "pa.ListArray") -> "pa.MapArray":
+    """localized 배열 -> map<language, text> (언어가 없는 항목 제외)"""
+    values = list_array.values
+    languages = pc.cast(_struct_field(values, "language", len(values)), pa.string())
+    texts = pc.cast(_struct_field(values, "text", len(values)), pa.string())
+    valid = pc.fill_null(pc.greater(pc.utf8_length(languages), 0), False)
+
+    filtered = _filter_list(
+        list_array,
+        pa.StructArray.from_arrays([languages, texts], names=["language", "text"]),
+        valid,
+    )
+    entries = filtered.values
+    return pa.MapArray.from_arrays(filtered.offsets, entries.field("language"), entries.field("text"))
+
+
+def _dates(array: "pa.Array") -> "pa.Array":
+    """publication_date / filing_date -> 'YYYYMMDD' 문자열 (INT64, DATE 모두 처리)"""
+    if pa.types.is_date(array.type) or pa.types.is_timestamp(array.type):
+        return pc.strftime(array, format="%Y%m%d")
+    return pc.cast(array, pa.string())
+
+
+def _as_is(array: "pa.Array") -> "pa.Array":
+    return array
+
+
+# 결과 필드 -> (필요한 컬럼, 변환 함수)
+_ARROW_FIELDS = {
+    "publication_number": (["publication_number"], _as_is),
+    "application_number": (["application_number"], _as_is),
+    "country_code": (["country_code"], _as_is),
+    "title_localized": (["title_localized"], lambda a: _localized(a, with_truncated=True)),
+    "abstract_localized": (["abstract_localized"], lambda a: _localized(a, with_truncated=False)),
+    "publication_date": (["publication_date"], _dates),
+    "filing_date": (["filing_date"], _dates),
+    "assignee": (["assignee_harmonized", "assignee"], _names_with_fallback),
+    "inventor": (["inventor_harmonized", "inventor"], _names_with_fallback),
+    "cpc": (["cpc"], _cpc_codes),
+    "title_by_lang": (["title_localized"], _by_language),
+    "abstract_by_lang": (["abstract_localized"], _by_language),
+}
+
+_MAP_FIELDS = ("title_by_lang", "abstract_by_lang")
+
+
+def normalize_arrow_table(table: "pa.Table", fields: List[str]) -> "pa.Table":
+    """
+    BigQuery 결과 Arrow 테이블을 정규화된 컬럼들의 Arrow 테이블로 변환.
+    (파이썬 dict 로 바꾸지 않고 Parquet 등으로 바로 쓸 때 사용)
+    """
+    _require_pyarrow()
+
+    arrays = []
+    for field in fields:
+        columns, convert = _ARROW_FIELDS[field]
+        arrays.append(convert(*[_column(table, c) for c in columns]))
+
+    return pa.Table.from_arrays(arrays, names=list(fields))
+
+
+def arrow_table_to_results(table: "pa.Table", fields: List[str]) -> List[Dict[str, Any]]:
+    """
+    BigQuery 결과 Arrow 테이블 -> 정규화된 특허 dict 리스트.
+    컬럼 단위로 변환한 뒤 마지막에 한 번만 파이썬 객체로 바꾼다.
+    """
+    if table.num_rows == 0:
+        return []
+    results = normalize_arrow_table(table, fields).to_pylist()
+
+    # map 컬럼(*_by_lang)은 (key, value) 리스트로 나오므로 dict 로 바꾼다
+    # (같은 언어가 여러 번 있으면 마지막 값, row 경로와 같음.
+    #  to_pylist(maps_as_pydicts=...) 보다 이쪽이 빠르다)
+    map_fields = [f for f in fields if f in _MAP_FIELDS]
+    for item in results:
+        for field in map_fields:
+            item[field] = dict(item[field]) if item[field] is not None else {}
+    return results
@@ -0,0 +1,476 @@
+# 파일명: bigquery_async.py
+
+import asyncio
+import os
+import threading
+from typing import AsyncIterator, List, Dict, Any, Sequence, Tuple
+
+from google.cloud import bigquery
+
+from bigquery_client import get_client
+from bigquery_patents_tool import (
+    DEFAULT_PAGINATION_MAX_RESULTS,
+    EXPAND_SYNONYMS,
+    PROJECT_ID,
+    _batch_cache_keys,
+    _build_batch_search_query,
+    _build_sample_query,
+    _build_search_query,
+    _cached_list,
+    _check_page_backend,
+    _estimate_summary,
+    _first_page_from_job,
+    _iter_search_results,
+    _job_to_search_results,
+    _normalize_batch_specs,
+    _page_from_token,
+    _resolve_fields,
+    _sample_rows_to_results,
+    _select_list,
+    _search_local,
+    _split_batch_results,
+    _to_keyword_list,
+)
+from metrics import span
+from patent_cache import get_cache, make_search_key
+from query_budget import (
+    apply_max_bytes_billed,
+    BytesBudgetExceeded,
+    check_estimate,
+    dry_run_config,
+    is_bytes_limit_error,
+    job_stats,
+    needs_estimate,
+    record_job,
+)
+from singleflight import SingleFlight
+
+# 동시에 실행할 수 있는 BigQuery 잡 수 (초과 요청은 JobLimitExceeded → HTTP 429)
+MAX_INFLIGHT_JOBS = int(os.environ.get("BQ_MAX_INFLIGHT_JOBS", "8"))
+
+# 잡 완료 여부를 확인하는 간격 (초)
+JOB_POLL_INTERVAL_SEC = float(os.environ.get("BQ_JOB_POLL_INTERVAL", "0.2"))
+
+# 스트리밍 응답에서 BigQuery 결과를 한 번에 받아오는 row 수
+STREAM_PAGE_SIZE = int(os.environ.get("BQ_STREAM_PAGE_SIZE", "20"))
+
+_NO_MORE_PAGES = object()
+
+
+class JobLimitExceeded(Exception):
+    """동시 실행 중인 BigQuery 잡 수가 한도에 도달했을 때 발생"""
+
+
+class JobLimiter:
+    """
+    동시 실행 BigQuery 잡 수 제한.
+    자리가 없으면 기다리지 않고 바로 JobLimitExceeded 를 던져서
+    호출 측(FastAPI)이 429로 돌려보낼 수 있게 한다.
+    """
+
+    def __init__(self, max_in_flight: int = MAX_INFLIGHT_JOBS):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.max_in_flight:
+                self.rejected += 1
+                raise JobLimitExceeded(
+                    f"BigQuery 동시 실행 잡 한도({self.max_in_flight})에 도달했습니다."
+                )
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def __enter__(self) -> "JobLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "rejected": self.rejected,
+            }
+
+
+job_limiter = JobLimiter()
+
+# 동시에 들어온 같은 검색 조건은 BigQuery 잡 하나로 합친다
+search_flight = SingleFlight()
+
+
+async def run_query_job(
+    query: str,
+    job_config: bigquery.QueryJobConfig | None = None,
+    poll_interval: float = JOB_POLL_INTERVAL_SEC,
+) -> bigquery.QueryJob:
+    """
+    쿼리 잡을 제출하고, 이벤트 루프를 막지 않고 완료될 때까지 기다린다.
+    잡 상태 확인(HTTP 호출)만 잠깐 executor 에서 실행하고,
+    대기 시간 동안은 스레드를 점유하지 않는다.
+    """
+    client = get_client(PROJECT_ID)
+    with span("bigquery_submit"):
+        job = await asyncio.to_thread(client.query, query, job_config=job_config)
+
+    with span("bigquery_wait"):
+        while not await asyncio.to_thread(job.done):
+            await asyncio.sleep(poll_interval)
+
+    # dry run 추정치보다 실제 과금이 커서 maximum_bytes_billed 에 걸린 경우도 한도 초과(403)로 돌려준다
+    error = getattr(job, "error_result", None)
+    if error and is_bytes_limit_error(error):
+        raise BytesBudgetExceeded(f"쿼리 1건 스캔 한도 초과: {error.get('message', '')}")
+
+    return job
+
+
+async def dry_run_bytes(
+    query: str,
+    job_config: bigquery.QueryJobConfig | None = None,
+) -> int:
+    """
+    dry run 으로 쿼리가 스캔할 바이트 수 추정 (과금 없음)
+    """
+    client = get_client(PROJECT_ID)
+    with span("dry_run"):
+        job = await asyncio.to_thread(client.query, query, job_config=dry_run_config(job_config))
+    return job.total_bytes_processed or 0
+
+
+async def _fetch_results(job: bigquery.QueryJob, rows_to_results) -> List[Dict[str, Any]]:
+    """완료된 잡의 결과 다운로드 + 정리 (페이지 조회가 블로킹이므로 executor 에서 실행)"""
+    return await asyncio.to_thread(lambda: rows_to_results(job.result()))
+
+
+async def sample_patents_async(limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    sample_patents() 의 비동기 버전
+    """
+    with job_limiter:
+        job = await run_query_job(_build_sample_query(limit))
+        return await _fetch_results(job, _sample_rows_to_results)
+
+
+async def search_patents_async(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    use_cache: bool = True,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    backend: str | None = None,
+    expand_synonyms: bool | None = None,
+    filters: Dict[str, Any] | None = None,
+) -> Tuple[Sequence[Dict[str, Any]], Dict[str, Any]]:
+    """
+    키워드 검색 + 실행 메타데이터 반환.
+
+    - backend 설정에 따라 로컬 스토어에서 먼저 찾는다 (BigQuery 과금 없음).
+    - 캐시 hit 은 잡 한도에 포함되지 않는다.
+    - 같은 조건(maximum_bytes_billed / use_cache 포함)의 검색이 이미 실행 중이면
+      새 잡을 만들지 않고 그 결과를 같이 받는다.
+    - fields 로 일부 필드만 요청하면, 전체 필드를 조회했을 때의 스캔 바이트를
+      dry run 으로 구해서 meta["all_fields_bytes_processed"] 에 같이 넣는다.
+    - 일일 스캔 한도가 설정돼 있으면 실행 전에 dry run 으로 확인하고,
+      넘으면 BytesBudgetExceeded 를 던진다.
+    - filters 는 search_filters() 결과 (공개일/출원일 범위, CPC 접두어).
+
+    Returns:
+        (results, meta)
+        results: 특허 dict 리스트. 메모리 캐시 hit 이면 PatentRecordList (읽기 전용 Sequence).
+        meta: backend, cache_hit, fields, job_id, total_bytes_processed,
+              total_bytes_billed, maximum_bytes_billed, all_fields_bytes_processed,
+              slot_millis, bq_cache_hit (BigQuery 쿼리 캐시), queue_ms, execution_ms
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    local_results = await asyncio.to_thread(
+        _search_local, keyword_list, limit, country_codes, selected_fields, backend, filters
+    )
+    if local_results is not None:
+        return local_results, {"backend": "local", "cache_hit": False, "fields": selected_fields}
+
+    cache = get_cache() if use_cache else None
+    cache_key = make_search_key(
+        keyword_list, country_codes, limit, fields=selected_fields, filters=filters
+    )
+    if cache is not None:
+        with span("cache_lookup"):
+            cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, {"backend": "bigquery", "cache_hit": True, "fields": selected_fields}
+
+    async def run_search() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        query, job_config = _build_search_query(
+            keyword_list, limit, country_codes, selected_fields, filters=filters
+        )
+
+        if needs_estimate(maximum_bytes_billed):
+            check_estimate(await dry_run_bytes(query, job_config), maximum_bytes_billed)
+
+        cap = apply_max_bytes_billed(job_config, maximum_bytes_billed)
+        with job_limiter:
+            job = await run_query_job(query, job_config)
+            results = await asyncio.to_thread(_job_to_search_results, job, selected_fields)
+        record_job(job, "search", filters=filters)
+
+        if cache is not None:
+            with span("cache_store"):
+                cache.set(cache_key, results)
+
+        stats = job_stats(job)
+        meta: Dict[str, Any] = {
+            "backend": "bigquery",
+            "cache_hit": False,
+            "fields": selected_fields,
+            "job_id": job.job_id,
+            "total_bytes_processed": job.total_bytes_processed,
+            "total_bytes_billed": job.total_bytes_billed,
+            "maximum_bytes_billed": cap,
+            "slot_millis": stats["slot_millis"],
+            "bq_cache_hit": stats["cache_hit"],
+            "queue_ms": stats["queue_ms"],
+            "execution_ms": stats["execution_ms"],
+        }
+
+        if _select_list(selected_fields) != _select_list(None):
+            full_query, full_config = _build_search_query(
+                keyword_list, limit, country_codes, filters=filters
+            )
+            meta["all_fields_bytes_processed"] = await dry_run_bytes(full_query, full_config)
+
+        return results, meta
+
+    # 과금 한도 / 캐시 사용 여부가 다른 요청은 합치지 않는다
+    # (한도가 낮은 요청이 한도 없는 잡에 붙어서 한도 이상 과금되거나, cache=false 요청이 캐시 저장 실행에 붙지 않도록)
+    flight_key = f"{cache_key}|max_bytes_billed={maximum_bytes_billed}|use_cache={use_cache}"
+    return await search_flight.do(flight_key, run_search)
+
+
+async def estimate_search_async(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    filters: Dict[str, Any] | None = None,
+    expand_synonyms: bool | None = None,
+) -> Dict[str, Any]:
+    """
+    estimate_search_patents() 의 비동기 버전 (dry run, 과금 없음)
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    query, job_config = _build_search_query(
+        keyword_list, limit, country_codes, selected_fields, filters=filters
+    )
+    estimated_bytes = await dry_run_bytes(query, job_config)
+
+    return _estimate_summary(estimated_bytes, selected_fields, maximum_bytes_billed)
+
+
+async def stream_search_patents_async(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    use_cache: bool = True,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    backend: str | None = None,
+    page_size: int = STREAM_PAGE_SIZE,
+    expand_synonyms: bool | None = None,
+    filters: Dict[str, Any] | None = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    검색 결과를 BigQuery 결과 페이지 단위로 받아오면서 특허 dict 를 하나씩 yield.
+    첫 페이지가 도착하자마자 호출 측이 처리를 시작할 수 있다.
+
+    - 로컬 스토어/캐시에 결과가 있으면 그대로 흘려보낸다
+    - 스트리밍 결과는 모으지 않으므로 캐시에 저장하지 않고, single-flight 도 쓰지 않는다
+    - 잡 한도는 마지막 페이지를 보낼 때까지 점유한다
+    - 잡 사용량은 스트림이 끝나거나 중간에 닫힐 때 기록한다
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    local_results = await asyncio.to_thread(
+        _search_local, keyword_list, limit, country_codes, selected_fields, backend, filters
+    )
+    if local_results is not None:
+        for item in local_results:
+            yield item
+        return
+
+    cache = get_cache() if use_cache else None
+    if cache is not None:
+        cache_key = make_search_key(
+            keyword_list, country_codes, limit, fields=selected_fields, filters=filters
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            for item in cached:
+                yield item
+            return
+
+    query, job_config = _build_search_query(
+        keyword_list, limit, country_codes, selected_fields, filters=filters
+    )
+
+    if needs_estimate(maximum_bytes_billed):
+        check_estimate(await dry_run_bytes(query, job_config), maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    with job_limiter:
+        job = await run_query_job(query, job_config)
+        try:
+            row_iterator = await asyncio.to_thread(job.result, page_size=page_size)
+            pages = iter(row_iterator.pages)
+
+            while True:
+                page = await asyncio.to_thread(next, pages, _NO_MORE_PAGES)
+                if page is _NO_MORE_PAGES:
+                    break
+                for item in _iter_search_results(page, selected_fields):
+                    yield item
+        finally:
+            # 클라이언트 연결이 끊겨 스트림이 중간에 닫혀도 실행된 잡은 사용량에 기록
+            record_job(job, "stream", filters=filters)
+
+
+async def search_patents_page_async(
+    keywords: str | List[str] | None = None,
+    page_size: int = 20,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    max_results: int = DEFAULT_PAGINATION_MAX_RESULTS,
+    page_token: str | None = None,
+    maximum_bytes_billed: int | None = None,
+    filters: Dict[str, Any] | None = None,
+    backend: str | None = None,
+    expand_synonyms: bool | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    search_patents_page() 의 비동기 버전.
+    다음 페이지 조회(page_token)는 쿼리 잡이 아니므로 잡 한도에 포함되지 않는다.
+    """
+    _check_page_backend(backend)
+
+    if page_token:
+        client = get_client(PROJECT_ID)
+        return await asyncio.to_thread(_page_from_token, client, page_token, expand_synonyms)
+
+    if not keywords:
+        raise ValueError("첫 페이지 검색에는 keywords 가 필요합니다.")
+
+    expand = EXPAND_SYNONYMS if expand_synonyms is None else expand_synonyms
+    keyword_list = _to_keyword_list(keywords, expand)
+    selected_fields = _resolve_fields(fields)
+    query, job_config = _build_search_query(
+        keyword_list, max_results, country_codes, selected_fields, filters=filters
+    )
+
+    if needs_estimate(maximum_bytes_billed):
+        check_estimate(await dry_run_bytes(query, job_config), maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    with job_limiter:
+        job = await run_query_job(query, job_config)
+        page = await asyncio.to_thread(_first_page_from_job, job, page_size, selected_fields, expand)
+    record_job(job, "search_page", filters=filters)
+
+    return page
+
+
+async def search_patents_batch_async(
+    specs: List[Dict[str, Any]],
+    fields: List[str] | None = None,
+    use_cache: bool = True,
+    maximum_bytes_billed: int | None = None,
+) -> Tuple[List[List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    search_patents_batch() 의 비동기 버전 + 실행 메타데이터.
+    캐시에 없는 조건만 모아서 BigQuery 잡 하나로 실행한다.
+
+    Returns:
+        (조건별 결과 리스트, meta)
+        meta: cache_hits, job_id, total_bytes_processed, total_bytes_billed
+    """
+    normalized = _normalize_batch_specs(specs)
+    selected_fields = _resolve_fields(fields)
+
+    cache = get_cache() if use_cache else None
+    cache_keys = _batch_cache_keys(normalized, selected_fields)
+    results: List[List[Dict[str, Any]] | None] = [
+        _cached_list(cache, key) for key in cache_keys
+    ]
+
+    pending = [i for i, r in enumerate(results) if r is None]
+    meta: Dict[str, Any] = {"fields": selected_fields, "cache_hits": len(specs) - len(pending)}
+    if not pending:
+        return results, meta
+
+    query, job_config = _build_batch_search_query([normalized[i] for i in pending], selected_fields)
+
+    if needs_estimate(maximum_bytes_billed):
+        check_estimate(await dry_run_bytes(query, job_config), maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    with job_limiter:
+        job = await run_query_job(query, job_config)
+        fetched = await _fetch_results(
+            job, lambda rows: _split_batch_results(rows, len(pending), selected_fields)
+        )
+    record_job(job, "batch", specs=len(pending))
+
+    for i, spec_results in zip(pending, fetched):
+        results[i] = spec_results
+        if cache is not None:
+            cache.set(cache_keys[i], spec_results)
+
+    meta.update({
+        "job_id": job.job_id,
+        "total_bytes_processed": job.total_bytes_processed,
+        "total_bytes_billed": job.total_bytes_billed,
+    })
+    return results, meta
+
+
+async def search_patents_by_keyword_async(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    use_cache: bool = True,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    backend: str | None = None,
+    expand_synonyms: bool | None = None,
+    filters: Dict[str, Any] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    search_patents_by_keyword() 의 비동기 버전 (결과만 반환)
+    """
+    results, _ = await search_patents_async(
+        keywords,
+        limit=limit,
+        country_codes=country_codes,
+        use_cache=use_cache,
+        fields=fields,
+        maximum_bytes_billed=maximum_bytes_billed,
+        backend=backend,
+        expand_synonyms=expand_synonyms,
+        filters=filters,
+    )
+    return list(results)
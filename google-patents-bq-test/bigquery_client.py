@@ -0,0 +1,114 @@
+# 파일명: bigquery_client.py
+
+import os
+import threading
+from typing import Optional
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
+
+# BigQuery API 호출에 쓰는 HTTP 커넥션 풀 크기 (동시 요청 수에 맞춰 조정)
+DEFAULT_POOL_SIZE = int(os.environ.get("BQ_HTTP_POOL_SIZE", "10"))
+
+_BIGQUERY_SCOPES = [
+    "https://www.googleapis.com/auth/bigquery",
+    "https://www.googleapis.com/auth/cloud-platform",
+]
+
+
+class BigQueryClientManager:
+    """
+    프로세스 전역에서 하나의 bigquery.Client 를 공유하기 위한 관리자.
+
+    - 처음 get() 이 호출될 때 클라이언트를 만든다 (lazy init)
+    - 여러 스레드에서 동시에 호출해도 클라이언트는 한 번만 만들어진다
+    - 인증 정보 탐색, HTTP 세션, TLS 커넥션을 요청마다 새로 만들지 않고 재사용한다
+    """
+
+    def __init__(self, project: str, pool_size: int = DEFAULT_POOL_SIZE):
+        self.project = project
+        self.pool_size = pool_size
+        self._client: Optional[bigquery.Client] = None
+        self._session: Optional[AuthorizedSession] = None
+        self._lock = threading.Lock()
+
+    def _build_session(self, credentials) -> AuthorizedSession:
+        """커넥션 풀 크기를 지정한 인증 HTTP 세션 생성"""
+        session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def get(self) -> bigquery.Client:
+        """공유 클라이언트 반환 (없으면 생성)"""
+        client = self._client
+        if client is not None:
+            return client
+
+        with self._lock:
+            if self._client is None:
+                credentials, _ = google.auth.default(scopes=_BIGQUERY_SCOPES)
+                self._session = self._build_session(credentials)
+                self._client = bigquery.Client(
+                    project=self.project,
+                    credentials=credentials,
+                    _http=self._session,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """클라이언트와 HTTP 세션 정리 (서버 종료 시 호출)"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            if self._session is not None:
+                self._session.close()
+            self._client = None
+            self._session = None
+
+
+_manager: Optional[BigQueryClientManager] = None
+_manager_lock = threading.Lock()
+
+
+def configure_client(project: str, pool_size: int = DEFAULT_POOL_SIZE) -> BigQueryClientManager:
+    """
+    전역 클라이언트 관리자 설정.
+    이미 만들어진 클라이언트가 있으면 닫고 새 설정으로 교체한다.
+    """
+    global _manager
+
+    with _manager_lock:
+        if _manager is not None:
+            _manager.close()
+        _manager = BigQueryClientManager(project, pool_size=pool_size)
+        return _manager
+
+
+def get_client(project: str) -> bigquery.Client:
+    """
+    전역 공유 bigquery.Client 반환.
+    관리자가 아직 없으면 주어진 project 로 만든다.
+    """
+    global _manager
+
+    manager = _manager
+    if manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = BigQueryClientManager(project)
+            manager = _manager
+
+    return manager.get()
+
+
+def close_client() -> None:
+    """전역 클라이언트 정리 (FastAPI lifespan 종료 시점에 호출)"""
+    with _manager_lock:
+        if _manager is not None:
+            _manager.close()
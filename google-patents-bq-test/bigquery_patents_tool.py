@@ -1,11 +1,75 @@
 # 파일명: bigquery_patents_tool.py
 
-from typing import List, Dict, Any, Optional, Union
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Union
 from google.cloud import bigquery
+from google.cloud.bigquery.table import Row
+
+from arrow_normalize import arrow_table_to_results, normalize_arrow_table, pa
+from bigquery_client import get_client
+from keyword_synonyms import expand_keywords
+from local_patent_store import DEFAULT_STORE_PATH, LocalPatentStore, get_local_store
+from metrics import span
+from page_token import decode_page_token, encode_page_token
+from patent_cache import get_cache, make_search_key
+from query_budget import (
+    apply_max_bytes_billed,
+    check_estimate,
+    daily_budget,
+    record_job,
+    dry_run_config,
+    estimate_cost_usd,
+    needs_estimate,
+    resolve_max_bytes_billed,
+)
+
+try:
+    import pyarrow.parquet as pq
+    from google.cloud import bigquery_storage
+except ImportError:  # export 전용 선택 의존성
+    pq = None
+    bigquery_storage = None
 
 # gcloud init 에서 쓰는 프로젝트 ID
 PROJECT_ID = "project-69deab36-6e87-4730-9f1"
 
+# 검색 backend
+# - bigquery: 항상 BigQuery 조회
+# - local: 로컬 스토어(local_patent_store)만 조회
+# - auto: 로컬 스토어가 있고 요청 국가를 포함하면 로컬에서 찾고, 결과가 없으면 BigQuery 조회
+SEARCH_BACKENDS = ("bigquery", "local", "auto")
+DEFAULT_SEARCH_BACKEND = os.environ.get("PATENT_SEARCH_BACKEND", "auto")
+
+# 페이지 단위 검색에서 쿼리 한 번으로 가져올 최대 결과 수 (이후 페이지는 결과 테이블에서 읽음)
+DEFAULT_PAGINATION_MAX_RESULTS = 1000
+
+# 배치 검색 한 번에 묶을 수 있는 최대 검색 조건 수
+MAX_BATCH_SPECS = 20
+
+# 검색 결과 정규화 경로
+# - rows: row 마다 _normalize_* 실행 (기본값)
+# - arrow: 결과를 Arrow 테이블로 받아 컬럼 단위로 정규화 (pyarrow 필요, 결과가 많을 때 빠름)
+RESULT_PATHS = ("rows", "arrow")
+RESULT_PATH = os.environ.get("BQ_RESULT_PATH", "rows")
+
+# 키워드 조건 형식
+# - regexp: 모든 키워드를 REGEXP_CONTAINS 하나(alternation)로 검사 (기본값)
+# - like: 키워드마다 LIKE 조건을 OR 로 연결 (이전 방식, 비교용)
+KEYWORD_MATCH_MODES = ("regexp", "like")
+KEYWORD_MATCH = os.environ.get("BQ_KEYWORD_MATCH", "regexp")
+
+# 검색 키워드에 동의어/번역어(keyword_synonyms.json)를 자동으로 붙일지 여부
+# 켜면 같은 키워드라도 결과가 달라지므로 기본값은 끔 (요청별로 expand=true 로 켤 수 있다)
+EXPAND_SYNONYMS = os.environ.get("PATENT_EXPAND_SYNONYMS", "false").lower() in ("1", "true", "yes")
+
+# Parquet export 에서 Storage Read API 로 동시에 읽을 최대 스트림 수
+DEFAULT_EXPORT_STREAMS = int(os.environ.get("BQ_EXPORT_STREAMS", "4"))
+DEFAULT_EXPORT_LIMIT = 10000
+
 
 def _normalize_localized_text(value) -> List[Dict[str, Any]]:
     """
@@ -167,6 +231,14 @@ def _normalize_title_localized(value) -> List[Dict[str, Any]]:
     return titles
 
 
+def _localized_by_language(items: List[Dict[str, Any]] | None) -> Dict[str, str]:
+    """
+    정리된 localized 리스트 -> {language: text} (언어가 없는 항목은 제외).
+    소비하는 쪽에서 언어별 텍스트를 리스트를 다시 훑지 않고 바로 찾기 위함.
+    """
+    return {t["language"]: t["text"] for t in (items or []) if t.get("language")}
+
+
 def _normalize_date(value) -> str | None:
     """
     publication_date / filing_date 가
@@ -186,13 +258,9 @@ def _normalize_date(value) -> str | None:
     return str(value)
 
 
-def sample_patents(limit: int = 10) -> List[Dict[str, Any]]:
-    """
-    Google Patents Public Data 샘플 몇 개 가져오기
-    """
-    client = bigquery.Client(project=PROJECT_ID)
-
-    query = f"""
+def _build_sample_query(limit: int) -> str:
+    """sample_patents 용 쿼리 생성"""
+    return f"""
     SELECT
       publication_number,
       title_localized,
@@ -203,10 +271,12 @@ def sample_patents(limit: int = 10) -> List[Dict[str, Any]]:
     LIMIT {limit};
     """
 
-    job = client.query(query)
+
+def _sample_rows_to_results(rows) -> List[Dict[str, Any]]:
+    """sample 쿼리 결과 row 들을 dict 리스트로 정리"""
     results: List[Dict[str, Any]] = []
 
-    for row in job:
+    for row in rows:
         titles = _normalize_title_localized(row.title_localized)
         pub_date = _normalize_date(row.publication_date)
         filing = _normalize_date(row.filing_date)
@@ -218,6 +288,18 @@ def sample_patents(limit: int = 10) -> List[Dict[str, Any]]:
             "filing_date": filing,
         })
 
+    return results
+
+
+def sample_patents(limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Google Patents Public Data 샘플 몇 개 가져오기
+    """
+    client = get_client(PROJECT_ID)
+
+    job = client.query(_build_sample_query(limit))
+    results = _sample_rows_to_results(job)
+
     # 확인용 출력
     for item in results:
         print(item)
@@ -225,129 +307,1245 @@ def sample_patents(limit: int = 10) -> List[Dict[str, Any]]:
     return results
 
 
-def search_patents_by_keyword(
-    keywords: str | List[str],
-    limit: int = 20,
-    country_codes: List[str] | None = None
-) -> List[Dict[str, Any]]:
+def _to_keyword_list(keywords: str | List[str] | None, expand: bool | None = None) -> List[str]:
     """
-    제목에 keyword가 들어가는 특허 검색
+    키워드를 리스트로 변환 (앞뒤 공백 제거, 빈 키워드 제외).
+    expand=True 면 동의어 사전으로 확장한다 (예: "graphite" -> graphite, 흑연, 그래파이트, ...).
+    None 이면 PATENT_EXPAND_SYNONYMS 설정값.
+    남는 키워드가 없으면 ValueError (빈 정규식은 모든 row 와 일치하므로).
+    """
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    keywords = [k.strip() for k in keywords or [] if k and k.strip()]
+    if not keywords:
+        raise ValueError("검색 키워드가 비어 있습니다.")
+    if expand is None:
+        expand = EXPAND_SYNONYMS
+    if expand:
+        return expand_keywords(keywords)
+    return list(keywords)
+
+
+# RE2 정규식에서 특별한 의미가 있는 문자
+_RE2_SPECIAL = set("\\.^$|?*+()[]{}")
+
+
+def _keyword_regexp(keyword_list: List[str]) -> str:
+    """키워드 목록 -> 소문자 부분 문자열 alternation 정규식 (RE2)"""
+    if not keyword_list:
+        raise ValueError("검색 키워드가 비어 있습니다.")
+    escaped = [
+        "".join("\\" + ch if ch in _RE2_SPECIAL else ch for ch in kw.lower())
+        for kw in keyword_list
+    ]
+    return "(?:" + "|".join(escaped) + ")"
+
+
+# 검색 결과 필드 -> BigQuery 컬럼 매핑
+# BigQuery는 조회한 컬럼의 바이트 수로 과금하므로, 필요한 필드만 SELECT 한다.
+SEARCH_FIELDS: Dict[str, List[str]] = {
+    "publication_number": ["publication_number"],
+    "application_number": ["application_number"],
+    "country_code": ["country_code"],
+    "title_localized": ["title_localized"],
+    "abstract_localized": ["abstract_localized"],
+    "publication_date": ["publication_date"],
+    "filing_date": ["filing_date"],
+    "assignee": ["assignee", "assignee_harmonized"],
+    "inventor": ["inventor", "inventor_harmonized"],
+    "cpc": ["cpc"],
+    "title_by_lang": ["title_localized"],
+    "abstract_by_lang": ["abstract_localized"],
+}
+
+# 검색 결과 순서 (최신 공개일 우선, 같은 날은 공개번호 순).
+# LIMIT 만 있으면 어떤 row 가 남을지 실행마다 달라질 수 있어서, 단건/배치 검색과 로컬 스토어가 같은 순서를 쓴다.
+# 배치 결과와 단건 검색이 캐시 키를 공유하므로 둘 다 같은 row 를 골라야 한다.
+RESULT_ORDER = "publication_date DESC, publication_number"
+
+# fields 로 지정했을 때만 응답에 넣는 필드.
+# *_by_lang 은 *_localized 와 같은 텍스트를 언어별 dict 로 한 번 더 담으므로 기본 응답(과 캐시)이 1.5배 넘게 커진다.
+# 특정 언어 텍스트가 필요하면 langs 를 주면 title / abstract 에 선호 언어 텍스트가 들어간다.
+OPT_IN_FIELDS = ("title_by_lang", "abstract_by_lang")
+DEFAULT_FIELDS = [f for f in SEARCH_FIELDS if f not in OPT_IN_FIELDS]
+
+
+def _resolve_fields(fields: List[str] | None) -> List[str]:
+    """
+    요청한 필드 목록 검증 + 정렬.
+    None 이면 기본 필드(DEFAULT_FIELDS, *_by_lang 제외), publication_number 는 항상 포함한다.
+    """
+    if not fields:
+        return list(DEFAULT_FIELDS)
+
+    unknown = [f for f in fields if f not in SEARCH_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"지원하지 않는 필드: {', '.join(unknown)} "
+            f"(사용 가능: {', '.join(SEARCH_FIELDS)})"
+        )
 
-    Args:
-        keywords: 검색 키워드 (문자열 또는 리스트).
-                  예: "graphite" 또는 ["graphite", "흑연", "그래파이트"]
-        limit: 검색 결과 수 제한
-        country_codes: 국가 코드 리스트 (예: ["US", "KR"]). None이면 전체 국가.
+    requested = set(fields) | {"publication_number"}
+    return [f for f in SEARCH_FIELDS if f in requested]
+
+
+def _select_list(fields: List[str] | None) -> str:
+    """fields 에 해당하는 BigQuery 컬럼 목록 (SELECT 절)"""
+    columns: List[str] = []
+    for field in _resolve_fields(fields):
+        columns.extend(c for c in SEARCH_FIELDS[field] if c not in columns)
+    return ",\n      ".join(columns)
+
+
+def _to_date_int(value: int | str | None, name: str) -> Optional[int]:
+    """날짜 필터 값 -> YYYYMMDD 정수 (20150101, "20150101", "2015-01-01" 모두 허용)"""
+    if value is None or value == "":
+        return None
+    text = str(value).replace("-", "")
+    if len(text) != 8 or not text.isdigit():
+        raise ValueError(f"{name} 는 YYYYMMDD 또는 YYYY-MM-DD 형식이어야 합니다: {value}")
+    return int(text)
+
+
+def search_filters(
+    publication_date_from: int | str | None = None,
+    publication_date_to: int | str | None = None,
+    filing_date_from: int | str | None = None,
+    filing_date_to: int | str | None = None,
+    cpc_prefixes: List[str] | None = None,
+) -> Dict[str, Any]:
+    """
+    검색 필터 검증 + 정리 (값이 있는 것만 담은 dict).
+    날짜는 YYYYMMDD 정수, CPC prefix 는 대문자로 바꾼다.
+    """
+    filters: Dict[str, Any] = {}
+    for name, value in (
+        ("publication_date_from", publication_date_from),
+        ("publication_date_to", publication_date_to),
+        ("filing_date_from", filing_date_from),
+        ("filing_date_to", filing_date_to),
+    ):
+        date_value = _to_date_int(value, name)
+        if date_value is not None:
+            filters[name] = date_value
+
+    for column in ("publication_date", "filing_date"):
+        start, end = filters.get(f"{column}_from"), filters.get(f"{column}_to")
+        if start and end and start > end:
+            raise ValueError(f"{column}_from 이 {column}_to 보다 늦습니다: {start} > {end}")
+
+    prefixes = sorted({p.strip().upper() for p in (cpc_prefixes or []) if p and p.strip()})
+    if prefixes:
+        filters["cpc_prefixes"] = prefixes
+
+    return filters
+
+
+def _filter_conditions(
+    filters: Dict[str, Any] | None,
+    param_prefix: str = "",
+) -> tuple[List[str], list]:
+    """
+    날짜/CPC 필터 -> WHERE 조건 목록 + 쿼리 파라미터.
+    날짜는 컬럼을 함수로 감싸지 않고 정수 그대로 비교해서
+    BigQuery가 블록 단위로 건너뛸 수 있는 형태(범위 조건)로 둔다.
+    """
+    conditions: List[str] = []
+    query_params = []
+
+    for column in ("publication_date", "filing_date"):
+        for suffix, op in (("from", ">="), ("to", "<=")):
+            name = f"{column}_{suffix}"
+            if filters and filters.get(name):
+                conditions.append(f"{column} {op} @{param_prefix}{name}")
+                query_params.append(
+                    bigquery.ScalarQueryParameter(f"{param_prefix}{name}", "INT64", filters[name])
+                )
+
+    if filters and filters.get("cpc_prefixes"):
+        # prefix 여러 개를 OR 로 묶기 위해 배열 파라미터 + EXISTS 사용
+        conditions.append(
+            "EXISTS (SELECT 1 FROM UNNEST(cpc) AS c, "
+            f"UNNEST(@{param_prefix}cpc_prefixes) AS prefix WHERE STARTS_WITH(c.code, prefix))"
+        )
+        query_params.append(
+            bigquery.ArrayQueryParameter(f"{param_prefix}cpc_prefixes", "STRING", filters["cpc_prefixes"])
+        )
+
+    return conditions, query_params
+
+
+def _search_conditions(
+    keyword_list: List[str],
+    country_codes: List[str] | None = None,
+    param_prefix: str = "",
+    match: str | None = None,
+    filters: Dict[str, Any] | None = None,
+) -> tuple[str, list]:
     """
-    client = bigquery.Client(project=PROJECT_ID)
+    키워드/국가/필터(search_filters) 검색 조건(WHERE 절)과 쿼리 파라미터 생성.
+    param_prefix 는 여러 검색 조건을 한 쿼리에 넣을 때 파라미터 이름이 겹치지 않게 붙인다.
 
-    # 키워드를 리스트로 변환
-    if isinstance(keywords, str):
-        keyword_list = [keywords]
+    match="regexp" 면 키워드 수와 관계없이 REGEXP_CONTAINS 하나로 검사하고,
+    "like" 면 키워드마다 LIKE 조건을 만든다 (None 이면 BQ_KEYWORD_MATCH 설정값).
+    """
+    match = match or KEYWORD_MATCH
+    if match not in KEYWORD_MATCH_MODES:
+        raise ValueError(
+            f"지원하지 않는 키워드 조건 형식: {match} (사용 가능: {', '.join(KEYWORD_MATCH_MODES)})"
+        )
+
+    query_params = []
+
+    if match == "regexp":
+        keyword_conditions = f"REGEXP_CONTAINS(LOWER(tl.text), @{param_prefix}keyword_pattern)"
+        query_params.append(
+            bigquery.ScalarQueryParameter(
+                f"{param_prefix}keyword_pattern", "STRING", _keyword_regexp(keyword_list)
+            )
+        )
     else:
-        keyword_list = keywords
+        # 여러 키워드에 대한 OR 조건 생성
+        keyword_conditions = " OR ".join([
+            f"LOWER(tl.text) LIKE @{param_prefix}pattern_{i}" for i in range(len(keyword_list))
+        ])
+        # 각 키워드에 대한 파라미터 추가
+        for i, kw in enumerate(keyword_list):
+            query_params.append(
+                bigquery.ScalarQueryParameter(
+                    f"{param_prefix}pattern_{i}", "STRING", f"%{kw.lower()}%"
+                )
+            )
+
+    # UNNEST를 사용해서 title_localized 배열 안의 text를 검색
+    condition = f"""EXISTS (
+        SELECT 1
+        FROM UNNEST(title_localized) AS tl
+        WHERE {keyword_conditions}
+      )"""
 
     # 국가 필터 조건 생성
     if country_codes:
-        country_filter = "AND country_code IN UNNEST(@country_codes)"
-    else:
-        country_filter = ""
+        condition += f"\n      AND country_code IN UNNEST(@{param_prefix}country_codes)"
 
-    # 여러 키워드에 대한 OR 조건 생성
-    keyword_conditions = " OR ".join([
-        f"LOWER(tl.text) LIKE @pattern_{i}" for i in range(len(keyword_list))
-    ])
+    if country_codes:
+        query_params.append(
+            bigquery.ArrayQueryParameter(
+                f"{param_prefix}country_codes", "STRING", country_codes
+            )
+        )
+
+    filter_conditions, filter_params = _filter_conditions(filters, param_prefix)
+    for filter_condition in filter_conditions:
+        condition += f"\n      AND {filter_condition}"
+    query_params.extend(filter_params)
+
+    return condition, query_params
+
+
+def _build_search_query(
+    keyword_list: List[str],
+    limit: int,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    match: str | None = None,
+    filters: Dict[str, Any] | None = None,
+) -> tuple[str, bigquery.QueryJobConfig]:
+    """
+    키워드 검색 쿼리와 파라미터(QueryJobConfig) 생성.
+    동기/비동기 검색이 같은 쿼리를 쓰도록 분리해 둔다.
+    fields 에 해당하는 컬럼만 SELECT 한다.
+    """
+    condition, query_params = _search_conditions(
+        keyword_list, country_codes, match=match, filters=filters
+    )
 
-    # UNNEST를 사용해서 title_localized 배열 안의 text를 검색
     query = f"""
     SELECT
-      publication_number,
-      application_number,
-      country_code,
-      title_localized,
-      abstract_localized,
-      publication_date,
-      filing_date,
-      assignee,
-      assignee_harmonized,
-      inventor,
-      inventor_harmonized,
-      cpc
+      {_select_list(fields)}
     FROM
       `bigquery-public-data.patents.publications`
     WHERE
-      EXISTS (
-        SELECT 1
-        FROM UNNEST(title_localized) AS tl
-        WHERE {keyword_conditions}
-      )
-      {country_filter}
+      {condition}
+    ORDER BY {RESULT_ORDER}
     LIMIT @limit;
     """
 
-    query_params = [
+    query_params.append(
         bigquery.ScalarQueryParameter(
             "limit", "INT64", limit
-        ),
-    ]
+        )
+    )
 
-    # 각 키워드에 대한 파라미터 추가
-    for i, kw in enumerate(keyword_list):
-        query_params.append(
-            bigquery.ScalarQueryParameter(
-                f"pattern_{i}", "STRING", f"%{kw.lower()}%"
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=query_params
+    )
+
+    return query, job_config
+
+
+def _assignees_from_row(row) -> List[Dict[str, Any]]:
+    """assignee_harmonized 우선, 없으면 assignee 사용"""
+    assignees = _normalize_assignee(row.assignee_harmonized)
+    if not assignees:
+        assignees = _normalize_assignee(row.assignee)
+    return assignees
+
+
+def _inventors_from_row(row) -> List[Dict[str, Any]]:
+    """inventor_harmonized 우선, 없으면 inventor 사용"""
+    inventors = _normalize_inventor(row.inventor_harmonized)
+    if not inventors:
+        inventors = _normalize_inventor(row.inventor)
+    return inventors
+
+
+# 필드별 row -> 값 변환 함수 (요청한 필드의 _normalize_* 만 실행하기 위함)
+_FIELD_EXTRACTORS = {
+    "publication_number": lambda row: row.publication_number,
+    "application_number": lambda row: row.application_number,
+    "country_code": lambda row: row.country_code,
+    "title_localized": lambda row: _normalize_title_localized(row.title_localized),
+    "abstract_localized": lambda row: _normalize_localized_text(row.abstract_localized),
+    "publication_date": lambda row: _normalize_date(row.publication_date),
+    "filing_date": lambda row: _normalize_date(row.filing_date),
+    "assignee": _assignees_from_row,
+    "inventor": _inventors_from_row,
+    "cpc": lambda row: _normalize_cpc(row.cpc),
+    "title_by_lang": lambda row: _localized_by_language(_normalize_title_localized(row.title_localized)),
+    "abstract_by_lang": lambda row: _localized_by_language(_normalize_localized_text(row.abstract_localized)),
+}
+
+
+def _iter_search_results(rows, fields: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+    """검색 쿼리 결과 row 를 하나씩 dict 로 정리해서 yield (fields 에 있는 필드만)"""
+    extractors = [(f, _FIELD_EXTRACTORS[f]) for f in _resolve_fields(fields)]
+
+    for row in rows:
+        yield {name: extract(row) for name, extract in extractors}
+
+
+def _search_rows_to_results(rows, fields: List[str] | None = None) -> List[Dict[str, Any]]:
+    """검색 쿼리 결과 row 들을 dict 리스트로 정리 (fields 에 있는 필드만)"""
+    return list(_iter_search_results(rows, fields))
+
+
+def _job_to_search_results(job: bigquery.QueryJob, fields: List[str]) -> List[Dict[str, Any]]:
+    """
+    완료된 검색 잡의 결과를 정리.
+    BQ_RESULT_PATH=arrow 이고 pyarrow 가 있으면 Arrow 경로, 아니면 row 경로를 쓴다.
+    결과 다운로드(download)와 정규화(normalize)는 따로 span 을 남긴다.
+    """
+    if RESULT_PATH == "arrow" and pa is not None:
+        with span("download"):
+            table = job.to_arrow(create_bqstorage_client=False)
+        with span("normalize"):
+            return arrow_table_to_results(table, fields)
+
+    with span("download"):
+        rows = list(job.result())
+    with span("normalize"):
+        return _search_rows_to_results(rows, fields)
+
+
+def _resolve_backend(backend: str | None) -> str:
+    """backend 이름 검증 (None 이면 기본값)"""
+    backend = (backend or DEFAULT_SEARCH_BACKEND).lower()
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(
+            f"지원하지 않는 backend: {backend} (사용 가능: {', '.join(SEARCH_BACKENDS)})"
+        )
+    return backend
+
+
+def _search_local(
+    keyword_list: List[str],
+    limit: int,
+    country_codes: List[str] | None,
+    fields: List[str],
+    backend: str | None,
+    filters: Dict[str, Any] | None = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    backend 설정에 따라 로컬 스토어에서 검색.
+    BigQuery 로 넘어가야 하면 None 을 반환한다.
+    """
+    backend = _resolve_backend(backend)
+    if backend == "bigquery":
+        return None
+
+    store = get_local_store()
+    if store is None:
+        if backend == "local":
+            raise ValueError(
+                f"로컬 스토어가 없습니다: {DEFAULT_STORE_PATH} "
+                "(python bigquery_patents_tool.py materialize 로 먼저 생성)"
             )
+        return None
+
+    if backend == "auto" and not store.covers(country_codes, filters):
+        return None
+
+    with span("local_search"):
+        records = store.search(keyword_list, limit=limit, country_codes=country_codes, filters=filters)
+    if not records and backend == "auto":
+        return None
+
+    results = []
+    for record in records:
+        # 언어별 lookup 이 생기기 전에 추출한 스토어는 여기서 채운다
+        record.setdefault("title_by_lang", _localized_by_language(record.get("title_localized")))
+        record.setdefault("abstract_by_lang", _localized_by_language(record.get("abstract_localized")))
+        results.append({f: record.get(f) for f in fields})
+    return results
+
+
+def _split_languages(languages: str | List[str] | None) -> List[str]:
+    """언어 코드 목록 정리 (소문자, 순서 유지, 중복 제거)"""
+    if isinstance(languages, str):
+        languages = languages.split(",")
+    seen: List[str] = []
+    for lang in languages or []:
+        lang = lang.strip().lower()
+        if lang and lang not in seen:
+            seen.append(lang)
+    return seen
+
+
+def _pick_language(by_lang: Dict[str, str], languages: List[str]) -> Optional[str]:
+    """선호 언어 순서대로 첫 번째로 있는 텍스트"""
+    for lang in languages:
+        text = by_lang.get(lang)
+        if text:
+            return text
+    return None
+
+
+def select_languages(
+    results: Iterable[Dict[str, Any]],
+    languages: str | List[str] | None,
+) -> List[Dict[str, Any]]:
+    """
+    검색 결과에서 요청한 언어만 남기고, 선호 언어 순서(fallback chain)로 대표 텍스트를 고른다.
+
+    - title_localized / abstract_localized / *_by_lang 은 languages 에 있는 언어만 남긴다
+    - title / abstract 필드를 추가: languages 순서대로 처음 있는 언어의 텍스트 (없으면 None)
+    - 원래 결과(캐시에 있는 값일 수 있음)는 바꾸지 않고 새 dict 를 만든다
+
+    Args:
+        languages: 선호 언어 순서 (예: ["ko", "en"] 또는 "ko,en"). 비어 있으면 결과를 그대로 돌려준다.
+    """
+    chain = _split_languages(languages)
+    if not chain:
+        return list(results)
+
+    wanted = set(chain)
+    selected = []
+    for item in results:
+        item = dict(item)
+        for name in ("title", "abstract"):
+            localized_key, by_lang_key = f"{name}_localized", f"{name}_by_lang"
+            if localized_key not in item and by_lang_key not in item:
+                continue
+
+            by_lang = item.get(by_lang_key)
+            if by_lang is None:
+                by_lang = _localized_by_language(item.get(localized_key))
+            item[name] = _pick_language(by_lang, chain)
+
+            if by_lang_key in item:
+                item[by_lang_key] = {lang: by_lang[lang] for lang in chain if lang in by_lang}
+            if item.get(localized_key) is not None:
+                item[localized_key] = [
+                    t for t in item[localized_key] if t.get("language") in wanted
+                ]
+        selected.append(item)
+    return selected
+
+
+def search_patents_by_keyword(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    use_cache: bool = True,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    backend: str | None = None,
+    expand_synonyms: bool | None = None,
+    publication_date_from: int | str | None = None,
+    publication_date_to: int | str | None = None,
+    filing_date_from: int | str | None = None,
+    filing_date_to: int | str | None = None,
+    cpc_prefixes: List[str] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    제목에 keyword가 들어가는 특허 검색
+
+    Args:
+        keywords: 검색 키워드 (문자열 또는 리스트).
+                  예: "graphite" 또는 ["graphite", "흑연", "그래파이트"]
+        limit: 검색 결과 수 제한
+        country_codes: 국가 코드 리스트 (예: ["US", "KR"]). None이면 전체 국가.
+        use_cache: True면 같은 조건(키워드/국가 순서, 대소문자 무관)의
+                   이전 결과를 캐시에서 돌려준다.
+        fields: 결과에 포함할 필드 (SEARCH_FIELDS 의 키). None이면 기본 필드 (*_by_lang 제외).
+                예: ["publication_number", "publication_date", "title_localized"]
+        maximum_bytes_billed: 이 쿼리의 최대 과금 바이트.
+                              서버 한도(BQ_MAX_BYTES_BILLED_PER_QUERY)보다 크면 서버 한도를 쓴다.
+        backend: "bigquery" / "local" / "auto". None이면 PATENT_SEARCH_BACKEND 설정값.
+        expand_synonyms: True면 동의어 사전(keyword_synonyms.json)으로 키워드를 확장한다.
+                         예: "graphite" 만 넘겨도 흑연/그래파이트/石墨 등으로 같이 검색.
+                         None이면 PATENT_EXPAND_SYNONYMS 설정값.
+        publication_date_from / publication_date_to: 공개일 범위 (YYYYMMDD 또는 YYYY-MM-DD)
+        filing_date_from / filing_date_to: 출원일 범위 (YYYYMMDD 또는 YYYY-MM-DD)
+        cpc_prefixes: CPC 코드 prefix (예: ["C01B32", "H01M4"]). 하나라도 맞으면 포함.
+
+    Raises:
+        BytesBudgetExceeded: 일일 한도(BQ_DAILY_BYTES_BUDGET)가 설정돼 있고
+                             dry run 추정치가 잔여 한도를 넘는 경우
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+    filters = search_filters(
+        publication_date_from, publication_date_to, filing_date_from, filing_date_to, cpc_prefixes
+    )
+
+    local_results = _search_local(
+        keyword_list, limit, country_codes, selected_fields, backend, filters
+    )
+    if local_results is not None:
+        return local_results
+
+    cache = get_cache() if use_cache else None
+    cache_key = make_search_key(
+        keyword_list, country_codes, limit, fields=selected_fields, filters=filters
+    )
+    if cache is not None:
+        with span("cache_lookup"):
+            cached = cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+    client = get_client(PROJECT_ID)
+
+    query, job_config = _build_search_query(
+        keyword_list, limit, country_codes, selected_fields, filters=filters
+    )
+
+    # 1건/일일 한도가 있으면 실행 전에 dry run 으로 스캔량을 확인
+    if needs_estimate(maximum_bytes_billed):
+        with span("dry_run"):
+            estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0, maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    with span("bigquery_submit"):
+        job = client.query(query, job_config=job_config)
+    # 동기 경로는 잡 완료 대기가 download span 에 포함된다 (BigQuery 쪽 대기/실행 시간은 job_stats 참고)
+    results = _job_to_search_results(job, selected_fields)
+    record_job(job, "search", filters=filters)
+
+    if cache is not None:
+        with span("cache_store"):
+            cache.set(cache_key, results)
+
+    return results
+
+
+def iter_search_patents_by_keyword(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    backend: str | None = None,
+    page_size: int = 100,
+    filters: Dict[str, Any] | None = None,
+    expand_synonyms: bool | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    search_patents_by_keyword 의 generator 버전.
+    전체 결과를 리스트로 모으지 않고, BigQuery 결과 페이지가 도착하는 대로
+    정규화한 특허 dict 를 하나씩 yield 한다.
+    (결과를 모으지 않으므로 캐시에는 저장하지 않는다)
+
+    Args:
+        page_size: BigQuery 결과를 한 번에 받아오는 row 수
+        filters: search_filters() 로 만든 날짜/CPC 필터
+        나머지는 search_patents_by_keyword 와 같다.
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    local_results = _search_local(
+        keyword_list, limit, country_codes, selected_fields, backend, filters
+    )
+    if local_results is not None:
+        yield from local_results
+        return
+
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_search_query(
+        keyword_list, limit, country_codes, selected_fields, filters=filters
+    )
+
+    if needs_estimate(maximum_bytes_billed):
+        estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0, maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    job = client.query(query, job_config=job_config)
+
+    try:
+        for page in job.result(page_size=page_size).pages:
+            yield from _iter_search_results(page, selected_fields)
+    finally:
+        # 호출 측이 중간에 멈추거나(close) 예외가 나도 실행된 잡은 사용량에 기록
+        record_job(job, "search", filters=filters)
+
+
+def _normalize_batch_specs(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    배치 검색 조건 정리.
+    각 spec: {"keywords": str | List[str], "country_codes": List[str] | None, "limit": int,
+              "filters": search_filters() 결과 (선택)}
+    """
+    if not specs:
+        raise ValueError("배치 검색 조건이 비어 있습니다.")
+    if len(specs) > MAX_BATCH_SPECS:
+        raise ValueError(f"배치 검색 조건은 최대 {MAX_BATCH_SPECS}개까지 가능합니다.")
+
+    normalized = []
+    for spec in specs:
+        try:
+            keyword_list = _to_keyword_list(spec.get("keywords"))
+        except ValueError:
+            raise ValueError("모든 배치 검색 조건에 keywords 가 필요합니다.")
+        normalized.append({
+            "keywords": keyword_list,
+            "country_codes": spec.get("country_codes") or None,
+            "limit": int(spec.get("limit", 20)),
+            "filters": spec.get("filters") or {},
+        })
+    return normalized
+
+
+def _build_batch_search_query(
+    specs: List[Dict[str, Any]],
+    fields: List[str] | None = None,
+) -> tuple[str, bigquery.QueryJobConfig]:
+    """
+    여러 검색 조건을 테이블 한 번 스캔으로 처리하는 쿼리 생성.
+
+    - 각 row 가 어떤 조건(spec_id)에 해당하는지 배열로 표시하고
+    - spec_id 별로 단건 검색과 같은 순서(RESULT_ORDER)로 ROW_NUMBER 를 매겨 조건마다 limit 건까지만 남긴다
+      (순서가 없으면 어떤 row 가 남을지 실행마다 달라서 캐시 결과와 새 쿼리 결과가 달라질 수 있다)
+    조건마다 UNION ALL 로 쿼리를 붙이면 조건 수만큼 테이블을 스캔하므로 이 방식을 쓴다.
+    """
+    conditions: List[str] = []
+    query_params = []
+    for i, spec in enumerate(specs):
+        condition, params = _search_conditions(
+            spec["keywords"], spec["country_codes"], param_prefix=f"s{i}_",
+            filters=spec.get("filters"),
+        )
+        conditions.append(condition)
+        query_params.extend(params)
+        query_params.append(
+            bigquery.ScalarQueryParameter(f"s{i}_limit", "INT64", spec["limit"])
         )
 
+    spec_ids = ",\n        ".join(
+        f"IF({condition}, [{i}], [])" for i, condition in enumerate(conditions)
+    )
+    any_condition = "\n      OR ".join(f"({condition})" for condition in conditions)
+    limit_cases = " ".join(f"WHEN {i} THEN @s{i}_limit" for i in range(len(specs)))
+
+    query = f"""
+    WITH matched AS (
+      SELECT
+        {_select_list(fields)},
+        publication_date AS order_date,
+        publication_number AS order_number,
+        ARRAY_CONCAT(
+        {spec_ids}
+        ) AS spec_ids
+      FROM
+        `bigquery-public-data.patents.publications`
+      WHERE
+        {any_condition}
+    ),
+    ranked AS (
+      SELECT
+        m.* EXCEPT (spec_ids, order_date, order_number),
+        spec_id,
+        ROW_NUMBER() OVER (
+          PARTITION BY spec_id ORDER BY m.order_date DESC, m.order_number
+        ) AS spec_rank
+      FROM matched AS m, UNNEST(m.spec_ids) AS spec_id
+    )
+    SELECT *
+    FROM ranked
+    WHERE spec_rank <= CASE spec_id {limit_cases} END
+    ORDER BY spec_id, spec_rank;
+    """
+
+    return query, bigquery.QueryJobConfig(query_parameters=query_params)
+
+
+def _split_batch_results(rows, num_specs: int, fields: List[str]) -> List[List[Dict[str, Any]]]:
+    """배치 쿼리 결과를 spec_id 기준으로 조건별 결과 리스트로 나눈다"""
+    grouped: List[List[Any]] = [[] for _ in range(num_specs)]
+    for row in rows:
+        grouped[row.spec_id].append(row)
+    return [_search_rows_to_results(group, fields) for group in grouped]
+
+
+def _cached_list(cache, key: str) -> Optional[List[Dict[str, Any]]]:
+    """캐시 조회 결과를 dict 리스트로 (메모리 캐시는 PatentRecordList 를 돌려주므로)"""
+    if cache is None:
+        return None
+    cached = cache.get(key)
+    return list(cached) if cached is not None else None
+
+
+def _batch_cache_keys(specs: List[Dict[str, Any]], fields: List[str]) -> List[str]:
+    """배치 조건별 캐시 키 (단건 검색과 같은 키를 써서 캐시를 공유)"""
+    return [
+        make_search_key(
+            spec["keywords"], spec["country_codes"], spec["limit"], fields=fields, filters=spec["filters"]
+        )
+        for spec in specs
+    ]
+
+
+def search_patents_batch(
+    specs: List[Dict[str, Any]],
+    fields: List[str] | None = None,
+    use_cache: bool = True,
+    maximum_bytes_billed: int | None = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 검색 조건을 BigQuery 잡 하나(테이블 스캔 1회)로 처리.
+
+    Args:
+        specs: 검색 조건 리스트.
+               예: [{"keywords": ["graphite", "흑연"], "country_codes": ["US"], "limit": 6},
+                    {"keywords": ["graphite", "흑연"], "country_codes": ["KR"], "limit": 6}]
+        fields: 결과 필드 (모든 조건에 공통)
+        use_cache: True면 캐시에 있는 조건은 쿼리에서 빼고 캐시 결과를 쓴다
+        maximum_bytes_billed: 배치 쿼리의 최대 과금 바이트
+
+    Returns:
+        specs 와 같은 순서의 조건별 결과 리스트
+    """
+    normalized = _normalize_batch_specs(specs)
+    selected_fields = _resolve_fields(fields)
+
+    cache = get_cache() if use_cache else None
+    cache_keys = _batch_cache_keys(normalized, selected_fields)
+    results: List[Optional[List[Dict[str, Any]]]] = [
+        _cached_list(cache, key) for key in cache_keys
+    ]
+
+    pending = [i for i, r in enumerate(results) if r is None]
+    if not pending:
+        return results
+
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_batch_search_query([normalized[i] for i in pending], selected_fields)
+
+    if needs_estimate(maximum_bytes_billed):
+        estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0, maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    job = client.query(query, job_config=job_config)
+    fetched = _split_batch_results(job, len(pending), selected_fields)
+    record_job(job, "batch", specs=len(pending))
+
+    for i, spec_results in zip(pending, fetched):
+        results[i] = spec_results
+        if cache is not None:
+            cache.set(cache_keys[i], spec_results)
+
+    return results
+
+
+def _table_id(table_ref) -> str:
+    """TableReference -> 'project.dataset.table'"""
+    return f"{table_ref.project}.{table_ref.dataset_id}.{table_ref.table_id}"
+
+
+def _page_info(
+    table_id: str,
+    start_index: int,
+    page_size: int,
+    total_rows: int,
+    fields: List[str],
+    expand: bool,
+) -> Dict[str, Any]:
+    """
+    현재 페이지 정보 + 다음 페이지 토큰 (마지막 페이지면 None).
+    토큰에는 첫 페이지 쿼리의 동의어 확장 여부도 넣어서, 다음 페이지 요청의 expand 값과 비교한다.
+    """
+    next_start = start_index + page_size
+    next_token = None
+    if next_start < total_rows:
+        next_token = encode_page_token({
+            "table": table_id,
+            "start": next_start,
+            "size": page_size,
+            "total": total_rows,
+            "fields": fields,
+            "expand": expand,
+        })
+
+    return {
+        "start_index": start_index,
+        "total_rows": total_rows,
+        "next_page_token": next_token,
+    }
+
+
+def _first_page_from_job(
+    job: bigquery.QueryJob,
+    page_size: int,
+    fields: List[str],
+    expand: bool,
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """완료된 검색 잡에서 첫 페이지를 읽고, 결과 테이블 위치를 다음 페이지 토큰에 담는다"""
+    rows = job.result(max_results=page_size)
+    results = _search_rows_to_results(rows, fields)
+    info = _page_info(_table_id(job.destination), 0, page_size, rows.total_rows or 0, fields, expand)
+    return results, info
+
+
+def _page_from_token(
+    client: bigquery.Client,
+    page_token: str,
+    expand_synonyms: bool | None = None,
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    페이지 토큰이 가리키는 결과 테이블 구간만 읽는다.
+    쿼리를 다시 실행하지 않으므로 스캔 비용이 없다.
+    expand_synonyms 를 주면 토큰을 만든 첫 페이지 쿼리의 확장 여부와 같아야 한다 (다르면 ValueError).
+    """
+    state = decode_page_token(page_token)
+    expand = state.get("expand", False)
+    if expand_synonyms is not None and expand_synonyms != expand:
+        raise ValueError(
+            f"page_token 은 expand={str(expand).lower()} 로 만든 결과입니다. "
+            "다른 expand 값으로 검색하려면 첫 페이지부터 다시 요청하세요."
+        )
+    rows = client.list_rows(state["table"], start_index=state["start"], max_results=state["size"])
+    results = _search_rows_to_results(rows, state["fields"])
+    info = _page_info(state["table"], state["start"], state["size"], state["total"], state["fields"], expand)
+    return results, info
+
+
+def _check_page_backend(backend: str | None) -> None:
+    """
+    페이지 단위 검색은 BigQuery 결과 테이블을 나눠 읽으므로 bigquery / auto 에서만 쓸 수 있다.
+    local 이면 (기본값이 local 인 오프라인 모드 포함) ValueError.
+    """
+    if _resolve_backend(backend) == "local":
+        raise ValueError("페이지 단위 검색(paginate / page_token)은 local backend 에서 지원하지 않습니다.")
+
+
+def search_patents_page(
+    keywords: str | List[str] | None = None,
+    page_size: int = 20,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    max_results: int = DEFAULT_PAGINATION_MAX_RESULTS,
+    page_token: str | None = None,
+    maximum_bytes_billed: int | None = None,
+    filters: Dict[str, Any] | None = None,
+    backend: str | None = None,
+    expand_synonyms: bool | None = None,
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    페이지 단위 키워드 검색 (BigQuery 전용, 캐시/로컬 스토어 미사용).
+
+    - page_token 이 없으면 LIMIT max_results 로 쿼리를 한 번 실행하고 첫 페이지를 돌려준다
+    - page_token 이 있으면 그 잡의 결과 테이블에서 다음 구간만 읽는다 (재스캔 없음)
+    - BigQuery 임시 결과 테이블은 약 24시간 뒤 삭제되므로 토큰도 그때까지만 유효하다
+    - backend 가 local 이면 ValueError. expand_synonyms 는 첫 페이지 쿼리에 적용되고 토큰에 기록된다
+
+    Returns:
+        (results, page_info)
+        page_info: start_index, total_rows, next_page_token (마지막 페이지면 None)
+    """
+    _check_page_backend(backend)
+    client = get_client(PROJECT_ID)
+
+    if page_token:
+        return _page_from_token(client, page_token, expand_synonyms)
+
+    if not keywords:
+        raise ValueError("첫 페이지 검색에는 keywords 가 필요합니다.")
+
+    expand = EXPAND_SYNONYMS if expand_synonyms is None else expand_synonyms
+    keyword_list = _to_keyword_list(keywords, expand)
+    selected_fields = _resolve_fields(fields)
+    query, job_config = _build_search_query(
+        keyword_list, max_results, country_codes, selected_fields, filters=filters
+    )
+
+    if needs_estimate(maximum_bytes_billed):
+        estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0, maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    job = client.query(query, job_config=job_config)
+    page = _first_page_from_job(job, page_size, selected_fields, expand)
+    record_job(job, "search_page", filters=filters)
+
+    return page
+
+
+def estimate_search_patents(
+    keywords: str | List[str],
+    limit: int = 20,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    maximum_bytes_billed: int | None = None,
+    filters: Dict[str, Any] | None = None,
+    expand_synonyms: bool | None = None,
+) -> Dict[str, Any]:
+    """
+    search_patents_by_keyword 와 같은 조건의 쿼리를 dry run 으로 실행해서
+    스캔 바이트와 예상 비용만 구한다 (과금 없음, 결과 없음).
+    LIMIT 은 스캔량을 줄이지 않으므로 limit 값과 무관하게 추정치는 같다.
+    expand_synonyms 도 검색과 같게 줘야 같은 조건(확장된 키워드)으로 추정한다.
+    """
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_search_query(
+        keyword_list, limit, country_codes, selected_fields, filters=filters
+    )
+    job = client.query(query, job_config=dry_run_config(job_config))
+
+    return _estimate_summary(job.total_bytes_processed or 0, selected_fields, maximum_bytes_billed)
+
+
+def _estimate_summary(
+    estimated_bytes: int,
+    fields: List[str],
+    maximum_bytes_billed: int | None = None,
+) -> Dict[str, Any]:
+    """dry run 추정치 + 한도 정보를 응답용 dict 로 정리"""
+    cap = resolve_max_bytes_billed(maximum_bytes_billed)
+    remaining = daily_budget.remaining()
+
+    return {
+        "fields": fields,
+        "estimated_bytes_processed": estimated_bytes,
+        "estimated_cost_usd": estimate_cost_usd(estimated_bytes),
+        "maximum_bytes_billed": cap,
+        "daily_remaining_bytes": remaining,
+        "within_limits": (not cap or estimated_bytes <= cap)
+                         and (remaining is None or estimated_bytes <= remaining),
+    }
+
+
+def _build_materialize_query(
+    country_codes: List[str] | None = None,
+    cpc_prefixes: List[str] | None = None,
+    publication_date_from: int | None = None,
+    publication_date_to: int | None = None,
+    limit: int | None = None,
+) -> tuple[str, bigquery.QueryJobConfig]:
+    """로컬 스토어로 추출할 slice 쿼리 생성 (검색 결과와 같은 컬럼 전체)"""
+    select_list = _select_list(None)
+
+    conditions = ["TRUE"]
+    query_params = []
+
     if country_codes:
+        conditions.append("country_code IN UNNEST(@country_codes)")
         query_params.append(
-            bigquery.ArrayQueryParameter(
-                "country_codes", "STRING", country_codes
-            )
+            bigquery.ArrayQueryParameter("country_codes", "STRING", country_codes)
         )
 
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=query_params
+    filter_conditions, filter_params = _filter_conditions(search_filters(
+        publication_date_from=publication_date_from,
+        publication_date_to=publication_date_to,
+        cpc_prefixes=cpc_prefixes,
+    ))
+    conditions.extend(filter_conditions)
+    query_params.extend(filter_params)
+
+    limit_clause = ""
+    if limit:
+        limit_clause = "LIMIT @limit"
+        query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
+
+    query = f"""
+    SELECT
+      {select_list}
+    FROM
+      `bigquery-public-data.patents.publications`
+    WHERE
+      {" AND ".join(conditions)}
+    {limit_clause}
+    """
+
+    return query, bigquery.QueryJobConfig(query_parameters=query_params)
+
+
+def materialize_local_store(
+    path: str = DEFAULT_STORE_PATH,
+    country_codes: List[str] | None = None,
+    cpc_prefixes: List[str] | None = None,
+    publication_date_from: int | None = None,
+    publication_date_to: int | None = None,
+    limit: int | None = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    publications 테이블의 일부(slice)를 로컬 스토어로 추출.
+    추출 후에는 backend="local"/"auto" 검색이 BigQuery 없이 로컬 인덱스로 처리된다.
+
+    Args:
+        path: 로컬 스토어(SQLite) 파일 경로
+        country_codes: 추출할 국가 (예: ["US", "KR"]). None이면 전체 국가.
+        cpc_prefixes: 추출할 CPC 코드 prefix (예: ["C01B32", "H01M4"])
+        publication_date_from / publication_date_to: 공개일 범위 (YYYYMMDD)
+        limit: 최대 추출 건수. 추출 건수가 limit 에 닿으면 slice 일부만 있는 것이므로
+               backend="auto" 검색은 이 스토어를 쓰지 않고 BigQuery 로 간다 (backend="local" 은 가능).
+        batch_size: 한 번에 저장할 건수
+
+    Returns:
+        저장한 건수
+    """
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_materialize_query(
+        country_codes, cpc_prefixes, publication_date_from, publication_date_to, limit
     )
+    if needs_estimate():
+        estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0)
 
+    apply_max_bytes_billed(job_config)
     job = client.query(query, job_config=job_config)
-    results: List[Dict[str, Any]] = []
 
-    for row in job:
-        titles = _normalize_title_localized(row.title_localized)
-        abstract = _normalize_localized_text(row.abstract_localized)
-        pub_date = _normalize_date(row.publication_date)
-        filing = _normalize_date(row.filing_date)
+    store = LocalPatentStore(path)
+    total = 0
+    batch = []
+    for row in job.result(page_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            total += store.add_records(_search_rows_to_results(batch))
+            batch = []
+    if batch:
+        total += store.add_records(_search_rows_to_results(batch))
+
+    store.set_slice({
+        "countries": sorted(country_codes or []),
+        "cpc_prefixes": search_filters(cpc_prefixes=cpc_prefixes).get("cpc_prefixes", []),
+        "publication_date_from": publication_date_from,
+        "publication_date_to": publication_date_to,
+        # limit 에 걸려서 잘린 slice 는 auto 모드에서 쓰지 않는다 (covers() 참고)
+        "limit": limit,
+        "rows": total,
+    })
+    store.close()
+    record_job(job, "materialize")
+
+    return total
+
+
+def _read_publications_json(json_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    publications row JSON 파일 읽기.
+    bq-google-patents.json 같은 JSON 배열과 BigQuery export(NEWLINE_DELIMITED_JSON) 둘 다 허용.
+    """
+    with open(json_path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
 
-        # assignee_harmonized 우선, 없으면 assignee 사용
-        assignees = _normalize_assignee(row.assignee_harmonized)
-        if not assignees:
-            assignees = _normalize_assignee(row.assignee)
+        if first == "[":
+            yield from json.load(f)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
-        # inventor_harmonized 우선, 없으면 inventor 사용
-        inventors = _normalize_inventor(row.inventor_harmonized)
-        if not inventors:
-            inventors = _normalize_inventor(row.inventor)
 
-        cpc_codes = _normalize_cpc(row.cpc)
+def _json_record_to_row(record: Dict[str, Any]) -> Row:
+    """
+    JSON row -> 검색 쿼리 결과와 같은 bigquery Row.
+    검색 쿼리가 SELECT 하는 컬럼만 남기고, 날짜는 BigQuery처럼 INT64 로 바꾼다.
+    """
+    columns = list(dict.fromkeys(c for field in SEARCH_FIELDS.values() for c in field))
+    values = []
+    for column in columns:
+        value = record.get(column)
+        if column in ("publication_date", "filing_date"):
+            value = int(value) if value else None
+        values.append(value)
+    return Row(values, {c: i for i, c in enumerate(columns)})
+
+
+def load_json_local_store(
+    json_paths: List[str],
+    path: str = DEFAULT_STORE_PATH,
+    copies: int = 1,
+    batch_size: int = 1000,
+) -> int:
+    """
+    publications row JSON 파일들을 로컬 스토어로 적재 (BigQuery 호출 없음).
+    BigQuery 검색과 같은 정규화를 거치므로, 적재 후 backend="local" 로
+    FastAPI 서버/정규화 경로를 오프라인에서 같은 결과 모양으로 돌려볼 수 있다.
+    적재한 스토어는 권위 있는(authoritative) 추출본이 아니므로 backend="auto" 에서는 쓰지 않는다.
 
-        results.append({
-            "publication_number": row.publication_number,
-            "application_number": row.application_number,
-            "country_code": row.country_code,
-            "title_localized": titles,
-            "abstract_localized": abstract,
-            "publication_date": pub_date,
-            "filing_date": filing,
-            "assignee": assignees,
-            "inventor": inventors,
-            "cpc": cpc_codes,
-        })
+    Args:
+        json_paths: JSON 파일 경로 목록 (JSON 배열 또는 NDJSON)
+        path: 로컬 스토어(SQLite) 파일 경로
+        copies: 각 row 를 몇 벌 저장할지 (부하 테스트용, 2벌째부터 publication_number 에 -1, -2 … 를 붙인다)
+        batch_size: 한 번에 저장할 건수
 
-    return results
+    Returns:
+        저장한 건수
+    """
+    if copies < 1:
+        raise ValueError(f"copies 는 1 이상이어야 합니다: {copies}")
+
+    store = LocalPatentStore(path)
+    total = 0
+    batch = []
+    for json_path in json_paths:
+        for record in _read_publications_json(json_path):
+            for i in range(copies):
+                copy = record
+                if i:
+                    copy = {**record, "publication_number": f"{record['publication_number']}-{i}"}
+                batch.append(_json_record_to_row(copy))
+                if len(batch) >= batch_size:
+                    total += store.add_records(_search_rows_to_results(batch))
+                    batch = []
+    if batch:
+        total += store.add_records(_search_rows_to_results(batch))
+
+    # 테이블 일부(샘플/복제본)라서 BigQuery 결과를 대신할 수 없다.
+    # covers() 가 항상 False 이므로 auto 에서는 BigQuery 로 넘어가고, backend="local" 일 때만 쓴다
+    store.set_slice({
+        "source": "json",
+        "authoritative": False,
+        "files": [os.path.basename(p) for p in json_paths],
+    })
+    store.close()
+
+    return total
+
+
+def _table_path(table_ref) -> str:
+    """Storage Read API 용 테이블 경로"""
+    return f"projects/{table_ref.project}/datasets/{table_ref.dataset_id}/tables/{table_ref.table_id}"
+
+
+def export_search_to_parquet(
+    keywords: str | List[str],
+    path: str,
+    limit: int = DEFAULT_EXPORT_LIMIT,
+    country_codes: List[str] | None = None,
+    fields: List[str] | None = None,
+    max_streams: int = DEFAULT_EXPORT_STREAMS,
+    maximum_bytes_billed: int | None = None,
+    expand_synonyms: bool | None = None,
+) -> Dict[str, Any]:
+    """
+    키워드 검색 결과를 Parquet 파일로 대량 export.
 
+    쿼리 결과(임시 결과 테이블)를 REST row iterator 대신 BigQuery Storage Read API 로
+    여러 스트림에서 동시에 읽고, 스트림마다 Arrow 배치를 정규화해서 하나의 Parquet 파일에 쓴다.
+    (스트림 간 순서는 보장하지 않는다. 결과가 0건이면 파일을 만들지 않는다)
 
-if __name__ == "__main__":
+    Args:
+        keywords / country_codes / fields / maximum_bytes_billed / expand_synonyms: search_patents_by_keyword 와 같다.
+        path: 저장할 Parquet 파일 경로
+        limit: 최대 export 건수
+        max_streams: 동시에 읽을 최대 스트림 수 (실제 수는 BigQuery가 결과 크기에 맞춰 정함)
+
+    Returns:
+        path, rows, streams, job_id, total_bytes_processed, total_bytes_billed
+    """
+    if pq is None or bigquery_storage is None:
+        raise ImportError(
+            "export 에는 pyarrow 와 google-cloud-bigquery-storage 가 필요합니다: "
+            "pip install pyarrow google-cloud-bigquery-storage"
+        )
+
+    keyword_list = _to_keyword_list(keywords, expand_synonyms)
+    selected_fields = _resolve_fields(fields)
+
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_search_query(keyword_list, limit, country_codes, selected_fields)
+
+    if needs_estimate(maximum_bytes_billed):
+        estimate = client.query(query, job_config=dry_run_config(job_config))
+        check_estimate(estimate.total_bytes_processed or 0, maximum_bytes_billed)
+
+    apply_max_bytes_billed(job_config, maximum_bytes_billed)
+    job = client.query(query, job_config=job_config)
+    job.result()
+    record_job(job, "export")
+
+    read_client = bigquery_storage.BigQueryReadClient()
+    session = read_client.create_read_session(
+        parent=f"projects/{PROJECT_ID}",
+        read_session=bigquery_storage.types.ReadSession(
+            table=_table_path(job.destination),
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+        ),
+        max_stream_count=max_streams,
+    )
+
+    writer = None
+    write_lock = threading.Lock()
+    rows_written = 0
+
+    def read_stream(stream_name: str) -> None:
+        nonlocal writer, rows_written
+
+        reader = read_client.read_rows(stream_name)
+        for page in reader.rows(session).pages:
+            # 디코딩 + 정규화는 스트림별 스레드에서, 파일 쓰기만 lock 으로 순서대로
+            table = normalize_arrow_table(pa.Table.from_batches([page.to_arrow()]), selected_fields)
+            with write_lock:
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows_written += table.num_rows
+
+    try:
+        if session.streams:
+            with ThreadPoolExecutor(max_workers=len(session.streams)) as executor:
+                futures = [executor.submit(read_stream, s.name) for s in session.streams]
+                for future in futures:
+                    future.result()
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return {
+        "path": path if writer is not None else None,
+        "rows": rows_written,
+        "streams": len(session.streams),
+        "job_id": job.job_id,
+        "total_bytes_processed": job.total_bytes_processed,
+        "total_bytes_billed": job.total_bytes_billed,
+    }
+
+
+def _run_demo() -> None:
+    """영어 + 한국어 키워드 검색 데모 (인자 없이 실행했을 때)"""
     # 영어 + 한국어 키워드로 검색
     keywords = ["graphite", "흑연", "그래파이트"]
 
@@ -362,3 +1560,83 @@ if __name__ == "__main__":
     for item in kr_items:
         first_title = item["title_localized"][0]["text"] if item["title_localized"] else ""
         print(f"[{item['country_code']}] {item['publication_number']}: {first_title}")
+
+
+def _split_csv(value: str | None) -> List[str] | None:
+    if not value:
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()] or None
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Google Patents BigQuery 도구")
+    subparsers = parser.add_subparsers(dest="command")
+
+    materialize = subparsers.add_parser(
+        "materialize", help="publications 일부를 로컬 검색 스토어(SQLite FTS5)로 추출"
+    )
+    materialize.add_argument("--db", default=DEFAULT_STORE_PATH, help="로컬 스토어 파일 경로")
+    materialize.add_argument("--countries", help="국가 코드 (쉼표 구분, 예: US,KR)")
+    materialize.add_argument("--cpc-prefix", help="CPC prefix (쉼표 구분, 예: C01B32,H01M4)")
+    materialize.add_argument("--from", dest="date_from", type=int, help="공개일 시작 (YYYYMMDD)")
+    materialize.add_argument("--to", dest="date_to", type=int, help="공개일 끝 (YYYYMMDD)")
+    materialize.add_argument("--limit", type=int, help="최대 추출 건수")
+
+    load_json = subparsers.add_parser(
+        "load-json", help="publications row JSON 파일을 로컬 검색 스토어로 적재 (오프라인 테스트용)"
+    )
+    load_json.add_argument("files", nargs="+", help="JSON 배열 또는 NDJSON 파일 (예: bq-google-patents.json)")
+    load_json.add_argument("--db", default=DEFAULT_STORE_PATH, help="로컬 스토어 파일 경로")
+    load_json.add_argument("--copies", type=int, default=1, help="row 당 저장할 벌 수 (부하 테스트용)")
+
+    export = subparsers.add_parser(
+        "export", help="키워드 검색 결과를 Storage Read API 로 읽어 Parquet 파일로 저장"
+    )
+    export.add_argument("keywords", help="검색 키워드 (쉼표 구분, 예: graphite,흑연)")
+    export.add_argument("--out", required=True, help="저장할 Parquet 파일 경로")
+    export.add_argument("--countries", help="국가 코드 (쉼표 구분, 예: US,KR)")
+    export.add_argument("--fields", help="결과 필드 (쉼표 구분, 기본값: 전체)")
+    export.add_argument("--limit", type=int, default=DEFAULT_EXPORT_LIMIT, help="최대 export 건수")
+    export.add_argument("--streams", type=int, default=DEFAULT_EXPORT_STREAMS, help="최대 병렬 스트림 수")
+    export.add_argument(
+        "--expand", action=argparse.BooleanOptionalAction, default=None,
+        help="동의어/번역어 확장 여부 (기본값: PATENT_EXPAND_SYNONYMS)",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "materialize":
+        countries = _split_csv(args.countries)
+        total = materialize_local_store(
+            path=args.db,
+            country_codes=[c.upper() for c in countries] if countries else None,
+            cpc_prefixes=_split_csv(args.cpc_prefix),
+            publication_date_from=args.date_from,
+            publication_date_to=args.date_to,
+            limit=args.limit,
+        )
+        print(f"{total:,}건을 {args.db} 에 저장했습니다.")
+    elif args.command == "load-json":
+        total = load_json_local_store(args.files, path=args.db, copies=args.copies)
+        print(f"{total:,}건을 {args.db} 에 저장했습니다. (PATENT_SEARCH_BACKEND=local 로 사용)")
+    elif args.command == "export":
+        countries = _split_csv(args.countries)
+        summary = export_search_to_parquet(
+            _split_csv(args.keywords) or [],
+            path=args.out,
+            limit=args.limit,
+            country_codes=[c.upper() for c in countries] if countries else None,
+            fields=_split_csv(args.fields),
+            max_streams=args.streams,
+            expand_synonyms=args.expand,
+        )
+        print(
+            f"{summary['rows']:,}건을 {args.out} 에 저장했습니다 "
+            f"(스트림 {summary['streams']}개, 과금 {summary['total_bytes_billed'] or 0:,} bytes)."
+        )
+    else:
+        _run_demo()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# 파일명: encode_benchmark.py
+# 검색 응답 직렬화 비교: FastAPI 기본 경로 vs orjson (+ gzip/brotli 압축)
+#
+# 제목/요약/CPC 가 모두 들어 있는 검색 결과 N건(기본 100건)을 만들어서
+#   - jsonable_encoder: FastAPI 가 응답 모델 없이 dict 를 돌려줄 때의 경로 (jsonable_encoder + json.dumps)
+#   - response_model:   반환 타입으로 검증/직렬화하는 경로 (pydantic + json.dumps)
+#   - orjson:           response_encoding.dumps (검증/복사 없이 바로 bytes)
+# 의 인코딩 시간과, 압축 방식별 응답 크기/압축 시간을 잰다. BigQuery 호출 없음.
+#
+# 사용 예:
+#   python encode_benchmark.py --rows 20 100 --repeat 20 --report encode_benchmark.md
+
+import argparse
+import json
+from datetime import datetime
+from typing import List, Dict, Any
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse
+
+from normalize_benchmark import SAMPLE_PATH, _best_seconds
+from record_memory_benchmark import _search_results_json
+from response_encoding import brotli, compress, dumps, orjson
+
+_RESPONSE_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+
+def _encode_jsonable(results) -> bytes:
+    return JSONResponse(content=jsonable_encoder(results)).body
+
+
+def _encode_response_model(results) -> bytes:
+    content = _RESPONSE_ADAPTER.dump_python(_RESPONSE_ADAPTER.validate_python(results), mode="json")
+    return JSONResponse(content=content).body
+
+
+ENCODERS = {
+    "jsonable_encoder": _encode_jsonable,
+    "response_model": _encode_response_model,
+    "orjson": dumps,
+}
+
+
+def run_benchmark(row_counts: List[int], repeat: int) -> Dict[str, List[Dict[str, Any]]]:
+    encode_results = []
+    size_results = []
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+
+    for n in row_counts:
+        results = json.loads(_search_results_json(n))
+        bodies = {name: encode(results) for name, encode in ENCODERS.items()}
+        assert json.loads(bodies["orjson"]) == json.loads(bodies["jsonable_encoder"])
+
+        baseline = _best_seconds(lambda: _encode_jsonable(results), repeat)
+        for name, encode in ENCODERS.items():
+            seconds = baseline if name == "jsonable_encoder" else _best_seconds(lambda: encode(results), repeat)
+            encode_results.append({
+                "rows": n,
+                "encoder": name,
+                "seconds": seconds,
+                "speedup": baseline / seconds,
+            })
+
+        body = bodies["orjson"]
+        size_results.append({"rows": n, "encoding": "identity", "bytes": len(body), "seconds": 0.0})
+        for encoding in encodings:
+            size_results.append({
+                "rows": n,
+                "encoding": encoding,
+                "bytes": len(compress(body, encoding)),
+                "seconds": _best_seconds(lambda: compress(body, encoding), repeat),
+            })
+
+    return {"encode": encode_results, "size": size_results}
+
+
+def to_markdown(results: Dict[str, List[Dict[str, Any]]], repeat: int) -> str:
+    lines = [
+        "# 검색 응답 직렬화 벤치마크",
+        "",
+        f"- **측정 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"- **샘플:** {SAMPLE_PATH} 1건 복제 (전체 필드, 제목/요약 텍스트는 row 마다 다름)",
+        "- **참고:** 같은 특허를 복제한 데이터라 실제 검색 응답보다 압축률이 높게 나온다",
+        f"- **orjson:** {'사용' if orjson is not None else '없음 (표준 json 으로 대체)'}",
+        f"- **brotli:** {'사용' if brotli is not None else '없음 (gzip 만 측정)'}",
+        f"- **반복:** {repeat}회 중 최솟값",
+        "",
+        "## 인코딩 시간",
+        "",
+        "| rows | 경로 | 시간 | jsonable_encoder 대비 |",
+        "|------|------|------|-----------------------|",
+    ]
+    for r in results["encode"]:
+        lines.append(
+            f"| {r['rows']:,} | {r['encoder']} | {r['seconds'] * 1000:.2f} ms | {r['speedup']:.1f}x |"
+        )
+
+    lines += [
+        "",
+        "## 응답 크기 (orjson 본문 기준)",
+        "",
+        "| rows | Content-Encoding | 크기 | 압축률 | 압축 시간 |",
+        "|------|------------------|------|--------|-----------|",
+    ]
+    identity = {r["rows"]: r["bytes"] for r in results["size"] if r["encoding"] == "identity"}
+    for r in results["size"]:
+        lines.append(
+            f"| {r['rows']:,} | {r['encoding']} | {r['bytes'] / 1024:,.1f} KiB "
+            f"| {r['bytes'] / identity[r['rows']]:.0%} | {r['seconds'] * 1000:.2f} ms |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="검색 응답 JSON 인코딩 / 압축 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--report", help="결과를 저장할 markdown 파일 경로")
+    args = parser.parse_args()
+
+    report = to_markdown(run_benchmark(args.rows, args.repeat), args.repeat)
+    print(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
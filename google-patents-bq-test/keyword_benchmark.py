@@ -0,0 +1,121 @@
+# 파일명: keyword_benchmark.py
+# 키워드 조건 형식 비교: 키워드별 LIKE OR 조건 vs REGEXP_CONTAINS 하나
+#
+# 키워드 1개 / 10개 변형에 대해 두 형식의 쿼리를 실제로 실행하고
+# BigQuery 잡 통계(slot-ms, 과금 바이트, 경과 시간)를 비교한다.
+# 쿼리 캐시는 끄고 실행하므로 실행할 때마다 스캔 비용이 발생한다 (먼저 dry run 추정치를 출력).
+#
+# 사용 예:
+#   python keyword_benchmark.py --countries KR,US --repeat 2 --report keyword_benchmark.md
+
+import argparse
+import time
+from datetime import datetime
+from typing import List, Dict, Any
+
+from bigquery_client import get_client
+from bigquery_patents_tool import (
+    KEYWORD_MATCH_MODES,
+    PROJECT_ID,
+    _build_search_query,
+    _to_keyword_list,
+)
+from query_budget import apply_max_bytes_billed, dry_run_config, estimate_cost_usd
+
+# 1개 변형 / 10개 변형 (동의어 사전으로 확장한 graphite + battery 그룹에서 10개)
+KEYWORD_SETS = {
+    1: ["graphite"],
+    10: _to_keyword_list(["graphite", "battery"], expand=True)[:10],
+}
+
+
+def _run_once(keywords: List[str], match: str, country_codes: List[str] | None, limit: int) -> Dict[str, Any]:
+    client = get_client(PROJECT_ID)
+    query, job_config = _build_search_query(
+        keywords, limit, country_codes, ["publication_number"], match=match
+    )
+    job_config.use_query_cache = False
+    apply_max_bytes_billed(job_config)
+
+    start = time.perf_counter()
+    job = client.query(query, job_config=job_config)
+    rows = list(job.result())
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rows": len(rows),
+        "slot_millis": job.slot_millis or 0,
+        "total_bytes_billed": job.total_bytes_billed or 0,
+        "elapsed_sec": elapsed,
+    }
+
+
+def run_benchmark(country_codes: List[str] | None, limit: int, repeat: int) -> List[Dict[str, Any]]:
+    client = get_client(PROJECT_ID)
+    results = []
+
+    for variants, keywords in KEYWORD_SETS.items():
+        for match in KEYWORD_MATCH_MODES:
+            query, job_config = _build_search_query(
+                keywords, limit, country_codes, ["publication_number"], match=match
+            )
+            estimate = client.query(query, job_config=dry_run_config(job_config))
+            print(
+                f"[{match} / 키워드 {variants}개] 예상 스캔 "
+                f"{estimate.total_bytes_processed or 0:,} bytes "
+                f"(${estimate_cost_usd(estimate.total_bytes_processed):.4f}) x {repeat}회"
+            )
+
+            runs = [_run_once(keywords, match, country_codes, limit) for _ in range(repeat)]
+            results.append({
+                "variants": variants,
+                "match": match,
+                "rows": runs[-1]["rows"],
+                "slot_millis": min(r["slot_millis"] for r in runs),
+                "total_bytes_billed": runs[-1]["total_bytes_billed"],
+                "elapsed_sec": min(r["elapsed_sec"] for r in runs),
+            })
+
+    return results
+
+
+def to_markdown(results: List[Dict[str, Any]], country_codes: List[str] | None, repeat: int) -> str:
+    lines = [
+        "# 키워드 조건 형식 벤치마크 (LIKE vs REGEXP_CONTAINS)",
+        "",
+        f"- **측정 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"- **검색 국가:** {','.join(country_codes) if country_codes else '전체'}",
+        f"- **키워드 10개 변형:** {', '.join(KEYWORD_SETS[10])}",
+        f"- **반복:** {repeat}회 중 최솟값 (쿼리 캐시 사용 안 함)",
+        "",
+        "| 키워드 수 | 조건 형식 | slot-ms | 과금 바이트 | 경과 시간 | 결과 수 |",
+        "|-----------|-----------|---------|-------------|-----------|---------|",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['variants']} | {r['match']} | {r['slot_millis']:,} "
+            f"| {r['total_bytes_billed']:,} | {r['elapsed_sec']:.2f}s | {r['rows']:,} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="키워드 조건 형식(LIKE / REGEXP) slot-ms 벤치마크")
+    parser.add_argument("--countries", default="KR,US", help="국가 코드 (쉼표 구분, 빈 값이면 전체)")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--report", help="결과를 저장할 markdown 파일 경로")
+    args = parser.parse_args()
+
+    country_codes = [c.strip().upper() for c in args.countries.split(",") if c.strip()] or None
+    results = run_benchmark(country_codes, args.limit, args.repeat)
+    report = to_markdown(results, country_codes, args.repeat)
+    print(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# 파일명: keyword_synonyms.py
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Dict, Optional, Tuple
+
+# 동의어/번역어 사전 파일 경로 (JSON)
+DEFAULT_SYNONYMS_PATH = os.environ.get(
+    "PATENT_SYNONYMS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "keyword_synonyms.json"),
+)
+
+# expand() 결과 memo 최대 항목 수 (넘으면 가장 오래 안 쓰인 조합부터 지운다)
+DEFAULT_MEMO_SIZE = int(os.environ.get("PATENT_SYNONYMS_MEMO_SIZE", "4096"))
+
+
+class SynonymDictionary:
+    """
+    다국어 동의어 사전.
+
+    같은 뜻의 단어들을 하나의 그룹으로 묶어 두고, 검색 키워드에 같은 그룹의 단어를 붙여 준다.
+    예: "graphite" -> ["graphite", "흑연", "그래파이트", "石墨", "黒鉛"]
+
+    - 비교는 소문자 기준 (BigQuery 검색도 LOWER(title) 기준)
+    - expand() 결과는 키워드 조합별로 memoize 하고 (LRU, 최대 memo_size 개), 사전이 바뀌면 비운다
+    """
+
+    def __init__(self, groups: Iterable[Iterable[str]] = (), memo_size: int = DEFAULT_MEMO_SIZE):
+        self._lock = threading.Lock()
+        self._groups: List[List[str]] = []
+        self._index: Dict[str, int] = {}
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[str, ...], Tuple[str, ...]]" = OrderedDict()
+        for group in groups:
+            self.add(group)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SynonymDictionary":
+        """
+        JSON 파일에서 사전 로드.
+        형식: {"graphite": ["흑연", "그래파이트"], ...} 또는 [["graphite", "흑연"], ...]
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if isinstance(data, dict):
+            groups = [[term, *synonyms] for term, synonyms in data.items()]
+        else:
+            groups = data
+        return cls(groups)
+
+    def add(self, terms: Iterable[str]) -> None:
+        """
+        동의어 그룹 추가 (실행 중에도 가능).
+        이미 있는 단어가 들어 있으면 기존 그룹에 합친다.
+        """
+        terms = [t.strip().lower() for t in terms if t and t.strip()]
+        if not terms:
+            return
+
+        with self._lock:
+            group_ids = sorted({self._index[t] for t in terms if t in self._index})
+            if group_ids:
+                target = group_ids[0]
+                # 여러 그룹에 걸치면 첫 그룹으로 합친다
+                for gid in group_ids[1:]:
+                    for t in self._groups[gid]:
+                        self._index[t] = target
+                        if t not in self._groups[target]:
+                            self._groups[target].append(t)
+                    self._groups[gid] = []
+            else:
+                target = len(self._groups)
+                self._groups.append([])
+
+            for t in terms:
+                if t not in self._groups[target]:
+                    self._groups[target].append(t)
+                self._index[t] = target
+
+            self._memo.clear()
+
+    def expand(self, keywords: Iterable[str]) -> List[str]:
+        """
+        키워드 + 각 키워드의 동의어 (소문자, 입력 순서 유지, 중복 제거)
+        """
+        key = tuple(k.strip().lower() for k in keywords if k and k.strip())
+
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return list(cached)
+
+            expanded: List[str] = []
+            for kw in key:
+                group = self._groups[self._index[kw]] if kw in self._index else [kw]
+                for term in [kw, *group]:
+                    if term not in expanded:
+                        expanded.append(term)
+
+            self._memo[key] = tuple(expanded)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+            return expanded
+
+    def groups(self) -> List[List[str]]:
+        with self._lock:
+            return [list(g) for g in self._groups if g]
+
+
+_synonyms: Optional[SynonymDictionary] = None
+_synonyms_lock = threading.Lock()
+
+
+def get_synonyms(path: str = DEFAULT_SYNONYMS_PATH) -> SynonymDictionary:
+    """
+    전역 동의어 사전 반환 (처음 호출 시 파일에서 로드).
+    파일이 없으면 빈 사전.
+    """
+    global _synonyms
+
+    if _synonyms is None:
+        with _synonyms_lock:
+            if _synonyms is None:
+                if os.path.exists(path):
+                    _synonyms = SynonymDictionary.from_file(path)
+                else:
+                    _synonyms = SynonymDictionary()
+
+    return _synonyms
+
+
+def set_synonyms(synonyms: SynonymDictionary) -> None:
+    """전역 동의어 사전 교체"""
+    global _synonyms
+
+    with _synonyms_lock:
+        _synonyms = synonyms
+
+
+def expand_keywords(keywords: Iterable[str]) -> List[str]:
+    """전역 사전으로 키워드 확장"""
+    return get_synonyms().expand(keywords)
@@ -0,0 +1,278 @@
+# 파일명: llm_clients.py
+# LLM 제공사(OpenAI / Anthropic / Gemini / Cohere) 클라이언트를 프로세스 전역에서 재사용하기 위한 레지스트리.
+#
+# SDK 클라이언트를 호출마다 새로 만들면 HTTP 커넥션 풀과 TLS 세션도 매번 버려진다.
+# 여기서는 제공사별로 sync / async 클라이언트를 하나씩만 만들고 (커넥션 풀 크기 지정),
+# ai_tool_demo.py, ../cohere/cohere_real_patent_test.py, ../gemini-file-search/gemini_file_search_test.py 가 같이 쓴다.
+#
+# SDK 는 실제로 쓰는 제공사 것만 import 한다 (다른 SDK 가 없어도 동작).
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# 제공사별 HTTP 커넥션 풀 설정
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", "20"))
+DEFAULT_MAX_KEEPALIVE = int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE", "10"))
+DEFAULT_KEEPALIVE_EXPIRY_SEC = float(os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY_SEC", "60"))
+
+# 요청 1건 제한 시간 (초). 응답 생성이 길어질 수 있으므로 넉넉하게
+DEFAULT_TIMEOUT_SEC = float(os.environ.get("LLM_HTTP_TIMEOUT_SEC", "300"))
+
+# 제공사 이름 -> API 키 환경변수 (앞에 있는 것 우선)
+API_KEY_ENV = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "cohere": ("CO_API_KEY",),
+}
+
+PROVIDER_NAMES = tuple(API_KEY_ENV)
+
+
+class LLMClientRegistry:
+    """
+    제공사별 SDK 클라이언트를 하나씩만 만들어 재사용하는 관리자.
+
+    - 처음 get() 이 호출될 때 클라이언트를 만든다 (lazy init)
+    - 여러 스레드에서 동시에 호출해도 (제공사, sync/async) 별로 한 번만 만들어진다
+    - async 클라이언트의 커넥션은 처음 사용한 이벤트 루프에 묶이므로,
+      asyncio.run() 이 끝나기 전에 aclose() 로 정리한다
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SEC,
+        timeout: float = DEFAULT_TIMEOUT_SEC,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self._clients: Dict[Tuple[str, bool], Any] = {}
+        # cohere 클라이언트는 close() 가 없으므로 넘겨준 httpx 클라이언트를 직접 닫는다
+        self._cohere_http: Dict[bool, Any] = {}
+        self._lock = threading.Lock()
+
+    def _api_key(self, provider: str) -> Optional[str]:
+        return next((os.environ[name] for name in API_KEY_ENV[provider] if os.environ.get(name)), None)
+
+    def _build(self, provider: str, use_async: bool) -> Any:
+        """제공사 SDK 클라이언트 생성 (커넥션 풀 크기 / 제한 시간 지정)"""
+        if provider not in API_KEY_ENV:
+            raise ValueError(f"지원하지 않는 제공사: {provider} (사용 가능: {', '.join(PROVIDER_NAMES)})")
+        timeout = httpx.Timeout(self.timeout, connect=10.0)
+        api_key = self._api_key(provider)
+
+        if provider == "openai":
+            import openai
+
+            if use_async:
+                http_client = openai.DefaultAsyncHttpxClient(limits=self.limits, timeout=timeout)
+                return openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+            http_client = openai.DefaultHttpxClient(limits=self.limits, timeout=timeout)
+            return openai.OpenAI(api_key=api_key, http_client=http_client)
+
+        if provider == "anthropic":
+            import anthropic
+
+            if use_async:
+                http_client = anthropic.DefaultAsyncHttpxClient(limits=self.limits, timeout=timeout)
+                return anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+            http_client = anthropic.DefaultHttpxClient(limits=self.limits, timeout=timeout)
+            return anthropic.Anthropic(api_key=api_key, http_client=http_client)
+
+        if provider == "gemini":
+            from google import genai
+            from google.genai import types
+
+            # genai.Client 하나가 sync 풀과 async 풀(client.aio)을 같이 가진다
+            client_args = {"limits": self.limits}
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    timeout=int(self.timeout * 1000),
+                    client_args=client_args,
+                    async_client_args=client_args,
+                ),
+            )
+            return client.aio if use_async else client
+
+        if provider == "cohere":
+            import cohere
+
+            if use_async:
+                http_client = httpx.AsyncClient(limits=self.limits, timeout=timeout)
+                self._cohere_http[True] = http_client
+                return cohere.AsyncClientV2(api_key=api_key, httpx_client=http_client)
+            http_client = httpx.Client(limits=self.limits, timeout=timeout)
+            self._cohere_http[False] = http_client
+            return cohere.ClientV2(api_key=api_key, httpx_client=http_client)
+
+    def get(self, provider: str, use_async: bool = False) -> Any:
+        """공유 클라이언트 반환 (없으면 생성). gemini 의 async 클라이언트는 genai.Client.aio"""
+        key = (provider, use_async)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self._build(provider, use_async)
+            return self._clients[key]
+
+    def warm_up(self, providers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        sync 클라이언트를 미리 만들고 모델 목록 조회(과금 없음)로 커넥션을 열어 둔다.
+        첫 요청 지연 시간에 인증/TLS 연결 비용이 섞이지 않게 하려는 용도.
+
+        Returns:
+            {제공사: 소요 시간(초) 또는 실패 메시지}
+        """
+        providers = providers or list(PROVIDER_NAMES)
+
+        def ping(provider: str) -> Any:
+            start = time.perf_counter()
+            try:
+                _list_models(provider, self.get(provider))
+            except Exception as e:
+                return f"실패: {e}"
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+            return dict(zip(providers, pool.map(ping, providers)))
+
+    async def awarm_up(self, providers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """warm_up() 의 async 클라이언트 버전 (클라이언트를 쓸 이벤트 루프 안에서 호출)"""
+        providers = providers or list(PROVIDER_NAMES)
+
+        async def ping(provider: str) -> Any:
+            start = time.perf_counter()
+            try:
+                await _alist_models(provider, self.get(provider, use_async=True))
+            except Exception as e:
+                return f"실패: {e}"
+            return time.perf_counter() - start
+
+        return dict(zip(providers, await asyncio.gather(*(ping(p) for p in providers))))
+
+    def close(self) -> None:
+        """sync 클라이언트 정리"""
+        with self._lock:
+            clients = [(key, c) for key, c in self._clients.items() if not key[1]]
+            for key, _ in clients:
+                del self._clients[key]
+        for (provider, _), client in clients:
+            if provider == "cohere":
+                self._cohere_http.pop(False).close()
+            else:
+                client.close()
+
+    async def aclose(self) -> None:
+        """async 클라이언트 정리 (클라이언트를 쓴 이벤트 루프 안에서 호출)"""
+        with self._lock:
+            clients = [(key, c) for key, c in self._clients.items() if key[1]]
+            for key, _ in clients:
+                del self._clients[key]
+        for (provider, _), client in clients:
+            if provider == "gemini":
+                await client.aclose()
+            elif provider == "cohere":
+                await self._cohere_http.pop(True).aclose()
+            else:
+                await client.close()
+
+
+def _list_models(provider: str, client: Any) -> None:
+    if provider == "gemini":
+        next(iter(client.models.list(config={"page_size": 1})), None)
+    elif provider == "cohere":
+        client.models.list(page_size=1)
+    elif provider == "anthropic":
+        client.models.list(limit=1)
+    else:
+        client.models.list()
+
+
+async def _alist_models(provider: str, client: Any) -> None:
+    if provider == "gemini":
+        await client.models.list(config={"page_size": 1})
+    elif provider == "cohere":
+        await client.models.list(page_size=1)
+    elif provider == "anthropic":
+        await client.models.list(limit=1)
+    else:
+        await client.models.list()
+
+
+_registry: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def _get_registry() -> LLMClientRegistry:
+    global _registry
+
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry()
+            registry = _registry
+    return registry
+
+
+def configure_llm_clients(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SEC,
+    timeout: float = DEFAULT_TIMEOUT_SEC,
+) -> LLMClientRegistry:
+    """
+    전역 레지스트리 설정.
+    이미 만들어진 sync 클라이언트가 있으면 닫고 새 설정으로 교체한다.
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is not None:
+            _registry.close()
+        _registry = LLMClientRegistry(max_connections, max_keepalive, keepalive_expiry, timeout)
+        return _registry
+
+
+def get_llm_client(provider: str, use_async: bool = False) -> Any:
+    """전역 공유 클라이언트 반환 (provider: openai / anthropic / gemini / cohere)"""
+    return _get_registry().get(provider, use_async)
+
+
+def warm_up_llm_clients(providers: Optional[List[str]] = None) -> Dict[str, Any]:
+    """전역 sync 클라이언트 warm-up (스크립트 시작 시 호출)"""
+    return _get_registry().warm_up(providers)
+
+
+async def awarm_up_llm_clients(providers: Optional[List[str]] = None) -> Dict[str, Any]:
+    """전역 async 클라이언트 warm-up"""
+    return await _get_registry().awarm_up(providers)
+
+
+def close_llm_clients() -> None:
+    """전역 sync 클라이언트 정리"""
+    with _registry_lock:
+        if _registry is not None:
+            _registry.close()
+
+
+async def aclose_llm_clients() -> None:
+    """전역 async 클라이언트 정리 (asyncio.run() 안에서 마지막에 호출)"""
+    registry = _registry
+    if registry is not None:
+        await registry.aclose()
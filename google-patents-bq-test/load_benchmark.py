@@ -0,0 +1,265 @@
+# 파일명: load_benchmark.py
+# /patents/search 부하 테스트: 동시 요청 수별 처리량(req/s)과 p50/p95/p99 지연 시간
+#
+# BigQuery 대신 load-json 으로 만든 로컬 스토어(backend=local)를 쓰므로 과금 없이,
+# 같은 데이터로 몇 번을 돌려도 같은 조건에서 비교할 수 있다.
+# 요청 전체 지연 시간과 함께 요청 한 건이 거치는 단계를 따로 재서 어디에 시간이 드는지 보여준다.
+#   - client_setup: BigQuery 클라이언트 + HTTP 세션 생성 (공유 클라이언트가 없을 때 요청마다 드는 비용)
+#   - backend_wait: 검색 backend 응답 대기 (로컬 스토어 검색, BigQuery 잡 대기에 해당)
+#   - normalize:    BigQuery row -> 검색 결과 dict 정규화
+#   - json_encode:  검색 결과 -> JSON 응답 본문 (app 과 같은 orjson 경로, 압축 제외)
+#
+# 사용 예:
+#   python load_benchmark.py --concurrency 1 8 32 --requests 2000 --copies 5000
+#   python load_benchmark.py --url http://localhost:8000 --concurrency 16   # 실행 중인 서버 대상
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, List, Dict, Any
+
+import httpx
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import bigquery
+
+from bigquery_client import BigQueryClientManager
+from bigquery_patents_tool import (
+    _json_record_to_row,
+    _read_publications_json,
+    _resolve_fields,
+    _search_local,
+    _search_rows_to_results,
+    _to_keyword_list,
+    load_json_local_store,
+)
+from local_patent_store import LocalPatentStore, set_local_store
+from response_encoding import dumps, encoded_response
+
+SAMPLE_PATH = "bq-google-patents.json"
+
+# 요청마다 돌아가면서 쓰는 검색 조건 (동의어 확장 후 모두 샘플 제목에 걸리는 키워드)
+WORKLOAD = [
+    {"keyword": "graphite", "limit": 20},
+    {"keyword": "흑연", "limit": 20, "countries": "KR"},
+    {"keyword": "battery,lithium", "limit": 50, "langs": "ko,en"},
+    {"keyword": "dispersant", "limit": 100, "fields": "publication_number,title_localized,publication_date"},
+]
+
+STAGES = ("client_setup", "backend_wait", "normalize", "json_encode")
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    """q 분위수 (nearest-rank)"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(samples: List[float], wall_sec: float) -> Dict[str, Any]:
+    """지연 시간(초) 목록 -> 건수/처리량/평균/p50/p95/p99 (ms)"""
+    return {
+        "count": len(samples),
+        "throughput": len(samples) / wall_sec if wall_sec else 0.0,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p95_ms": _percentile(samples, 0.95) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+    }
+
+
+def _build_store(copies: int) -> str:
+    """샘플 JSON 을 copies 벌 복제한 임시 로컬 스토어 생성"""
+    path = os.path.join(tempfile.mkdtemp(prefix="patent-load-"), "patents_local.sqlite3")
+    load_json_local_store([SAMPLE_PATH], path=path, copies=copies)
+    return path
+
+
+def _time_calls(fn: Callable[[], Any], n: int) -> Dict[str, Any]:
+    """fn 을 n 번 순서대로 실행한 지연 시간 요약"""
+    samples = []
+    start = time.perf_counter()
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return _summary(samples, time.perf_counter() - start)
+
+
+def measure_stages(n: int) -> Dict[str, Dict[str, Any]]:
+    """
+    요청 한 건이 거치는 단계별 지연 시간 (단일 스레드, WORKLOAD 를 돌아가면서).
+    backend_wait 은 로컬 스토어를 쓰므로 전역 스토어가 먼저 설정돼 있어야 한다.
+    """
+    record = next(_read_publications_json(SAMPLE_PATH))
+    specs = []
+    for spec in WORKLOAD:
+        fields = _resolve_fields(spec["fields"].split(",") if spec.get("fields") else None)
+        countries = spec["countries"].split(",") if spec.get("countries") else None
+        keywords = _to_keyword_list(spec["keyword"].split(","))
+        rows = [_json_record_to_row(record) for _ in range(spec["limit"])]
+        results = _search_local(keywords, spec["limit"], countries, fields, "local")
+        specs.append((keywords, spec["limit"], countries, fields, rows, results))
+
+    def cycle(stage_fn):
+        state = {"i": 0}
+
+        def call():
+            spec = specs[state["i"] % len(specs)]
+            state["i"] += 1
+            stage_fn(*spec)
+        return call
+
+    def client_setup(*_):
+        credentials = AnonymousCredentials()
+        session = BigQueryClientManager("load-benchmark")._build_session(credentials)
+        bigquery.Client(project="load-benchmark", credentials=credentials, _http=session)
+        session.close()
+
+    def backend_wait(keywords, limit, countries, fields, rows, results):
+        _search_local(keywords, limit, countries, fields, "local")
+
+    def normalize(keywords, limit, countries, fields, rows, results):
+        _search_rows_to_results(rows, fields)
+
+    def json_encode(keywords, limit, countries, fields, rows, results):
+        encoded_response(dumps(results))
+
+    stage_fns = {
+        "client_setup": client_setup,
+        "backend_wait": backend_wait,
+        "normalize": normalize,
+        "json_encode": json_encode,
+    }
+    return {name: _time_calls(cycle(stage_fns[name]), n) for name in STAGES}
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    total_requests: int,
+) -> Dict[str, Any]:
+    """동시 요청 concurrency 개로 total_requests 건을 보내고 지연 시간 요약 반환"""
+    samples: List[float] = []
+    errors: Dict[int, int] = {}
+    counter = iter(range(total_requests))
+
+    async def worker() -> None:
+        for i in counter:
+            params = {"backend": "local", **WORKLOAD[i % len(WORKLOAD)]}
+            t0 = time.perf_counter()
+            response = await client.get("/patents/search", params=params)
+            await response.aread()
+            elapsed = time.perf_counter() - t0
+            if response.status_code == 200:
+                samples.append(elapsed)
+            else:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_sec = time.perf_counter() - start
+
+    if not samples:
+        raise RuntimeError(f"성공한 요청이 없습니다 (status 별 실패 수: {errors})")
+
+    result = _summary(samples, wall_sec)
+    result.update({"concurrency": concurrency, "errors": sum(errors.values()), "wall_sec": wall_sec})
+    return result
+
+
+async def run_benchmark(
+    concurrency_levels: List[int],
+    total_requests: int,
+    url: str | None = None,
+) -> List[Dict[str, Any]]:
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=60)
+    else:
+        # 같은 프로세스 안에서 ASGI 로 직접 호출 (네트워크/uvicorn 비용 제외)
+        from app.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    async with client:
+        # 워밍업 (스토어 연결, 동의어 사전 로드 등 첫 요청 비용 제외)
+        for spec in WORKLOAD:
+            await client.get("/patents/search", params={"backend": "local", **spec})
+        return [await run_load(client, c, total_requests) for c in concurrency_levels]
+
+
+def to_markdown(
+    load_results: List[Dict[str, Any]],
+    stage_results: Dict[str, Dict[str, Any]],
+    args: argparse.Namespace,
+) -> str:
+    lines = [
+        "# 특허 검색 API 부하 테스트 결과",
+        "",
+        f"- **테스트 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"- **대상:** {args.url or '같은 프로세스 ASGI (app.main)'}",
+        "- **검색 backend:** local (load-json 스토어, BigQuery 호출 없음)",
+        f"- **스토어 크기:** {args.copies:,}건" if not args.url else "- **스토어 크기:** 서버 설정",
+        f"- **요청 수:** 동시 요청 수별 {args.requests:,}건",
+        f"- **검색 조건:** {' / '.join(spec['keyword'] for spec in WORKLOAD)} (순서대로 반복)",
+        "",
+        "---",
+        "",
+        "## 처리량 / 지연 시간 (GET /patents/search)",
+        "",
+        "| 동시 요청 | req/s | 평균 | p50 | p95 | p99 | 실패 |",
+        "|-----------|-------|------|-----|-----|-----|------|",
+    ]
+    for r in load_results:
+        lines.append(
+            f"| {r['concurrency']} | {r['throughput']:,.1f} | {r['mean_ms']:.2f} ms "
+            f"| {r['p50_ms']:.2f} ms | {r['p95_ms']:.2f} ms | {r['p99_ms']:.2f} ms | {r['errors']} |"
+        )
+
+    if stage_results:
+        lines += [
+            "",
+            "## 단계별 지연 시간 (단일 스레드)",
+            "",
+            "| 단계 | 호출/s | 평균 | p50 | p95 | p99 |",
+            "|------|--------|------|-----|-----|-----|",
+        ]
+        for name in STAGES:
+            r = stage_results[name]
+            lines.append(
+                f"| {name} | {r['throughput']:,.1f} | {r['mean_ms']:.3f} ms "
+                f"| {r['p50_ms']:.3f} ms | {r['p95_ms']:.3f} ms | {r['p99_ms']:.3f} ms |"
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/patents/search 부하 테스트 (로컬 backend)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=1000, help="동시 요청 수별 총 요청 수")
+    parser.add_argument("--copies", type=int, default=2000, help="샘플 특허를 복제해서 만들 스토어 크기")
+    parser.add_argument("--stage-calls", type=int, default=500, help="단계별 측정 호출 수 (0 이면 생략)")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (생략하면 같은 프로세스에서 ASGI 로 호출)")
+    parser.add_argument("--report", help="결과를 저장할 markdown 파일 경로 (기본값: load_test_<일시>.md)")
+    args = parser.parse_args()
+
+    if not args.url:
+        set_local_store(LocalPatentStore(_build_store(args.copies)))
+
+    load_results = asyncio.run(run_benchmark(args.concurrency, args.requests, args.url))
+    stage_results = measure_stages(args.stage_calls) if args.stage_calls and not args.url else {}
+
+    report = to_markdown(load_results, stage_results, args)
+    print(report)
+
+    path = args.report or f"load_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report)
+    print(f"결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
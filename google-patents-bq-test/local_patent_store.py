@@ -0,0 +1,293 @@
+# 파일명: local_patent_store.py
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Dict, Any, Optional
+
+# 로컬 특허 스토어 경로 (bigquery_patents_tool.py materialize 로 생성)
+DEFAULT_STORE_PATH = os.environ.get("PATENT_LOCAL_STORE", "patents_local.sqlite3")
+
+# trigram 토크나이저는 3글자 이상만 인덱스로 찾을 수 있다.
+# 그보다 짧은 키워드(예: "흑연")는 LIKE 로 찾는다.
+_TRIGRAM_MIN_LEN = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+  rowid INTEGER PRIMARY KEY,
+  publication_number TEXT NOT NULL UNIQUE,
+  country_code TEXT,
+  publication_date INTEGER,
+  filing_date INTEGER,
+  cpc_codes TEXT,
+  title_text TEXT,
+  abstract_text TEXT,
+  record TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_publications_country ON publications (country_code);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS publications_fts USING fts5(
+  title_text,
+  abstract_text,
+  content='publications',
+  content_rowid='rowid',
+  tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS publications_ai AFTER INSERT ON publications BEGIN
+  INSERT INTO publications_fts (rowid, title_text, abstract_text)
+  VALUES (new.rowid, new.title_text, new.abstract_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS publications_ad AFTER DELETE ON publications BEGIN
+  INSERT INTO publications_fts (publications_fts, rowid, title_text, abstract_text)
+  VALUES ('delete', old.rowid, old.title_text, old.abstract_text);
+END;
+
+CREATE TABLE IF NOT EXISTS store_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+);
+"""
+
+
+def _joined_text(items: List[Dict[str, Any]] | None) -> str:
+    """localized 리스트의 text 들을 줄바꿈으로 이어 붙인다 (인덱스용)"""
+    return "\n".join(t.get("text") or "" for t in (items or []))
+
+
+def _date_to_int(value: str | None) -> Optional[int]:
+    """'YYYYMMDD' 문자열 -> int (0 이나 빈 값은 None)"""
+    if not value:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    return number or None
+
+
+def _fts_phrase(keyword: str) -> str:
+    """FTS5 MATCH 용 phrase 문자열 (큰따옴표 이스케이프)"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class LocalPatentStore:
+    """
+    BigQuery에서 추출한 특허 일부(slice)를 담는 로컬 SQLite 스토어.
+
+    - 정규화된 검색 결과 dict 를 그대로 JSON 으로 저장한다
+    - title/abstract 텍스트에 FTS5 trigram 인덱스를 만들어
+      BigQuery 의 LIKE '%kw%' 와 같은 부분 문자열 검색을 전체 스캔 없이 처리한다
+    - 어떤 조건으로 추출했는지(slice)를 store_meta 에 기록해 두고,
+      요청이 그 범위 안에 있는지 covers() 로 판단한다
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        정규화된 특허 dict 들을 저장 (같은 publication_number 는 덮어쓴다).
+        저장한 건수를 반환.
+        """
+        count = 0
+        with self._lock:
+            for record in records:
+                publication_number = record["publication_number"]
+                cpc_codes = record.get("cpc") or []
+                self._conn.execute(
+                    "DELETE FROM publications WHERE publication_number = ?",
+                    (publication_number,),
+                )
+                self._conn.execute(
+                    "INSERT INTO publications (publication_number, country_code, "
+                    "publication_date, filing_date, cpc_codes, title_text, abstract_text, record) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        publication_number,
+                        record.get("country_code"),
+                        _date_to_int(record.get("publication_date")),
+                        _date_to_int(record.get("filing_date")),
+                        " " + " ".join(cpc_codes) + " ",
+                        _joined_text(record.get("title_localized")),
+                        _joined_text(record.get("abstract_localized")),
+                        json.dumps(record, ensure_ascii=False),
+                    ),
+                )
+                count += 1
+            self._conn.commit()
+        return count
+
+    def set_slice(self, spec: Dict[str, Any]) -> None:
+        """추출 조건 기록 (countries, cpc_prefixes, publication_date_from/to, limit, rows)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('slice', ?)",
+                (json.dumps(spec, ensure_ascii=False),),
+            )
+            self._conn.commit()
+
+    def slice(self) -> Dict[str, Any]:
+        """추출 조건 조회 (기록이 없으면 빈 dict)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM store_meta WHERE key = 'slice'"
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def covers(
+        self,
+        country_codes: List[str] | None,
+        filters: Dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        요청한 국가/필터 조건이 추출 범위 안에 있는지 확인.
+        - 국가: 추출 시 국가 제한이 없었으면 항상 포함
+        - 공개일: 요청 범위가 추출 범위 안이어야 함
+        - CPC: 추출 시 CPC 제한이 있었으면, 요청한 prefix 가 모두 추출 prefix 로 시작해야 함
+        - limit: 추출 건수가 limit 에 걸렸으면(잘린 일부만 있음) 어떤 요청도 포함하지 않음
+        - authoritative=False (JSON 적재 등 BigQuery 추출이 아닌 스토어): 어떤 요청도 포함하지 않음
+        """
+        spec = self.slice()
+        filters = filters or {}
+
+        if spec.get("authoritative") is False:
+            return False
+
+        limit = spec.get("limit")
+        if limit and spec.get("rows", limit) >= limit:
+            return False
+
+        slice_countries = spec.get("countries") or []
+        if slice_countries:
+            if not country_codes or not set(country_codes) <= set(slice_countries):
+                return False
+
+        slice_from = spec.get("publication_date_from")
+        if slice_from and (filters.get("publication_date_from") or 0) < slice_from:
+            return False
+        slice_to = spec.get("publication_date_to")
+        if slice_to and (filters.get("publication_date_to") or 99999999) > slice_to:
+            return False
+
+        slice_prefixes = [p.upper() for p in spec.get("cpc_prefixes") or []]
+        if slice_prefixes:
+            requested = filters.get("cpc_prefixes") or []
+            if not requested or not all(
+                any(r.startswith(p) for p in slice_prefixes) for r in requested
+            ):
+                return False
+
+        return True
+
+    def count(self) -> int:
+        with self._lock:
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM publications").fetchone()
+        return n
+
+    def search(
+        self,
+        keyword_list: List[str],
+        limit: int = 20,
+        country_codes: List[str] | None = None,
+        fields: List[str] | None = None,
+        include_abstract: bool = False,
+        filters: Dict[str, Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드 부분 문자열 검색 (대소문자 무시, 키워드끼리는 OR).
+        기본은 BigQuery 검색과 같이 제목만 찾고, include_abstract=True 면 요약도 찾는다.
+        fields 가 있으면 해당 필드만 돌려준다.
+        filters 는 bigquery_patents_tool.search_filters() 결과 (공개일/출원일 범위, CPC prefix).
+        """
+        fts_columns = "{title_text abstract_text}" if include_abstract else "{title_text}"
+        like_columns = ["title_text", "abstract_text"] if include_abstract else ["title_text"]
+
+        conditions: List[str] = []
+        params: List[Any] = []
+        for kw in keyword_list:
+            kw = kw.strip()
+            if not kw:
+                continue
+            if len(kw) >= _TRIGRAM_MIN_LEN:
+                conditions.append(
+                    "rowid IN (SELECT rowid FROM publications_fts WHERE publications_fts MATCH ?)"
+                )
+                params.append(f"{fts_columns}: {_fts_phrase(kw)}")
+            else:
+                for column in like_columns:
+                    conditions.append(f"LOWER({column}) LIKE ?")
+                    params.append(f"%{kw.lower()}%")
+
+        if not conditions:
+            return []
+
+        where = "(" + " OR ".join(conditions) + ")"
+        if country_codes:
+            where += f" AND country_code IN ({', '.join('?' for _ in country_codes)})"
+            params.extend(country_codes)
+
+        filters = filters or {}
+        for column in ("publication_date", "filing_date"):
+            if filters.get(f"{column}_from"):
+                where += f" AND {column} >= ?"
+                params.append(filters[f"{column}_from"])
+            if filters.get(f"{column}_to"):
+                where += f" AND {column} <= ?"
+                params.append(filters[f"{column}_to"])
+        if filters.get("cpc_prefixes"):
+            # cpc_codes 는 " CODE1 CODE2 " 형태로 저장돼 있음
+            where += " AND (" + " OR ".join("cpc_codes LIKE ?" for _ in filters["cpc_prefixes"]) + ")"
+            params.extend(f"% {prefix}%" for prefix in filters["cpc_prefixes"])
+
+        # BigQuery 검색(RESULT_ORDER)과 같은 순서: 최신 공개일 우선, 같은 날은 공개번호 순
+        sql = f"SELECT record FROM publications WHERE {where} ORDER BY publication_date DESC, publication_number LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        results = [json.loads(record) for (record,) in rows]
+        if fields:
+            results = [{f: r.get(f) for f in fields} for r in results]
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[LocalPatentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_local_store(path: str = DEFAULT_STORE_PATH) -> Optional[LocalPatentStore]:
+    """
+    전역 로컬 스토어 반환.
+    스토어 파일이 아직 없으면 None (materialize 전에는 BigQuery 만 사용).
+    """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if not os.path.exists(path):
+                    return None
+                _store = LocalPatentStore(path)
+
+    return _store
+
+
+def set_local_store(store: Optional[LocalPatentStore]) -> None:
+    """전역 로컬 스토어 교체"""
+    global _store
+
+    with _store_lock:
+        _store = store
@@ -0,0 +1,249 @@
+# 파일명: metrics.py
+# 검색 단계별 타이밍(span)과 Prometheus 텍스트 형식 지표.
+#
+# - span("normalize") 로 감싼 구간은 stage 별 히스토그램에 기록되고,
+#   trace() 안에서 실행 중이면 요청 단위 span 목록에도 쌓인다 (Server-Timing 헤더용)
+# - 지표는 프로세스 로컬이며 GET /metrics 에서 text exposition 형식으로 내보낸다
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+
+# 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_LabelKey = Tuple[str, ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: _LabelKey, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터 (라벨 조합별)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[_LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram:
+    """누적 구간 히스토그램 (라벨 조합별 bucket / sum / count)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._series: Dict[_LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            # [bucket 별 개수..., sum, count]
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+
+        lines = []
+        for key, series in items:
+            for bound, n in zip(self.buckets, series):
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {n}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-2]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    """
+    호출 시점에 값을 읽어 오는 지표 (예: 실행 중인 잡 수).
+    이미 다른 모듈이 세고 있는 누적값(캐시 hit 수 등)은 kind="counter" 로 내보낸다.
+    """
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float], kind: str = "gauge"):
+        self.name = name
+        self.help = help_text
+        self.kind = kind
+        self._read = read
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {_format_value(self._read())}"]
+
+
+class MetricsRegistry:
+    """지표 모음 + Prometheus text exposition 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        read: Callable[[], float],
+        kind: str = "gauge",
+    ) -> Gauge:
+        return self._register(Gauge(name, help_text, read, kind))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+stage_seconds = registry.histogram(
+    "patent_search_stage_seconds",
+    "검색 단계별 소요 시간 (초)",
+    ("stage",),
+)
+request_seconds = registry.histogram(
+    "patent_http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초)",
+    ("method", "path", "status"),
+)
+bigquery_jobs = registry.counter(
+    "patent_bigquery_jobs_total",
+    "완료된 BigQuery 잡 수",
+    ("kind", "cache_hit"),
+)
+bigquery_bytes_processed = registry.counter(
+    "patent_bigquery_bytes_processed_total",
+    "BigQuery 잡이 스캔한 바이트",
+    ("kind",),
+)
+bigquery_bytes_billed = registry.counter(
+    "patent_bigquery_bytes_billed_total",
+    "BigQuery 잡 과금 바이트",
+    ("kind",),
+)
+bigquery_slot_millis = registry.counter(
+    "patent_bigquery_slot_millis_total",
+    "BigQuery 잡 slot-ms",
+    ("kind",),
+)
+bigquery_job_seconds = registry.histogram(
+    "patent_bigquery_job_seconds",
+    "BigQuery 잡 통계 기준 대기(queue) / 실행(execution) 시간 (초)",
+    ("kind", "phase"),
+)
+
+
+# 요청 단위 span 목록: [(stage, seconds), ...] (trace() 밖이면 None)
+_spans: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "patent_spans", default=None
+)
+
+
+@contextmanager
+def trace() -> Iterator[List[Tuple[str, float]]]:
+    """
+    요청 하나의 span 을 모은다.
+    asyncio.to_thread 로 넘긴 작업도 컨텍스트를 복사하므로 같은 목록에 쌓인다.
+    """
+    spans: List[Tuple[str, float]] = []
+    token = _spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _spans.reset(token)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """구간 소요 시간을 stage 히스토그램과 현재 trace 에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_seconds.observe(elapsed, stage=stage)
+        spans = _spans.get()
+        if spans is not None:
+            spans.append((stage, elapsed))
+
+
+def server_timing(spans: List[Tuple[str, float]]) -> str:
+    """span 목록 -> Server-Timing 헤더 값 (같은 stage 는 합산, ms)"""
+    totals: Dict[str, float] = {}
+    for stage, seconds in spans:
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    return ", ".join(f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in totals.items())
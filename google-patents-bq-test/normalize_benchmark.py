@@ -0,0 +1,139 @@
+# 파일명: normalize_benchmark.py
+# 검색 결과 정규화 경로 비교: row 단위(_normalize_*) vs Arrow 컬럼 단위(arrow_normalize)
+#
+# BigQuery 호출 없이 bq-google-patents.json 의 특허 1건을 N개로 복제해서
+# 두 경로의 처리량(rows/sec)을 재고, 결과가 같은지 확인한다.
+#
+# 사용 예:
+#   python normalize_benchmark.py --rows 10000 50000 --repeat 3 --report normalize_benchmark.md
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import List, Dict, Any
+
+import pyarrow as pa
+from google.cloud.bigquery.table import Row
+
+from arrow_normalize import arrow_table_to_results
+from bigquery_patents_tool import SEARCH_FIELDS, _resolve_fields, _search_rows_to_results
+
+SAMPLE_PATH = "bq-google-patents.json"
+
+
+def _load_sample_record(path: str = SAMPLE_PATH) -> Dict[str, Any]:
+    """샘플 JSON 에서 검색 쿼리가 SELECT 하는 컬럼만 꺼낸다 (날짜는 BigQuery처럼 INT64)"""
+    with open(path, encoding="utf-8") as f:
+        record = json.load(f)[0]
+
+    columns = [c for field in SEARCH_FIELDS.values() for c in field]
+    sample = {c: record.get(c) for c in columns}
+    for c in ("publication_date", "filing_date"):
+        sample[c] = int(sample[c]) if sample[c] else None
+    return sample
+
+
+def _make_records(sample: Dict[str, Any], n: int) -> List[Dict[str, Any]]:
+    """
+    샘플을 n개로 복제. 정규화 분기를 모두 타도록 일부 row 를 변형한다.
+    - 3번째마다 assignee_harmonized / inventor_harmonized 비움 (원본 이름으로 대체되는 경우)
+    - 5번째마다 cpc 에 빈 code 추가
+    - 7번째마다 abstract_localized, cpc 없음 (NULL)
+    """
+    records = []
+    for i in range(n):
+        r = dict(sample)
+        r["publication_number"] = f"{sample['publication_number']}-{i}"
+        if i % 3 == 0:
+            r["assignee_harmonized"] = []
+            r["inventor_harmonized"] = []
+        if i % 5 == 0:
+            r["cpc"] = list(sample["cpc"] or []) + [{"code": ""}]
+        if i % 7 == 0:
+            r["abstract_localized"] = None
+            r["cpc"] = None
+        records.append(r)
+    return records
+
+
+def _to_rows(records: List[Dict[str, Any]]) -> List[Row]:
+    """client.query() 결과와 같은 bigquery Row 객체로 변환"""
+    columns = list(records[0])
+    field_to_index = {c: i for i, c in enumerate(columns)}
+    return [Row([r[c] for c in columns], field_to_index) for r in records]
+
+
+def _best_seconds(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(row_counts: List[int], repeat: int = 3) -> List[Dict[str, Any]]:
+    fields = _resolve_fields(None)
+    sample = _load_sample_record()
+    results = []
+
+    for n in row_counts:
+        records = _make_records(sample, n)
+        rows = _to_rows(records)
+        table = pa.Table.from_pylist(records)
+
+        row_results = _search_rows_to_results(rows, fields)
+        arrow_results = arrow_table_to_results(table, fields)
+        if row_results != arrow_results:
+            raise AssertionError(f"row / arrow 결과가 다릅니다 (rows={n})")
+
+        row_sec = _best_seconds(lambda: _search_rows_to_results(rows, fields), repeat)
+        arrow_sec = _best_seconds(lambda: arrow_table_to_results(table, fields), repeat)
+
+        results.append({
+            "rows": n,
+            "row_path_rows_per_sec": n / row_sec,
+            "arrow_path_rows_per_sec": n / arrow_sec,
+            "speedup": row_sec / arrow_sec,
+        })
+
+    return results
+
+
+def to_markdown(results: List[Dict[str, Any]], repeat: int) -> str:
+    lines = [
+        "# 검색 결과 정규화 벤치마크",
+        "",
+        f"- **측정 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"- **샘플:** {SAMPLE_PATH} 1건 복제 (전체 필드)",
+        f"- **반복:** {repeat}회 중 최솟값",
+        "",
+        "| rows | row 경로 (rows/sec) | Arrow 경로 (rows/sec) | 배율 |",
+        "|------|---------------------|-----------------------|------|",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['rows']:,} | {r['row_path_rows_per_sec']:,.0f} "
+            f"| {r['arrow_path_rows_per_sec']:,.0f} | {r['speedup']:.1f}x |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="검색 결과 정규화 경로 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--report", help="결과를 저장할 markdown 파일 경로")
+    args = parser.parse_args()
+
+    report = to_markdown(run_benchmark(args.rows, args.repeat), args.repeat)
+    print(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
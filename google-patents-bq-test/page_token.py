@@ -0,0 +1,53 @@
+# 파일명: page_token.py
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from typing import Dict, Any
+
+# 페이지 토큰 서명 키.
+# 설정하지 않으면 프로세스마다 새로 만들어지므로 서버 재시작 후에는 기존 토큰을 쓸 수 없다.
+# (BigQuery 임시 결과 테이블도 24시간 뒤 사라지므로 토큰은 원래 오래 쓰는 값이 아님)
+_SECRET = os.environ.get("PAGE_TOKEN_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_SECRET, payload, hashlib.sha256).digest()[:16]
+
+
+def encode_page_token(state: Dict[str, Any]) -> str:
+    """
+    페이지 상태(dict)를 서명된 문자열 토큰으로 만든다.
+    토큰 안의 테이블 이름을 클라이언트가 바꿔서 다른 테이블을 읽지 못하도록 HMAC 서명을 붙인다.
+    """
+    payload = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_page_token(token: str) -> Dict[str, Any]:
+    """
+    토큰 검증 + 페이지 상태 복원.
+    형식이 틀리거나 서명이 맞지 않으면 ValueError.
+    """
+    try:
+        payload_part, signature_part = token.split(".", 1)
+        payload = _b64decode(payload_part)
+        signature = _b64decode(signature_part)
+    except (ValueError, TypeError):
+        raise ValueError("잘못된 page_token 형식입니다.")
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise ValueError("page_token 서명이 올바르지 않습니다.")
+
+    return json.loads(payload)
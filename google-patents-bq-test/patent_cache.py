@@ -0,0 +1,288 @@
+# 파일명: patent_cache.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+from patent_record import PatentRecordList
+
+# 캐시 설정 (환경변수로 조정 가능)
+# PATENT_CACHE_BACKEND: memory | sqlite | none
+DEFAULT_BACKEND = os.environ.get("PATENT_CACHE_BACKEND", "memory")
+DEFAULT_TTL_SEC = float(os.environ.get("PATENT_CACHE_TTL", "3600"))
+DEFAULT_MAX_SIZE = int(os.environ.get("PATENT_CACHE_MAX_SIZE", "512"))
+DEFAULT_SQLITE_PATH = os.environ.get("PATENT_CACHE_PATH", "patent_cache.sqlite3")
+# 메모리 캐시에 검색 결과를 dict 대신 compact 레코드(PatentRecordList)로 저장할지 여부
+DEFAULT_COMPACT = os.environ.get("PATENT_CACHE_COMPACT", "true").lower() in ("1", "true", "yes")
+
+
+def make_search_key(
+    keywords: List[str],
+    country_codes: List[str] | None,
+    limit: int,
+    **options: Any,
+) -> str:
+    """
+    검색 조건을 정규화해서 캐시 키 문자열로 만든다.
+    - 키워드: 소문자 + 정렬 + 중복 제거 (LIKE 검색이 대소문자 무시이므로)
+    - 국가 코드: 대문자 + 정렬 + 중복 제거
+    - 그 외 옵션: 이름 순으로 정렬해서 포함 (None / 빈 값은 생략해서 필터 없는 검색의 키는 그대로)
+    """
+    normalized = {
+        "keywords": sorted({k.strip().lower() for k in keywords if k and k.strip()}),
+        "countries": sorted({c.strip().upper() for c in (country_codes or []) if c and c.strip()}),
+        "limit": limit,
+    }
+    for name in sorted(options):
+        if options[name] in (None, {}, []):
+            continue
+        normalized[name] = options[name]
+
+    return json.dumps(normalized, ensure_ascii=False, sort_keys=True, default=str)
+
+
+class MemoryCache:
+    """
+    프로세스 메모리 캐시 (LRU + TTL).
+    max_size 를 넘으면 가장 오래 안 쓰인 항목부터 지운다.
+
+    compact=True 면 검색 결과(dict 리스트)를 PatentRecordList 로 바꿔서 저장한다.
+    get() 은 그 PatentRecordList(읽기 전용 Sequence)를 그대로 돌려준다.
+    compact=False 면 리스트를 복사해서 저장한다 (set() 이후 호출 측이 리스트를 고쳐도 캐시 값은 그대로).
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        compact: bool = DEFAULT_COMPACT,
+    ):
+        self.backend = "memory"
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self.compact = compact
+        self._items: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._items[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        if isinstance(value, list):
+            # 호출 측이 넘긴 리스트를 그대로 들고 있으면 나중에 그 리스트를 고칠 때 캐시 값도 바뀐다
+            value = PatentRecordList.from_dicts(value) if self.compact else list(value)
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl_sec, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._items)
+        return {
+            "backend": self.backend,
+            "size": size,
+            "max_size": self.max_size,
+            "ttl_sec": self.ttl_sec,
+            "compact": self.compact,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class SQLiteCache:
+    """
+    SQLite 파일 캐시 (LRU + TTL).
+    서버를 재시작해도 결과가 남아 있어서 같은 BigQuery 스캔을 다시 하지 않는다.
+    값은 JSON 으로 저장하므로 JSON 직렬화 가능한 결과만 넣어야 한다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+    ):
+        self.backend = "sqlite"
+        self.path = path
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+              key TEXT PRIMARY KEY,
+              value TEXT NOT NULL,
+              expires_at REAL NOT NULL,
+              last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_last_access ON search_cache (last_access)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at < now:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        if isinstance(value, PatentRecordList):
+            payload = value.to_json().decode("utf-8")
+        else:
+            payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl_sec, now),
+            )
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+            overflow = size - self.max_size
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM search_cache WHERE key IN ("
+                    "SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        return {
+            "backend": self.backend,
+            "path": self.path,
+            "size": size,
+            "max_size": self.max_size,
+            "ttl_sec": self.ttl_sec,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_cache(
+    backend: str = DEFAULT_BACKEND,
+    max_size: int = DEFAULT_MAX_SIZE,
+    ttl_sec: float = DEFAULT_TTL_SEC,
+    path: str = DEFAULT_SQLITE_PATH,
+):
+    """
+    backend 이름으로 캐시 객체 생성.
+    "none" 이면 None 을 돌려주고, 이 경우 캐시 없이 매번 BigQuery 를 조회한다.
+    """
+    backend = (backend or "none").lower()
+    if backend == "memory":
+        return MemoryCache(max_size=max_size, ttl_sec=ttl_sec)
+    if backend == "sqlite":
+        return SQLiteCache(path=path, max_size=max_size, ttl_sec=ttl_sec)
+    if backend == "none":
+        return None
+    raise ValueError(f"지원하지 않는 캐시 backend: {backend}")
+
+
+_cache = None
+_cache_initialized = False
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """전역 검색 결과 캐시 반환 (처음 호출 시 환경변수 설정으로 생성)"""
+    global _cache, _cache_initialized
+
+    if not _cache_initialized:
+        with _cache_lock:
+            if not _cache_initialized:
+                _cache = create_cache()
+                _cache_initialized = True
+
+    return _cache
+
+
+def set_cache(cache) -> None:
+    """전역 캐시 교체 (테스트나 backend 전환용, None 이면 캐시 끔)"""
+    global _cache, _cache_initialized
+
+    with _cache_lock:
+        _cache = cache
+        _cache_initialized = True
+
+
+def cache_stats() -> Dict[str, Any]:
+    """전역 캐시의 hit/miss/eviction 통계"""
+    cache = get_cache()
+    if cache is None:
+        return {"backend": "none"}
+    return cache.stats()
@@ -0,0 +1,223 @@
+# 파일명: patent_prompt.py
+# LLM 프롬프트 조립: 특허 검색 결과 -> 컨텍스트 블록(텍스트) + 질문.
+#
+# - 컨텍스트 블록은 특허 목록(공개번호 집합) + 결과 필드 + 템플릿 버전 + 토큰 예산별로 한 번만 만들고 재사용한다.
+#   같은 검색 결과로 여러 모델 / 여러 질문을 보낼 때 다시 렌더링하거나 토큰을 다시 세지 않는다.
+# - 블록 안의 특허는 검색 결과 순서(최신 공개일 우선, 같은 날은 공개번호 순)로 정렬해서 넣는다.
+#   그래서 블록은 특허 집합만으로 정해지고, 넘겨준 순서가 달라도 같은 블록을 쓴다.
+# - 토큰 예산을 주면 요약(abstract)을 뒤(오래된) 특허부터 빼고, 그래도 넘치면 뒤 특허를 뺀다.
+# - 블록은 질문보다 앞에 둔다 (같은 특허 블록에 질문만 바뀌는 경우 프롬프트 앞부분이 같아진다).
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from patent_cache import MemoryCache
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성: 없으면 글자 수 기반 추정
+    tiktoken = None
+
+# 블록 형식을 바꾸면 올린다 (캐시에 남아 있는 이전 형식 블록을 쓰지 않도록)
+TEMPLATE_VERSION = "1"
+
+# 컨텍스트 블록 토큰 예산 (0 이면 제한 없음)
+DEFAULT_CONTEXT_TOKEN_BUDGET = int(os.environ.get("PROMPT_CONTEXT_TOKEN_BUDGET", "8000"))
+
+# 컨텍스트 블록 캐시 크기 / 유지 시간
+CONTEXT_CACHE_SIZE = int(os.environ.get("PROMPT_CONTEXT_CACHE_SIZE", "128"))
+CONTEXT_CACHE_TTL_SEC = float(os.environ.get("PROMPT_CONTEXT_CACHE_TTL", "3600"))
+
+# 요약이 너무 길면 이 글자 수에서 자른다
+ABSTRACT_MAX_CHARS = 600
+
+SYSTEM_PROMPT = (
+    "너는 특허 분석을 도와주는 AI 어시스턴트야. "
+    "아래에 제공된 특허 검색 결과를 기반으로만 답변해야 해. "
+    "모르는 내용은 추측하지 말고, 결과 안에서 확인 가능한 내용만 정리해줘."
+)
+
+_CONTEXT_HEADER = "다음은 Google Patents에서 검색한 결과 일부야:"
+_QUESTION_TEMPLATE = "사용자 질문:\n{question}\n\n위 특허 검색 결과를 바탕으로, 핵심 내용을 한국어로 정리해줘."
+
+_encoding = tiktoken.get_encoding("o200k_base") if tiktoken is not None else None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정.
+    tiktoken 이 있으면 o200k_base 로 세고, 없으면 글자 수로 추정한다
+    (ASCII 4자당 1토큰, 한글/한자 등은 1.5자당 1토큰 - 실제보다 조금 많게 잡는 쪽).
+    """
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def patent_text(p: Dict[str, Any], name: str) -> str:
+    """
+    특허의 title / abstract 텍스트.
+    langs 로 요청했으면 서버가 고른 값(p["title"]), 아니면 언어별 lookup(fields 로 요청한 경우)이나
+    *_localized 의 첫 번째 언어.
+    """
+    if p.get(name):
+        return p[name]
+    by_lang = p.get(f"{name}_by_lang")
+    if by_lang:
+        return next(iter(by_lang.values()), "")
+    localized = p.get(f"{name}_localized") or []
+    return next((t.get("text") for t in localized if t.get("text")), "")
+
+
+def _patent_lines(p: Dict[str, Any]) -> Tuple[str, str]:
+    """특허 하나 -> (제목 줄, 요약 줄). 요약이 없으면 요약 줄은 빈 문자열"""
+    title_line = f"- {p.get('publication_number')} ({p.get('publication_date')}): {patent_text(p, 'title')}"
+    abstract = " ".join(patent_text(p, "abstract").split())
+    if len(abstract) > ABSTRACT_MAX_CHARS:
+        abstract = abstract[:ABSTRACT_MAX_CHARS] + "..."
+    return title_line, (f"  요약: {abstract}" if abstract else "")
+
+
+@dataclass(frozen=True)
+class ContextBlock:
+    """
+    프롬프트에 넣을 특허 컨텍스트 블록.
+
+    - included: 블록에 들어간 특허 수 (앞에서부터)
+    - with_abstract: 그중 요약까지 들어간 특허 수 (앞에서부터)
+    - dropped: 토큰 예산 때문에 뺀 특허 수
+    """
+
+    text: str
+    tokens: int
+    included: int
+    with_abstract: int
+    dropped: int
+
+    @property
+    def truncated(self) -> bool:
+        return self.dropped > 0 or self.with_abstract < self.included
+
+
+def _render(
+    lines: Sequence[Tuple[str, str]],
+    included: int,
+    with_abstract: int,
+) -> str:
+    out = [_CONTEXT_HEADER]
+    for i, (title_line, abstract_line) in enumerate(lines[:included]):
+        out.append(title_line)
+        if i < with_abstract and abstract_line:
+            out.append(abstract_line)
+    dropped = len(lines) - included
+    if dropped:
+        out.append(f"(토큰 제한으로 나머지 {dropped}건 생략)")
+    return "\n".join(out)
+
+
+def _fit_to_budget(lines: Sequence[Tuple[str, str]], max_tokens: int) -> ContextBlock:
+    """
+    토큰 예산에 맞는 블록.
+    줄별 토큰 수를 한 번만 세고, 빼는 순서(뒤 특허 요약 -> 뒤 특허)대로 합계에서 빼 나간다.
+    """
+    title_tokens = [estimate_tokens(t) + 1 for t, _ in lines]  # +1: 줄바꿈
+    abstract_tokens = [estimate_tokens(a) + 1 if a else 0 for _, a in lines]
+    header_tokens = estimate_tokens(_CONTEXT_HEADER)
+    note_tokens = estimate_tokens("(토큰 제한으로 나머지 000건 생략)") + 1
+
+    included = with_abstract = len(lines)
+    total = header_tokens + sum(title_tokens) + sum(abstract_tokens)
+
+    if max_tokens > 0:
+        while total > max_tokens and with_abstract > 0:
+            with_abstract -= 1
+            total -= abstract_tokens[with_abstract]
+        while total + (note_tokens if included < len(lines) else 0) > max_tokens and included > 0:
+            included -= 1
+            total -= title_tokens[included]
+        with_abstract = min(with_abstract, included)
+
+    text = _render(lines, included, with_abstract)
+    return ContextBlock(
+        text=text,
+        tokens=estimate_tokens(text),
+        included=included,
+        with_abstract=with_abstract,
+        dropped=len(lines) - included,
+    )
+
+
+_block_cache = MemoryCache(max_size=CONTEXT_CACHE_SIZE, ttl_sec=CONTEXT_CACHE_TTL_SEC, compact=False)
+
+
+def _ordered(patents: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """블록에 넣는 순서: 최신 공개일 우선, 같은 날은 공개번호 순 (공개일이 없으면 맨 뒤)"""
+    ordered = sorted(patents, key=lambda p: str(p.get("publication_number")))
+    ordered.sort(key=lambda p: p.get("publication_date") or 0, reverse=True)
+    return ordered
+
+
+def _block_key(
+    patents: Sequence[Dict[str, Any]],
+    max_tokens: int,
+    fields: Optional[Sequence[str]],
+    langs: Optional[str],
+) -> str:
+    """
+    캐시 키: 템플릿 버전 + 토큰 예산 + 결과 필드/언어 + 정렬한 공개번호.
+    fields 를 안 주면 결과 dict 에 있는 키로 정한다.
+    """
+    numbers = ",".join(sorted(str(p.get("publication_number")) for p in patents))
+    if fields is None:
+        fields = {name for p in patents for name in p}
+    return f"v{TEMPLATE_VERSION}:{max_tokens}:{','.join(sorted(fields))}:{langs or ''}:{numbers}"
+
+
+def render_context(
+    patents: Sequence[Dict[str, Any]],
+    max_tokens: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+    langs: Optional[str] = None,
+) -> ContextBlock:
+    """
+    특허 목록 -> 컨텍스트 블록 (같은 특허 집합/필드/예산이면 캐시된 블록을 돌려준다).
+
+    Args:
+        patents: 검색 결과 (최신 공개일 순으로 정렬해서 넣고, 예산을 넘으면 뒤에서부터 줄인다)
+        max_tokens: 블록 토큰 예산. None 이면 DEFAULT_CONTEXT_TOKEN_BUDGET, 0 이면 제한 없음.
+        fields: 검색할 때 요청한 결과 필드. None 이면 결과 dict 의 키로 정한다.
+        langs: 검색할 때 요청한 선호 언어 (예: "ko,en"). 같은 특허를 다른 언어로 받은 결과와
+               블록이 섞이지 않도록 캐시 키에 넣는다.
+    """
+    budget = DEFAULT_CONTEXT_TOKEN_BUDGET if max_tokens is None else max_tokens
+    key = _block_key(patents, budget, fields, langs)
+
+    block = _block_cache.get(key)
+    if block is None:
+        block = _fit_to_budget([_patent_lines(p) for p in _ordered(patents)], budget)
+        _block_cache.set(key, block)
+    return block
+
+
+def question_text(question: str) -> str:
+    """컨텍스트 블록 뒤에 붙는 질문 부분"""
+    return _QUESTION_TEMPLATE.format(question=question)
+
+
+def build_user_prompt(
+    question: str,
+    patents: Sequence[Dict[str, Any]],
+    max_tokens: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+    langs: Optional[str] = None,
+) -> str:
+    """user 메시지 = 컨텍스트 블록 + 질문"""
+    return f"{render_context(patents, max_tokens, fields, langs).text}\n\n{question_text(question)}"
+
+
+def context_cache_stats() -> Dict[str, Any]:
+    """컨텍스트 블록 캐시 상태 (hit / miss 등)"""
+    return _block_cache.stats()
@@ -0,0 +1,187 @@
+# 파일명: patent_record.py
+# 캐시에 오래 들고 있는 검색 결과용 compact 특허 레코드.
+#
+# 검색 결과 dict 는 특허마다 작은 dict 리스트(title/abstract/assignee/inventor)를 여러 개 가진다.
+# 캐시에 수만 건을 쌓으면 dict 오버헤드가 대부분을 차지하므로,
+# __slots__ dataclass + tuple 로 바꾸고 반복되는 코드 문자열(언어/국가/CPC)은 intern 해서 공유한다.
+
+import itertools
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, Any, Optional, Tuple
+
+from response_encoding import COMPRESS_MIN_BYTES, body_cache, compress, dumps
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """짧고 반복되는 코드 문자열은 같은 객체를 쓰도록 intern"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class LocalizedText:
+    """title_localized / abstract_localized 항목 (truncated 는 title 에만 있음)"""
+    text: Optional[str]
+    language: Optional[str]
+    truncated: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "LocalizedText":
+        return cls(item.get("text"), _intern(item.get("language")), _intern(item.get("truncated")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        item = {"text": self.text, "language": self.language}
+        if self.truncated is not None:
+            item["truncated"] = self.truncated
+        return item
+
+
+@dataclass(frozen=True, slots=True)
+class Party:
+    """assignee / inventor 항목"""
+    name: Optional[str]
+    country_code: Optional[str]
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "Party":
+        return cls(item.get("name"), _intern(item.get("country_code")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "country_code": self.country_code}
+
+
+def _texts(items: Optional[List[Dict[str, Any]]]) -> Optional[Tuple[LocalizedText, ...]]:
+    return None if items is None else tuple(LocalizedText.from_dict(t) for t in items)
+
+
+def _parties(items: Optional[List[Dict[str, Any]]]) -> Optional[Tuple[Party, ...]]:
+    return None if items is None else tuple(Party.from_dict(p) for p in items)
+
+
+def _pairs(by_lang: Optional[Dict[str, str]]) -> Optional[Tuple[Tuple[str, str], ...]]:
+    return None if by_lang is None else tuple((_intern(k), v) for k, v in by_lang.items())
+
+
+def _dicts(items) -> Optional[List[Dict[str, Any]]]:
+    return None if items is None else [item.to_dict() for item in items]
+
+
+@dataclass(frozen=True, slots=True)
+class PatentRecord:
+    """
+    검색 결과 특허 1건 (bigquery_patents_tool.SEARCH_FIELDS 와 같은 필드).
+    fields 로 일부 필드만 조회한 결과면 나머지는 None 이다.
+    """
+    publication_number: Optional[str] = None
+    application_number: Optional[str] = None
+    country_code: Optional[str] = None
+    title_localized: Optional[Tuple[LocalizedText, ...]] = None
+    abstract_localized: Optional[Tuple[LocalizedText, ...]] = None
+    publication_date: Optional[str] = None
+    filing_date: Optional[str] = None
+    assignee: Optional[Tuple[Party, ...]] = None
+    inventor: Optional[Tuple[Party, ...]] = None
+    cpc: Optional[Tuple[str, ...]] = None
+    title_by_lang: Optional[Tuple[Tuple[str, str], ...]] = None
+    abstract_by_lang: Optional[Tuple[Tuple[str, str], ...]] = None
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "PatentRecord":
+        cpc = item.get("cpc")
+        return cls(
+            publication_number=item.get("publication_number"),
+            application_number=item.get("application_number"),
+            country_code=_intern(item.get("country_code")),
+            title_localized=_texts(item.get("title_localized")),
+            abstract_localized=_texts(item.get("abstract_localized")),
+            publication_date=item.get("publication_date"),
+            filing_date=item.get("filing_date"),
+            assignee=_parties(item.get("assignee")),
+            inventor=_parties(item.get("inventor")),
+            cpc=None if cpc is None else tuple(_intern(c) for c in cpc),
+            title_by_lang=_pairs(item.get("title_by_lang")),
+            abstract_by_lang=_pairs(item.get("abstract_by_lang")),
+        )
+
+    def to_dict(self, fields: Iterable[str]) -> Dict[str, Any]:
+        """검색 결과와 같은 모양의 dict (fields 에 있는 필드만)"""
+        item: Dict[str, Any] = {}
+        for field in fields:
+            value = getattr(self, field)
+            if field in ("title_localized", "abstract_localized", "assignee", "inventor"):
+                value = _dicts(value)
+            elif value is None:
+                pass
+            elif field == "cpc":
+                value = list(value)
+            elif field in ("title_by_lang", "abstract_by_lang"):
+                value = dict(value)
+            item[field] = value
+        return item
+
+
+class PatentRecordList(Sequence):
+    """
+    PatentRecord 묶음 + 공통 필드 목록.
+
+    읽기 전용 Sequence 로, 인덱싱/순회하면 검색 결과와 같은 dict 를 만들어 준다
+    (리스트가 필요한 곳에서는 list(records) 로 바꿔 쓴다).
+    압축한 응답 본문(encode)은 객체에 붙이지 않고 크기 제한이 있는
+    response_encoding.body_cache 에 둔다 (자주 나가는 결과만 다시 직렬화/압축하지 않는다).
+    """
+
+    __slots__ = ("fields", "records", "_body_id")
+
+    # body_cache 키 (id() 는 객체가 사라진 뒤 재사용될 수 있으므로 따로 번호를 준다)
+    _body_ids = itertools.count()
+
+    def __init__(self, records: Iterable[PatentRecord], fields: Iterable[str]):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.records: Tuple[PatentRecord, ...] = tuple(records)
+        self._body_id = next(self._body_ids)
+
+    @classmethod
+    def from_dicts(cls, items: List[Dict[str, Any]]) -> "PatentRecordList":
+        """검색 결과 dict 리스트 -> PatentRecordList (필드 목록은 첫 결과 기준)"""
+        fields = list(items[0]) if items else []
+        return cls((PatentRecord.from_dict(item) for item in items), fields)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [record.to_dict(self.fields) for record in self.records[index]]
+        return self.records[index].to_dict(self.fields)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PatentRecordList):
+            other = other.to_dicts()
+        return isinstance(other, list) and self.to_dicts() == other
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [record.to_dict(self.fields) for record in self.records]
+
+    def to_json(self) -> bytes:
+        """검색 결과 JSON 배열 (보관하지 않고 매번 직렬화)"""
+        return dumps(self.to_dicts())
+
+    def encode(self, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """
+        응답 본문 + 실제로 적용한 압축 방식.
+        encoding("gzip" / "br") 으로 압축한 본문은 body_cache 에 두고 재사용한다.
+        encoding 이 None 이거나 JSON 이 COMPRESS_MIN_BYTES 보다 작으면 압축하지 않은 JSON.
+        """
+        if encoding is None:
+            return self.to_json(), None
+
+        key = (self._body_id, encoding)
+        body = body_cache.get(key)
+        if body is None:
+            body = self.to_json()
+            if len(body) < COMPRESS_MIN_BYTES:
+                return body, None
+            body = compress(body, encoding)
+            body_cache.set(key, body)
+        return body, encoding
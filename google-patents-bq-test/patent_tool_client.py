@@ -0,0 +1,299 @@
+# 파일명: patent_tool_client.py
+# ai_tool_demo / 에이전트 툴 호출에서 쓰는 특허 검색 클라이언트.
+#
+# transport 별 동작:
+#   - "http":   실행 중인 FastAPI 서버(PATENT_TOOL_URL)에 keep-alive 세션으로 요청 (커넥션 재사용)
+#   - "asgi":   같은 프로세스의 app.main.app 을 네트워크 없이 호출 (파라미터 검증/응답 형식은 서버와 동일)
+#   - "direct": bigquery_patents_tool / bigquery_async 검색 함수를 바로 호출 (HTTP, JSON 인코딩/디코딩 없음)
+#
+# asgi / direct 는 BigQuery 인증과 검색 설정(환경변수)이 이 프로세스에 있어야 한다.
+
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# 검색 서버 주소 (transport=http)
+PATENT_TOOL_URL = os.environ.get("PATENT_TOOL_URL", "http://localhost:8000")
+
+# 기본 transport: http / asgi / direct
+PATENT_TOOL_TRANSPORT = os.environ.get("PATENT_TOOL_TRANSPORT", "http").lower()
+
+# 검색 서버로 가는 HTTP 커넥션 풀 크기
+PATENT_TOOL_POOL_SIZE = int(os.environ.get("PATENT_TOOL_POOL_SIZE", "10"))
+
+TRANSPORTS = ("http", "asgi", "direct")
+
+SEARCH_TIMEOUT_SEC = 30
+BATCH_TIMEOUT_SEC = 60
+
+
+def _split_csv(value: str | None, upper: bool = False) -> List[str] | None:
+    """쉼표 구분 문자열 -> 리스트 (app.main 의 쿼리 파라미터 처리와 같다)"""
+    if not value:
+        return None
+    items = [v.strip() for v in value.split(",") if v.strip()]
+    if upper:
+        items = [v.upper() for v in items]
+    return items or None
+
+
+def _search_params(
+    keyword: str,
+    limit: int,
+    countries: str | None,
+    fields: str | None,
+    langs: str | None,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"keyword": keyword, "limit": limit}
+    if countries:
+        params["countries"] = countries
+    if fields:
+        params["fields"] = fields
+    if langs:
+        params["langs"] = langs
+    return params
+
+
+def _batch_body(searches: List[Dict[str, Any]], fields: str | None, langs: str | None) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"searches": searches}
+    if fields:
+        body["fields"] = fields
+    if langs:
+        body["langs"] = langs
+    return body
+
+
+def _batch_specs(searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """HTTP 배치 요청 형식({"keyword", "countries", "limit", 날짜/CPC 필터}) -> search_patents_batch 조건 형식"""
+    from bigquery_patents_tool import search_filters
+
+    return [
+        {
+            "keywords": _split_csv(s["keyword"]),
+            "country_codes": _split_csv(s.get("countries"), upper=True),
+            "limit": s.get("limit", 20),
+            "filters": search_filters(
+                s.get("publication_date_from"), s.get("publication_date_to"),
+                s.get("filing_date_from"), s.get("filing_date_to"),
+                _split_csv(s.get("cpc_prefix"), upper=True),
+            ),
+        }
+        for s in searches
+    ]
+
+
+class PatentToolClient:
+    """
+    특허 검색 툴 클라이언트 (sync / async).
+
+    - http 세션(httpx.Client / AsyncClient)은 처음 쓸 때 한 번만 만들고 재사용한다
+    - async 세션의 커넥션은 처음 사용한 이벤트 루프에 묶이므로 같은 루프 안에서 aclose() 한다
+    - sync asgi 세션은 TestClient 를 한 번 열어(__enter__) 이벤트 루프 스레드 하나와 앱 lifespan 을
+      유지하고, close() 에서 닫는다 (lifespan 종료 시 BigQuery 클라이언트도 정리된다)
+    - 반환값은 어느 transport 든 같은 형식의 특허 dict 리스트
+    """
+
+    def __init__(
+        self,
+        transport: str = PATENT_TOOL_TRANSPORT,
+        base_url: str = PATENT_TOOL_URL,
+        pool_size: int = PATENT_TOOL_POOL_SIZE,
+    ):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"지원하지 않는 transport: {transport} (사용 가능: {', '.join(TRANSPORTS)})")
+        self.transport = transport
+        self.base_url = base_url
+        self.limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self._session: Optional[httpx.Client] = None
+        self._async_session: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> httpx.Client:
+        session = self._session
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._session is None:
+                if self.transport == "asgi":
+                    from starlette.testclient import TestClient
+                    from app.main import app
+
+                    # with 블록 없이 쓰면 요청마다 portal(스레드 + 이벤트 루프)을 새로 만들고
+                    # lifespan 도 실행되지 않으므로, 여기서 열어 두고 close() 에서 닫는다
+                    self._session = TestClient(app).__enter__()
+                else:
+                    self._session = httpx.Client(base_url=self.base_url, limits=self.limits)
+            return self._session
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        session = self._async_session
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._async_session is None:
+                if self.transport == "asgi":
+                    from app.main import app
+
+                    self._async_session = httpx.AsyncClient(
+                        transport=httpx.ASGITransport(app=app), base_url="http://patent-tool"
+                    )
+                else:
+                    self._async_session = httpx.AsyncClient(base_url=self.base_url, limits=self.limits)
+            return self._async_session
+
+    def search(
+        self,
+        keyword: str,
+        limit: int = 5,
+        countries: str | None = None,
+        fields: str | None = None,
+        langs: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """GET /patents/search 와 같은 검색 (인자 형식도 같다)"""
+        if self.transport == "direct":
+            from bigquery_patents_tool import search_patents_by_keyword, select_languages
+
+            results = search_patents_by_keyword(
+                _split_csv(keyword),
+                limit=limit,
+                country_codes=_split_csv(countries, upper=True),
+                fields=_split_csv(fields),
+            )
+            return select_languages(results, langs) if langs else list(results)
+
+        resp = self._get_session().get(
+            "/patents/search",
+            params=_search_params(keyword, limit, countries, fields, langs),
+            timeout=SEARCH_TIMEOUT_SEC,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def search_batch(
+        self,
+        searches: List[Dict[str, Any]],
+        fields: str | None = None,
+        langs: str | None = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """POST /patents/search/batch 와 같은 배치 검색"""
+        if self.transport == "direct":
+            from bigquery_patents_tool import search_patents_batch, select_languages
+
+            results = search_patents_batch(_batch_specs(searches), fields=_split_csv(fields))
+            return [select_languages(r, langs) if langs else list(r) for r in results]
+
+        resp = self._get_session().post(
+            "/patents/search/batch",
+            json=_batch_body(searches, fields, langs),
+            timeout=BATCH_TIMEOUT_SEC,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def asearch(
+        self,
+        keyword: str,
+        limit: int = 5,
+        countries: str | None = None,
+        fields: str | None = None,
+        langs: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """search() 의 비동기 버전"""
+        if self.transport == "direct":
+            from bigquery_async import search_patents_async
+            from bigquery_patents_tool import select_languages
+
+            results, _ = await search_patents_async(
+                _split_csv(keyword),
+                limit=limit,
+                country_codes=_split_csv(countries, upper=True),
+                fields=_split_csv(fields),
+            )
+            return select_languages(results, langs) if langs else list(results)
+
+        resp = await self._get_async_session().get(
+            "/patents/search",
+            params=_search_params(keyword, limit, countries, fields, langs),
+            timeout=SEARCH_TIMEOUT_SEC,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def asearch_batch(
+        self,
+        searches: List[Dict[str, Any]],
+        fields: str | None = None,
+        langs: str | None = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """search_batch() 의 비동기 버전"""
+        if self.transport == "direct":
+            from bigquery_async import search_patents_batch_async
+            from bigquery_patents_tool import select_languages
+
+            results, _ = await search_patents_batch_async(_batch_specs(searches), fields=_split_csv(fields))
+            return [select_languages(r, langs) if langs else list(r) for r in results]
+
+        resp = await self._get_async_session().post(
+            "/patents/search/batch",
+            json=_batch_body(searches, fields, langs),
+            timeout=BATCH_TIMEOUT_SEC,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def close(self) -> None:
+        """sync 세션 정리 (asgi 면 앱 lifespan 종료까지)"""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is None:
+            return
+        if self.transport == "asgi":
+            session.__exit__(None, None, None)
+        else:
+            session.close()
+
+    async def aclose(self) -> None:
+        """async 세션 정리 (세션을 쓴 이벤트 루프 안에서 호출)"""
+        with self._lock:
+            session, self._async_session = self._async_session, None
+        if session is not None:
+            await session.aclose()
+
+
+_client: Optional[PatentToolClient] = None
+_client_lock = threading.Lock()
+
+
+def configure_patent_tool(
+    transport: str = PATENT_TOOL_TRANSPORT,
+    base_url: str = PATENT_TOOL_URL,
+    pool_size: int = PATENT_TOOL_POOL_SIZE,
+) -> PatentToolClient:
+    """
+    전역 클라이언트 설정.
+    이미 만들어진 sync 세션이 있으면 닫고 새 설정으로 교체한다.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = PatentToolClient(transport, base_url, pool_size)
+        return _client
+
+
+def get_patent_tool() -> PatentToolClient:
+    """전역 공유 클라이언트 반환 (없으면 기본 설정으로 생성)"""
+    global _client
+
+    client = _client
+    if client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PatentToolClient()
+            client = _client
+    return client
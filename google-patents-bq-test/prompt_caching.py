@@ -0,0 +1,142 @@
+# 파일명: prompt_caching.py
+# 제공사 프롬프트 캐싱.
+#
+# 같은 특허 블록에 질문만 바꿔서 여러 번 물어보는 경우, 고정된 앞부분(system 프롬프트 + 특허 컨텍스트 블록)을
+# 제공사 쪽에서 캐시하면 입력 토큰 비용과 첫 토큰까지의 지연이 줄어든다 (batch_caching.md 참고).
+#   - Claude: 컨텍스트 블록 끝에 cache_control 브레이크포인트 (system + 블록까지 캐시).
+#             모델별 최소 토큰 수보다 짧으면 캐시되지 않으므로 브레이크포인트를 붙이지 않는다.
+#   - OpenAI: 앞부분 1,024 토큰 이상이 같으면 자동 캐시. prompt_cache_key 로 같은 블록 요청을 같은 캐시로 보낸다.
+#   - Gemini 2.5: 암시적(implicit) 캐시가 자동 적용 (설정 없음).
+# cache_usage() 는 제공사별 usage 에서 캐시 쓰기/읽기 토큰을 꺼내 같은 형식으로 돌려준다.
+
+import hashlib
+import os
+from typing import Any, Dict, List
+
+from patent_prompt import ContextBlock, estimate_tokens
+
+# 프롬프트 캐싱 사용 여부
+PROMPT_CACHE_ENABLED = os.environ.get("LLM_PROMPT_CACHE", "true").lower() in ("1", "true", "yes")
+
+# Claude 캐시 유지 시간: "5m" (쓰기 1.25배) / "1h" (쓰기 2배)
+CLAUDE_CACHE_TTL = os.environ.get("CLAUDE_PROMPT_CACHE_TTL", "5m")
+
+# 제공사별 최소 캐시 토큰 수 (모델 id prefix, 앞에 있는 것 우선)
+MIN_CACHE_TOKENS = {
+    "anthropic": [
+        ("claude-opus-4-5", 4096),
+        ("claude-haiku-4-5", 4096),
+        ("claude-3-5-haiku", 2048),
+        ("claude-3-haiku", 2048),
+        ("claude-", 1024),
+    ],
+    "openai": [("", 1024)],
+    "gemini": [
+        ("gemini-2.5-flash", 1024),
+        ("gemini-2.5-pro", 4096),
+        ("", 4096),
+    ],
+}
+
+# 캐시 읽기 / 쓰기 입력 토큰 단가 배수 (기본 입력 단가 대비, 제공사 문서 기준)
+_CACHE_READ_MULTIPLIER = {"anthropic": 0.1, "openai": 0.1, "gemini": 0.25}
+_CLAUDE_CACHE_WRITE_MULTIPLIER = {"5m": 1.25, "1h": 2.0}
+
+
+def min_cache_tokens(provider: str, model: str) -> int:
+    """모델의 최소 캐시 토큰 수 (모르는 모델은 해당 제공사의 가장 큰 값)"""
+    rules = MIN_CACHE_TOKENS[provider]
+    for prefix, tokens in rules:
+        if model.startswith(prefix):
+            return tokens
+    return max(tokens for _, tokens in rules)
+
+
+def prefix_tokens(system: str, context: ContextBlock) -> int:
+    """캐시 대상 앞부분(system 프롬프트 + 컨텍스트 블록) 토큰 수 추정"""
+    return estimate_tokens(system) + context.tokens
+
+
+def is_cacheable(provider: str, model: str, system: str, context: ContextBlock) -> bool:
+    """앞부분이 최소 캐시 토큰 수 이상인지"""
+    return PROMPT_CACHE_ENABLED and prefix_tokens(system, context) >= min_cache_tokens(provider, model)
+
+
+def claude_request(
+    model: str,
+    system: str,
+    context: ContextBlock,
+    question: str,
+) -> Dict[str, Any]:
+    """
+    messages.create() 의 system / messages 인자.
+    user 메시지를 [컨텍스트 블록, 질문] 두 텍스트 블록으로 나누고,
+    캐시 가능하면 컨텍스트 블록에 cache_control 을 붙인다 (브레이크포인트 1개: system + 블록).
+    """
+    context_part: Dict[str, Any] = {"type": "text", "text": context.text}
+    if is_cacheable("anthropic", model, system, context):
+        cache_control = {"type": "ephemeral"}
+        if CLAUDE_CACHE_TTL != "5m":
+            cache_control["ttl"] = CLAUDE_CACHE_TTL
+        context_part["cache_control"] = cache_control
+
+    content: List[Dict[str, Any]] = [context_part, {"type": "text", "text": question}]
+    return {
+        "system": system,
+        "messages": [{"role": "user", "content": content}],
+    }
+
+
+def openai_cache_args(system: str, context: ContextBlock) -> Dict[str, Any]:
+    """
+    responses.create() 추가 인자.
+    같은 system + 블록 요청이 같은 캐시 서버로 가도록 prompt_cache_key 를 블록 해시로 준다.
+    """
+    if not PROMPT_CACHE_ENABLED:
+        return {}
+    digest = hashlib.sha256(f"{system}\n{context.text}".encode("utf-8")).hexdigest()[:32]
+    return {"prompt_cache_key": f"patents-{digest}"}
+
+
+def cache_usage(provider: str, response: Any) -> Dict[str, Any]:
+    """
+    응답 usage -> 캐시 토큰 통계.
+
+    Returns:
+        input_tokens: 전체 입력 토큰 (캐시 읽기/쓰기 포함)
+        cache_write_tokens: 이번 호출에서 캐시에 쓴 토큰 (Claude 만 따로 과금)
+        cache_read_tokens: 캐시에서 읽은 토큰
+        output_tokens: 출력 토큰
+        input_cost_ratio: 캐시를 안 썼을 때 대비 입력 비용 비율 (1.0 = 같음, 0.1 = 90% 절감)
+    """
+    write = read = 0
+    if provider == "anthropic":
+        usage = response.usage
+        write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        input_tokens = usage.input_tokens + write + read
+        output_tokens = usage.output_tokens
+    elif provider == "openai":
+        usage = response.usage
+        details = getattr(usage, "input_tokens_details", None)
+        read = getattr(details, "cached_tokens", None) or 0
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+    elif provider == "gemini":
+        usage = response.usage_metadata
+        read = getattr(usage, "cached_content_token_count", None) or 0
+        input_tokens = usage.prompt_token_count or 0
+        output_tokens = usage.candidates_token_count or 0
+    else:
+        raise ValueError(f"지원하지 않는 제공사: {provider}")
+
+    write_multiplier = _CLAUDE_CACHE_WRITE_MULTIPLIER.get(CLAUDE_CACHE_TTL, 1.25) if provider == "anthropic" else 1.0
+    cost = (input_tokens - write - read) + write * write_multiplier + read * _CACHE_READ_MULTIPLIER[provider]
+
+    return {
+        "input_tokens": input_tokens,
+        "cache_write_tokens": write,
+        "cache_read_tokens": read,
+        "output_tokens": output_tokens,
+        "input_cost_ratio": cost / input_tokens if input_tokens else 1.0,
+    }
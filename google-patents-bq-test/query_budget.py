@@ -0,0 +1,236 @@
+# 파일명: query_budget.py
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import date
+from typing import List, Dict, Any, Optional
+
+from google.cloud import bigquery
+
+from metrics import (
+    bigquery_bytes_billed,
+    bigquery_bytes_processed,
+    bigquery_job_seconds,
+    bigquery_jobs,
+    bigquery_slot_millis,
+)
+
+# BigQuery on-demand 가격 (1 TiB당 USD, 무료 제공량 1 TiB/월 초과분)
+PRICE_PER_TIB_USD = 6.25
+TIB = 1024 ** 4
+
+# 쿼리 1건당 최대 과금 바이트 (초과 시 BigQuery가 잡을 실패 처리, 과금 없음)
+# 0 이면 제한 없음
+MAX_BYTES_BILLED_PER_QUERY = int(os.environ.get("BQ_MAX_BYTES_BILLED_PER_QUERY", str(200 * 1024 ** 3)))
+
+# 하루 최대 과금 바이트 (0 이면 제한 없음)
+DAILY_BYTES_BUDGET = int(os.environ.get("BQ_DAILY_BYTES_BUDGET", "0"))
+
+# /jobs/stats 에 보여줄 최근 쿼리 기록 수
+RECENT_QUERY_LOG_SIZE = int(os.environ.get("BQ_RECENT_QUERY_LOG_SIZE", "50"))
+
+
+class BytesBudgetExceeded(Exception):
+    """쿼리 예상 스캔 바이트가 1건 한도 또는 일일 잔여 한도를 넘을 때 발생"""
+
+
+def estimate_cost_usd(num_bytes: int | None) -> float:
+    """스캔 바이트 -> 예상 비용 (USD, 무료 제공량 미반영)"""
+    return round((num_bytes or 0) / TIB * PRICE_PER_TIB_USD, 6)
+
+
+def resolve_max_bytes_billed(requested: int | None = None) -> Optional[int]:
+    """
+    쿼리 1건의 maximum_bytes_billed 결정.
+    요청값이 있으면 서버 한도와 비교해 작은 값을 쓴다.
+    """
+    limits = [v for v in (requested, MAX_BYTES_BILLED_PER_QUERY) if v]
+    return min(limits) if limits else None
+
+
+def apply_max_bytes_billed(
+    job_config: bigquery.QueryJobConfig,
+    requested: int | None = None,
+) -> Optional[int]:
+    """job_config 에 maximum_bytes_billed 를 설정하고, 설정한 값을 반환"""
+    cap = resolve_max_bytes_billed(requested)
+    if cap:
+        job_config.maximum_bytes_billed = cap
+    return cap
+
+
+def dry_run_config(job_config: bigquery.QueryJobConfig | None = None) -> bigquery.QueryJobConfig:
+    """기존 job_config 를 복사해서 dry run 용 설정으로 만든다"""
+    config = bigquery.QueryJobConfig.from_api_repr(
+        job_config.to_api_repr() if job_config is not None else {}
+    )
+    config.dry_run = True
+    config.use_query_cache = False
+    return config
+
+
+class DailyBytesBudget:
+    """
+    하루 동안 과금된 바이트 누적 + 한도 확인.
+    날짜가 바뀌면 사용량을 0으로 되돌린다 (프로세스 로컬 기준).
+    """
+
+    def __init__(self, limit_bytes: int = DAILY_BYTES_BUDGET):
+        self.limit_bytes = limit_bytes
+        self._day = date.today()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_bytes > 0
+
+    def _roll_day(self) -> None:
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+
+    def remaining(self) -> Optional[int]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._roll_day()
+            return max(self.limit_bytes - self._used, 0)
+
+    def check(self, estimated_bytes: int) -> None:
+        """예상 바이트가 잔여 한도를 넘으면 BytesBudgetExceeded"""
+        remaining = self.remaining()
+        if remaining is not None and estimated_bytes > remaining:
+            raise BytesBudgetExceeded(
+                f"일일 BigQuery 스캔 한도 초과: 예상 {estimated_bytes:,} bytes, "
+                f"잔여 {remaining:,} bytes"
+            )
+
+    def record(self, billed_bytes: int | None) -> None:
+        with self._lock:
+            self._roll_day()
+            self._used += billed_bytes or 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._roll_day()
+            used = self._used
+        return {
+            "day": self._day.isoformat(),
+            "used_bytes": used,
+            "used_cost_usd": estimate_cost_usd(used),
+            "daily_limit_bytes": self.limit_bytes or None,
+            "remaining_bytes": max(self.limit_bytes - used, 0) if self.enabled else None,
+            "max_bytes_billed_per_query": MAX_BYTES_BILLED_PER_QUERY or None,
+        }
+
+
+daily_budget = DailyBytesBudget()
+
+
+def needs_estimate(max_bytes_billed: int | None = None) -> bool:
+    """
+    잡 제출 전에 dry run 으로 스캔량을 확인해야 하는지.
+    1건 한도(기본 200 GiB)나 일일 한도가 하나라도 있으면 True.
+    BigQuery 가 maximum_bytes_billed 로 잡을 실패시키기 전에 BytesBudgetExceeded 로 거절하기 위해서다.
+    """
+    return daily_budget.enabled or bool(resolve_max_bytes_billed(max_bytes_billed))
+
+
+def is_bytes_limit_error(error: Any) -> bool:
+    """
+    maximum_bytes_billed 초과로 실패한 잡의 오류인지.
+    error: google.api_core 예외(.errors 리스트) 또는 QueryJob.error_result dict
+    """
+    if isinstance(error, dict):
+        errors = [error]
+    else:
+        errors = getattr(error, "errors", None) or []
+    return any(isinstance(e, dict) and e.get("reason") == "bytesBilledLimitExceeded" for e in errors)
+
+
+def check_estimate(estimated_bytes: int, max_bytes_billed: int | None = None) -> None:
+    """
+    dry run 추정치를 1건 한도와 일일 잔여 한도에 비교.
+    넘으면 잡을 제출하지 않도록 BytesBudgetExceeded 를 던진다.
+    """
+    cap = resolve_max_bytes_billed(max_bytes_billed)
+    if cap and estimated_bytes > cap:
+        raise BytesBudgetExceeded(
+            f"쿼리 1건 스캔 한도 초과: 예상 {estimated_bytes:,} bytes, 한도 {cap:,} bytes"
+        )
+    daily_budget.check(estimated_bytes)
+
+
+def _elapsed_ms(start, end) -> Optional[int]:
+    if start is None or end is None:
+        return None
+    return int((end - start).total_seconds() * 1000)
+
+
+def job_stats(job) -> Dict[str, Any]:
+    """
+    잡 통계 요약: 스캔/과금 바이트, slot-ms, 쿼리 캐시 hit,
+    대기 시간(queue_ms: 생성 -> 시작)과 실행 시간(execution_ms: 시작 -> 종료)
+    """
+    return {
+        "job_id": getattr(job, "job_id", None),
+        "total_bytes_processed": getattr(job, "total_bytes_processed", None),
+        "total_bytes_billed": getattr(job, "total_bytes_billed", None),
+        "slot_millis": getattr(job, "slot_millis", None),
+        "cache_hit": getattr(job, "cache_hit", None),
+        "queue_ms": _elapsed_ms(getattr(job, "created", None), getattr(job, "started", None)),
+        "execution_ms": _elapsed_ms(getattr(job, "started", None), getattr(job, "ended", None)),
+    }
+
+
+class QueryLog:
+    """
+    최근 실행한 BigQuery 잡의 스캔/과금 바이트 기록 (프로세스 로컬, 최대 max_size 건).
+    필터를 바꿨을 때 실제로 스캔량이 줄었는지 쿼리 단위로 확인하는 용도.
+    """
+
+    def __init__(self, max_size: int = RECENT_QUERY_LOG_SIZE):
+        self._entries: "deque[Dict[str, Any]]" = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+
+    def add(self, job, kind: str, **labels: Any) -> None:
+        stats = job_stats(job)
+        entry = {
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "kind": kind,
+            **stats,
+            "estimated_cost_usd": estimate_cost_usd(stats["total_bytes_billed"]),
+        }
+        entry.update({k: v for k, v in labels.items() if v})
+        with self._lock:
+            self._entries.append(entry)
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """최근 기록 (최신 순)"""
+        with self._lock:
+            return list(reversed(self._entries))
+
+
+query_log = QueryLog()
+
+
+def record_job(job, kind: str = "search", **labels: Any) -> None:
+    """
+    완료된 잡의 과금 바이트를 일일 사용량에 더하고, 최근 쿼리 기록과 /metrics 지표에 남긴다.
+    labels 에는 필터 등 쿼리를 구분할 정보를 넣는다 (빈 값은 생략).
+    """
+    daily_budget.record(job.total_bytes_billed)
+    query_log.add(job, kind, **labels)
+
+    stats = job_stats(job)
+    bigquery_jobs.inc(kind=kind, cache_hit=str(bool(stats["cache_hit"])).lower())
+    bigquery_bytes_processed.inc(stats["total_bytes_processed"] or 0, kind=kind)
+    bigquery_bytes_billed.inc(stats["total_bytes_billed"] or 0, kind=kind)
+    bigquery_slot_millis.inc(stats["slot_millis"] or 0, kind=kind)
+    for phase in ("queue", "execution"):
+        if stats[f"{phase}_ms"] is not None:
+            bigquery_job_seconds.observe(stats[f"{phase}_ms"] / 1000, kind=kind, phase=phase)
@@ -0,0 +1,108 @@
+# 파일명: record_memory_benchmark.py
+# 검색 결과 메모리 사용량 비교: dict 리스트 vs PatentRecordList (__slots__ + intern)
+# PatentRecordList 는 응답을 한 번 보낸 뒤(gzip 본문이 body_cache 에 들어간 상태)도 따로 잰다.
+#
+# bq-google-patents.json 의 특허 1건을 N개로 복제하되, 실제 BigQuery 응답처럼
+# 문자열이 row 마다 별도 객체가 되도록 JSON 으로 한 번 직렬화했다가 다시 읽는다.
+#
+# 사용 예:
+#   python record_memory_benchmark.py --rows 10000 50000 --report record_memory_benchmark.md
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+from typing import List, Dict, Any
+
+from bigquery_patents_tool import _search_rows_to_results
+from normalize_benchmark import SAMPLE_PATH, _load_sample_record, _make_records, _to_rows
+from patent_record import PatentRecordList
+from response_encoding import BODY_CACHE_MAX_BYTES, body_cache
+
+
+def _search_results_json(n: int) -> str:
+    """정규화된 검색 결과 n건을 JSON 문자열로 (title/abstract 는 row 마다 다른 텍스트)"""
+    results = _search_rows_to_results(_to_rows(_make_records(_load_sample_record(), n)))
+    for i, item in enumerate(results):
+        for t in item["title_localized"] + (item["abstract_localized"] or []):
+            t["text"] = f"{t['text']} #{i}"
+    return json.dumps(results, ensure_ascii=False)
+
+
+def _traced_bytes(build) -> int:
+    """build() 가 만든 객체가 살아 있는 동안의 메모리 증가량"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current
+
+
+def _served(records: PatentRecordList) -> PatentRecordList:
+    """캐시 hit 응답을 한 번 보낸 상태 (app.main._json_response 와 같은 호출)"""
+    records.encode("gzip")
+    return records
+
+
+def run_benchmark(row_counts: List[int]) -> List[Dict[str, Any]]:
+    results = []
+    for n in row_counts:
+        payload = _search_results_json(n)
+        dict_bytes = _traced_bytes(lambda: json.loads(payload))
+        compact_bytes = _traced_bytes(lambda: PatentRecordList.from_dicts(json.loads(payload)))
+        body_cache.clear()
+        served_bytes = _traced_bytes(lambda: _served(PatentRecordList.from_dicts(json.loads(payload))))
+        body_cache.clear()
+        results.append({
+            "rows": n,
+            "dict_bytes": dict_bytes,
+            "compact_bytes": compact_bytes,
+            "served_bytes": served_bytes,
+            "ratio": compact_bytes / dict_bytes,
+            "served_ratio": served_bytes / dict_bytes,
+        })
+    return results
+
+
+def to_markdown(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        "# 검색 결과 메모리 벤치마크",
+        "",
+        f"- **측정 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"- **샘플:** {SAMPLE_PATH} 1건 복제 (전체 필드, 제목/요약 텍스트는 row 마다 다름)",
+        "- **측정:** tracemalloc (결과 객체가 살아 있는 상태의 할당량)",
+        f"- **응답 후:** gzip 압축 본문(body_cache) 포함 (body_cache 한도 {BODY_CACHE_MAX_BYTES / 1024 ** 2:,.0f} MiB, 넘는 본문은 보관 안 함)",
+        "",
+        "| rows | dict 리스트 | PatentRecordList | PatentRecordList (응답 후) | 건당 (dict → compact) | 비율 | 비율 (응답 후) |",
+        "|------|-------------|------------------|----------------------------|-----------------------|------|----------------|",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['rows']:,} | {r['dict_bytes'] / 1024 ** 2:,.1f} MiB "
+            f"| {r['compact_bytes'] / 1024 ** 2:,.1f} MiB "
+            f"| {r['served_bytes'] / 1024 ** 2:,.1f} MiB "
+            f"| {r['dict_bytes'] / r['rows']:,.0f} → {r['compact_bytes'] / r['rows']:,.0f} bytes "
+            f"| {r['ratio']:.0%} | {r['served_ratio']:.0%} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="검색 결과 메모리 사용량 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--report", help="결과를 저장할 markdown 파일 경로")
+    args = parser.parse_args()
+
+    report = to_markdown(run_benchmark(args.rows))
+    print(report)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# 파일명: response_encoding.py
+# 검색 응답 JSON 직렬화 + 압축.
+#
+# FastAPI 기본 경로는 응답을 jsonable_encoder 로 한 번 훑어서 복사한 뒤 json.dumps 한다.
+# 검색 결과는 이미 JSON 타입(dict/list/str/int/None)만 들어 있으므로
+# orjson 으로 바로 bytes 를 만들고, Accept-Encoding 에 따라 gzip/brotli 로 압축해서 보낸다.
+
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip 만 사용
+    brotli = None
+
+# 응답 압축 사용 여부
+COMPRESSION_ENABLED = os.environ.get("PATENT_RESPONSE_COMPRESSION", "true").lower() in ("1", "true", "yes")
+
+# 이보다 작은 응답은 압축하지 않는다 (압축 이득보다 CPU 비용이 큼)
+COMPRESS_MIN_BYTES = int(os.environ.get("PATENT_COMPRESS_MIN_BYTES", "1024"))
+
+# 압축 수준 (응답마다 압축하므로 속도 위주)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+# 캐시된 검색 결과의 압축 본문을 보관할 전체 크기 (bytes, 0 이면 보관하지 않음)
+BODY_CACHE_MAX_BYTES = int(os.environ.get("PATENT_BODY_CACHE_MAX_BYTES", str(32 * 1024 ** 2)))
+
+
+def dumps(content: Any) -> bytes:
+    """JSON bytes (UTF-8, 한글 그대로, 공백 없음)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br 우선, 그 다음 gzip).
+    q=0 으로 거절한 방식은 쓰지 않는다.
+    """
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class BodyCache:
+    """
+    압축된 응답 본문 캐시 (LRU, 항목 수가 아니라 본문 bytes 합계로 제한).
+
+    검색 결과 캐시 항목마다 JSON / 압축 본문을 붙여 두면 본문이 결과 객체보다 커서
+    compact 레코드로 줄인 메모리가 다시 늘어난다. 압축 본문만 여기에 따로 두고
+    max_bytes 를 넘으면 가장 오래 안 쓰인 본문부터 버린다 (버려지면 다음 응답에서 다시 만든다).
+    압축하지 않은 JSON 은 orjson 으로 다시 만드는 비용이 작으므로 보관하지 않는다.
+    """
+
+    def __init__(self, max_bytes: int = BODY_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            body = self._items.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        """max_bytes 보다 큰 본문은 보관하지 않는다"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+body_cache = BodyCache()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 으로 직렬화하는 JSON 응답 (bytes 를 넘기면 그대로 보낸다).
+    FastAPI default_response_class 로 쓰면 일반 엔드포인트도 orjson 을 쓴다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def encoded_response(
+    body: bytes,
+    accept_encoding: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    status_code: int = 200,
+) -> FastJSONResponse:
+    """
+    직렬화된 JSON bytes -> 응답.
+    COMPRESS_MIN_BYTES 이상이고 클라이언트가 받으면 gzip/brotli 로 압축한다.
+    """
+    encoding = negotiate_encoding(accept_encoding) if len(body) >= COMPRESS_MIN_BYTES else None
+    if encoding is not None:
+        body = compress(body, encoding)
+    return body_response(body, encoding, headers, status_code)
+
+
+def body_response(
+    body: bytes,
+    encoding: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    status_code: int = 200,
+) -> FastJSONResponse:
+    """
+    이미 encoding 으로 압축한(None 이면 압축하지 않은) JSON 본문 -> 응답.
+    캐시해 둔 압축 본문을 그대로 보낼 때 쓴다.
+    """
+    response_headers = dict(headers or {})
+    response_headers.pop("content-length", None)
+
+    if encoding is not None:
+        response_headers["Content-Encoding"] = encoding
+    if COMPRESSION_ENABLED:
+        response_headers["Vary"] = "Accept-Encoding"
+
+    return FastJSONResponse(content=body, status_code=status_code, headers=response_headers)
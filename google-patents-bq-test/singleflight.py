@@ -0,0 +1,47 @@
+# 파일명: singleflight.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    같은 key 로 동시에 들어온 비동기 호출을 하나로 합친다 (request coalescing).
+
+    - 처음 호출한 요청(leader)만 실제 작업(fn)을 실행한다
+    - 작업이 끝나기 전에 같은 key 로 들어온 요청은 그 결과를 함께 기다린다
+    - 작업은 별도 Task 로 돌기 때문에 leader 요청이 취소돼도 나머지 대기자는 결과를 받는다
+    - 작업이 끝나면 key 를 지우므로, 이후 요청은 다시 새 작업을 시작한다
+      (결과 재사용은 patent_cache 가 담당)
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.deduplicated = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.leaders += 1
+        else:
+            self.deduplicated += 1
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 대기자가 모두 취소돼 아무도 결과를 안 가져간 경우 경고가 남지 않도록 예외를 읽어 둔다
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight_keys": len(self._calls),
+            "leaders": self.leaders,
+            "deduplicated": self.deduplicated,
+        }
@@ -0,0 +1,8 @@
+# 파일명: tests/conftest.py
+# 테스트는 google-patents-bq-test 폴더에서 `python -m pytest -q` 로 실행한다.
+# 모듈들이 패키지가 아니라 루트에 있으므로 import 경로에 프로젝트 폴더를 넣는다.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,73 @@
+# 파일명: tests/test_app_errors.py
+# app/main.py 의 예외 -> HTTP 상태 코드 변환 (BigQuery 호출 없이 검색 함수를 바꿔 끼워서 확인)
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from bigquery_async import JobLimitExceeded
+from query_budget import BytesBudgetExceeded
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def _raising(error: Exception):
+    async def fake(*args, **kwargs):
+        raise error
+    return fake
+
+
+@pytest.mark.parametrize("error, status", [
+    (ValueError("잘못된 요청"), 400),
+    (BytesBudgetExceeded("스캔 한도 초과"), 403),
+    (JobLimitExceeded("잡 한도 초과"), 429),
+    (RuntimeError("BigQuery 오류"), 500),
+])
+def test_search_error_mapping(client, monkeypatch, error, status):
+    monkeypatch.setattr(main, "search_patents_async", _raising(error))
+
+    response = client.get("/patents/search", params={"keyword": "graphite"})
+
+    assert response.status_code == status
+    assert response.json()["detail"] == str(error)
+
+
+@pytest.mark.parametrize("error, status", [
+    (ValueError("잘못된 요청"), 400),
+    (BytesBudgetExceeded("스캔 한도 초과"), 403),
+    (JobLimitExceeded("잡 한도 초과"), 429),
+])
+def test_batch_error_mapping(client, monkeypatch, error, status):
+    monkeypatch.setattr(main, "search_patents_batch_async", _raising(error))
+
+    response = client.post("/patents/search/batch", json={"searches": [{"keyword": "graphite"}]})
+
+    assert response.status_code == status
+
+
+def test_search_without_keyword_is_400(client):
+    assert client.get("/patents/search").status_code == 400
+
+
+def test_bad_date_filter_is_400(client, monkeypatch):
+    # 필터 검증에서 걸리므로 검색 함수까지 가지 않는다
+    monkeypatch.setattr(main, "search_patents_async", _raising(AssertionError("호출되면 안 됨")))
+
+    response = client.get("/patents/search", params={"keyword": "graphite", "publication_date_from": "2020"})
+
+    assert response.status_code == 400
+    assert "publication_date_from" in response.json()["detail"]
+
+
+def test_batch_bad_date_filter_is_400(client, monkeypatch):
+    monkeypatch.setattr(main, "search_patents_batch_async", _raising(AssertionError("호출되면 안 됨")))
+
+    response = client.post(
+        "/patents/search/batch",
+        json={"searches": [{"keyword": "graphite", "filing_date_to": "bad"}]},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+# 파일명: tests/test_local_patent_store.py
+
+import pytest
+
+from local_patent_store import LocalPatentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = LocalPatentStore(str(tmp_path / "store.sqlite3"))
+    yield s
+    s.close()
+
+
+def test_empty_slice_covers_everything(store):
+    assert store.covers(None)
+    assert store.covers(["US"], {"publication_date_from": 20200101, "cpc_prefixes": ["H01M"]})
+
+
+def test_limit_truncated_slice_covers_nothing(store):
+    store.set_slice({"countries": ["US"], "limit": 100, "rows": 100})
+    assert not store.covers(["US"])
+
+    store.set_slice({"countries": ["US"], "limit": 100, "rows": 40})
+    assert store.covers(["US"])
+
+
+def test_non_authoritative_slice_covers_nothing(store):
+    store.set_slice({"source": "json", "authoritative": False})
+    assert not store.covers(None)
+
+
+def test_countries(store):
+    store.set_slice({"countries": ["US", "KR"]})
+
+    assert store.covers(["US"])
+    assert store.covers(["US", "KR"])
+    assert not store.covers(["JP"])
+    assert not store.covers(None)
+
+
+def test_publication_date_range(store):
+    store.set_slice({"publication_date_from": 20150101, "publication_date_to": 20201231})
+
+    assert store.covers(None, {"publication_date_from": 20160101, "publication_date_to": 20191231})
+    assert not store.covers(None, {"publication_date_from": 20140101, "publication_date_to": 20191231})
+    assert not store.covers(None, {"publication_date_from": 20160101})
+    assert not store.covers(None)
+
+
+def test_cpc_prefixes(store):
+    store.set_slice({"cpc_prefixes": ["H01M"]})
+
+    assert store.covers(None, {"cpc_prefixes": ["H01M4"]})
+    assert store.covers(None, {"cpc_prefixes": ["H01M", "H01M10"]})
+    assert not store.covers(None, {"cpc_prefixes": ["C01B"]})
+    assert not store.covers(None)
@@ -0,0 +1,35 @@
+# 파일명: tests/test_page_token.py
+
+import pytest
+
+from page_token import decode_page_token, encode_page_token
+
+STATE = {"job_id": "job_abc", "location": "US", "start_index": 20, "page_size": 20, "expand": False}
+
+
+def test_round_trip():
+    assert decode_page_token(encode_page_token(STATE)) == STATE
+
+
+def test_tampered_payload_is_rejected():
+    token = encode_page_token(STATE)
+    other = encode_page_token({**STATE, "job_id": "job_other"})
+    # 다른 상태의 payload 에 원래 서명을 붙인 토큰
+    forged = f"{other.split('.')[0]}.{token.split('.')[1]}"
+
+    with pytest.raises(ValueError, match="서명"):
+        decode_page_token(forged)
+
+
+def test_tampered_signature_is_rejected():
+    payload, signature = encode_page_token(STATE).split(".")
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+
+    with pytest.raises(ValueError):
+        decode_page_token(f"{payload}.{flipped}")
+
+
+@pytest.mark.parametrize("token", ["", "no-dot", "!!!.???"])
+def test_malformed_token_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_page_token(token)
@@ -0,0 +1,65 @@
+# 파일명: tests/test_patent_prompt.py
+
+from patent_prompt import _CONTEXT_HEADER, _fit_to_budget, estimate_tokens, render_context
+
+
+def _lines(n: int):
+    return [(f"- US-{i} (2021): graphite anode {i}", f"  요약: abstract {i} {'text ' * 10}") for i in range(n)]
+
+
+def _budget_tokens(lines) -> int:
+    """_fit_to_budget 이 예산과 비교하는 합계 (헤더 + 줄별 토큰 + 줄바꿈)"""
+    return estimate_tokens(_CONTEXT_HEADER) + sum(
+        estimate_tokens(t) + 1 + (estimate_tokens(a) + 1 if a else 0) for t, a in lines
+    )
+
+
+def test_no_budget_keeps_everything():
+    lines = _lines(3)
+    block = _fit_to_budget(lines, 0)
+
+    assert (block.included, block.with_abstract, block.dropped) == (3, 3, 0)
+    assert not block.truncated
+    assert all(a in block.text for _, a in lines)
+
+
+def test_abstracts_are_dropped_from_the_end_first():
+    lines = _lines(3)
+    # 마지막 특허 요약만 빼면 들어가는 예산
+    budget = _budget_tokens(lines) - estimate_tokens(lines[-1][1]) - 1
+    block = _fit_to_budget(lines, budget)
+
+    assert (block.included, block.with_abstract, block.dropped) == (3, 2, 0)
+    assert block.truncated
+    assert lines[1][1] in block.text
+    assert lines[2][1] not in block.text
+
+
+def test_patents_are_dropped_after_all_abstracts():
+    lines = _lines(5)
+    budget = _budget_tokens([(t, "") for t, _ in lines[:2]]) + 20
+    block = _fit_to_budget(lines, budget)
+
+    assert block.with_abstract == 0
+    assert 0 < block.included < 5
+    assert block.dropped == 5 - block.included
+    assert f"나머지 {block.dropped}건 생략" in block.text
+    assert lines[-1][0] not in block.text
+    assert block.tokens <= budget
+
+
+def test_tiny_budget_drops_every_patent():
+    block = _fit_to_budget(_lines(2), 1)
+
+    assert (block.included, block.with_abstract, block.dropped) == (0, 0, 2)
+
+
+def test_render_context_reuses_block_for_same_patent_set():
+    a = {"publication_number": "US-1", "publication_date": 20200101, "title": "A"}
+    b = {"publication_number": "KR-2", "publication_date": 20210101, "title": "B"}
+
+    block = render_context([a, b], 0)
+    assert render_context([b, a], 0) is block
+    # 최신 공개일 우선
+    assert block.text.index("KR-2") < block.text.index("US-1")
+    assert render_context([a, b], 0, langs="en,ko") is not block
@@ -0,0 +1,65 @@
+# 파일명: tests/test_patent_record.py
+
+import gzip
+import json
+
+from patent_record import PatentRecordList
+from response_encoding import COMPRESS_MIN_BYTES
+
+
+def _patent(i: int) -> dict:
+    return {
+        "publication_number": f"US-{i}-A1",
+        "application_number": f"US-{i}",
+        "country_code": "US",
+        "title_localized": [{"text": f"graphite anode {i}", "language": "en", "truncated": "false"}],
+        "abstract_localized": [{"text": "abstract " * 20, "language": "en"}],
+        "publication_date": "2021-01-01",
+        "filing_date": None,
+        "assignee": [{"name": "ACME", "country_code": "US"}],
+        "inventor": [],
+        "cpc": ["H01M4/587"],
+    }
+
+
+def test_round_trip_equals_original_dicts():
+    items = [_patent(i) for i in range(3)]
+    records = PatentRecordList.from_dicts(items)
+
+    assert len(records) == 3
+    assert records.to_dicts() == items
+    assert list(records) == items
+    assert records[1] == items[1]
+    assert records[:2] == items[:2]
+    assert records == items
+    assert records == PatentRecordList.from_dicts(items)
+
+
+def test_round_trip_keeps_requested_fields_only():
+    items = [{"publication_number": "KR-1", "title_by_lang": {"ko": "흑연", "en": "graphite"}}]
+    records = PatentRecordList.from_dicts(items)
+
+    assert records.fields == ("publication_number", "title_by_lang")
+    assert records.to_dicts() == items
+
+
+def test_json_and_encoded_body_match_dicts():
+    items = [_patent(i) for i in range(50)]
+    records = PatentRecordList.from_dicts(items)
+
+    assert json.loads(records.to_json()) == items
+
+    body, encoding = records.encode("gzip")
+    assert encoding == "gzip"
+    assert json.loads(gzip.decompress(body)) == items
+    # 같은 객체의 압축 본문은 body_cache 에서 재사용
+    assert records.encode("gzip")[0] is body
+
+
+def test_small_body_is_not_compressed():
+    records = PatentRecordList.from_dicts([{"publication_number": "US-1"}])
+    body, encoding = records.encode("gzip")
+
+    assert len(body) < COMPRESS_MIN_BYTES
+    assert encoding is None
+    assert json.loads(body) == [{"publication_number": "US-1"}]